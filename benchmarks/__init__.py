@@ -0,0 +1,2 @@
+# whoami::./benchmarks/__init__.py
+"""YapLogger benchmark suite: cost of the logging hot path, stored as JSON baselines and compared against them."""
@@ -0,0 +1,62 @@
+# whoami::./benchmarks/__main__.py
+"""Run the benchmark suite, compare it with a baseline and fail on regressions.
+
+Usage::
+
+    python -m benchmarks                                # run and compare with benchmarks/baseline.json
+    python -m benchmarks --save                         # run and store the results as the new baseline
+    python -m benchmarks --cases call. sink.ndjson      # run the cases whose name starts with a prefix
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks import baseline
+from benchmarks.suite import run_suite
+
+DEFAULT_BASELINE: Path = Path(__file__).with_name("baseline.json")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline instead.")
+    parser.add_argument("--output", type=Path, help="Also write the results to this JSON file.")
+    parser.add_argument("--calls", type=int, default=20_000, help="Calls per timed run.")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Accepted relative degradation.")
+    parser.add_argument("--cases", nargs="*", default=[], help="Prefixes of the case names to run.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite; returns 1 when a metric regressed beyond the tolerance, 0 otherwise."""
+    arguments = build_parser().parse_args(argv)
+    prefixes = tuple(arguments.cases)
+    results = run_suite(arguments.calls, lambda name: not prefixes or name.startswith(prefixes))
+
+    if arguments.output is not None:
+        baseline.save(arguments.output, results)
+    if arguments.save:
+        baseline.save(arguments.baseline, results)
+        sys.stdout.write(baseline.report(results))
+        return 0
+
+    reference = baseline.load(arguments.baseline) if arguments.baseline.exists() else None
+    sys.stdout.write(baseline.report(results, reference))
+    if reference is None:
+        sys.stdout.write(f"No baseline at {arguments.baseline}, run with --save to create it.\n")
+        return 0
+
+    regressions = baseline.compare(results, reference, arguments.tolerance)
+    for regression in regressions:
+        sys.stdout.write(
+            f"REGRESSION {regression.case} {regression.metric}: {regression.baseline:,.3f} -> "
+            f"{regression.current:,.3f} ({regression.change:+.1%} worse)\n",
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+# whoami::./benchmarks/baseline.py
+"""JSON baselines of the benchmark results and their comparison with a new run."""
+
+import json
+import platform
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+type Results = dict[str, dict[str, float]]
+
+
+class Regression(NamedTuple):
+    """A metric that got worse than its baseline by more than the tolerance."""
+
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # Relative change, positive when worse
+
+
+CALIBRATION: str = "calibration"
+
+
+def higher_is_better(metric: str) -> bool:
+    """Whether a metric improves when it grows: throughputs do, latencies and sizes do not."""
+    return metric.endswith("_per_second")
+
+
+def is_timing(metric: str) -> bool:
+    """Whether a metric depends on the machine speed: throughputs and microsecond latencies do, sizes do not."""
+    return higher_is_better(metric) or "us" in metric.split("_")
+
+
+def _speed_ratio(results: Results, baseline: Results) -> float:
+    """How much slower the machine of the results is than the baseline's, from their calibration cases."""
+    current = results.get(CALIBRATION, {}).get("us_per_call")
+    reference = baseline.get(CALIBRATION, {}).get("us_per_call")
+    return current / reference if current and reference else 1.0
+
+
+def save(path: str | Path, results: Results) -> None:
+    """Write results as a baseline, along with the interpreter and machine they were measured on."""
+    document: dict[str, Any] = {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: str | Path) -> Results:
+    """Read the results of a baseline."""
+    return json.loads(Path(path).read_text())["results"]
+
+
+def compare(results: Results, baseline: Results, tolerance: float = 0.3) -> list[Regression]:
+    """The metrics of the results that got worse than in the baseline by more than the tolerance.
+
+    Timings of the baseline are first scaled by the ratio of the two calibration cases, so that a run on a slower
+    or busier machine is not reported as a regression of the whole suite.
+
+    Args:
+        results (Results): The new results.
+        baseline (Results): The baseline results. Cases and metrics missing from either side are ignored.
+        tolerance (float): Accepted relative degradation, e.g. 0.25 for 25%.
+
+    Returns:
+        list[Regression]: The regressions, worst first.
+    """
+    ratio = _speed_ratio(results, baseline)
+    regressions: list[Regression] = []
+    for case, metrics in results.items():
+        if case == CALIBRATION:
+            continue
+        for metric, current in metrics.items():
+            reference = baseline.get(case, {}).get(metric)
+            if not reference:
+                continue
+            if is_timing(metric):
+                reference = reference / ratio if higher_is_better(metric) else reference * ratio
+            change = (reference - current if higher_is_better(metric) else current - reference) / reference
+            if change > tolerance:
+                regressions.append(Regression(case, metric, reference, current, change))
+    return sorted(regressions, key=lambda regression: regression.change, reverse=True)
+
+
+def report(results: Results, baseline: Results | None = None) -> str:
+    """Table of the results, with their change relative to the baseline when given."""
+    lines = [f"{'case':<28} {'metric':<22} {'value':>14} {'baseline':>14} {'change':>8}"]
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = (baseline or {}).get(case, {}).get(metric)
+            change = ""
+            if reference:
+                relative = (value - reference) / reference
+                change = f"{relative:+.1%}"
+            reference_text = f"{reference:>14,.3f}" if reference is not None else f"{'':>14}"
+            lines.append(f"{case:<28} {metric:<22} {value:>14,.3f} {reference_text} {change:>8}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,87 @@
+# whoami::./benchmarks/network_sink.py
+"""Throughput and tail latency of the network sink against a local stand-in collector.
+
+Run with ``python -m benchmarks.network_sink``. The logging call latency is measured on the calling thread, and
+the throughput from the first call until the collector has received every record, or until the timeout, in which
+case the records the collector never received are reported as dropped.
+"""
+
+import json
+import socketserver
+import statistics
+import sys
+import threading
+import time
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.utils import NetworkProtocol, SeverityLevel
+
+
+class _CountingHandler(socketserver.BaseRequestHandler):
+    """Counts the newline-terminated records received on a connection."""
+
+    def handle(self) -> None:
+        """Read the connection until it is closed."""
+        server: Any = self.server
+        while chunk := self.request.recv(1 << 16):
+            with server.lock:
+                server.received += chunk.count(b"\n")
+
+
+def run(
+    records: int = 50_000,
+    connections: int = 1,
+    protocol: NetworkProtocol = NetworkProtocol.JSON_LINES,
+    timeout: float = 30.0,
+) -> dict:
+    """Ship records to a local TCP collector and return the throughput, dropped records and latency percentiles."""
+    server: Any = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _CountingHandler)
+    server.daemon_threads = True
+    server.received = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    log = Log(parameters=None)
+    log.configure_sink(SeverityLevel.CRITICAL)
+    # Syslog over TCP is octet-counted, so a trailing newline in the message keeps the collector's count exact.
+    suffix = "\n" if protocol is NetworkProtocol.SYSLOG else ""
+    handler_id = log.add_network_sink(
+        f"tcp://127.0.0.1:{server.server_address[1]}",
+        protocol=protocol,
+        connections=connections,
+        capacity=records,
+    )
+
+    latencies: list[int] = []
+    start = time.perf_counter()
+    for number in range(records):
+        before = time.perf_counter_ns()
+        log.info(f"Benchmark record{suffix}", extra_value=number)
+        latencies.append(time.perf_counter_ns() - before)
+    log.remove_sink(handler_id)
+    deadline = time.perf_counter() + timeout
+    while server.received < records and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    with server.lock:
+        received = min(server.received, records)
+
+    server.shutdown()
+    server.server_close()
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "records": records,
+        "connections": connections,
+        "protocol": str(protocol),
+        "records_per_second": round(received / elapsed),
+        "dropped": records - received,
+        "call_p50_us": round(percentiles[49] / 1000, 2),
+        "call_p99_us": round(percentiles[98] / 1000, 2),
+    }
+
+
+if __name__ == "__main__":
+    results = [run(connections=count) for count in (1, 4)] + [run(protocol=NetworkProtocol.SYSLOG)]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
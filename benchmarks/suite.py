@@ -0,0 +1,349 @@
+# whoami::./benchmarks/suite.py
+"""Benchmark cases of the logging hot path.
+
+Every case returns a mapping of metric names to values. Metrics ending with ``_per_second`` are better when higher,
+every other metric is better when lower. Timings are the best of several repeats, so that they measure the code
+rather than the machine's noise, and include the loop calling the logging method. The ``calibration`` case times a
+fixed pure-Python workload, so that results measured on machines of different speeds can be compared.
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.config import Config
+from yaplogger.sinks import BackgroundSink, SinkRoute
+from yaplogger.utils import ExceptionRenderMode, FormatterEngine, SeverityLevel
+
+from benchmarks import network_sink
+
+type Case = Callable[[int], dict[str, float]]
+
+REPEATS: int = 5
+THREAD_COUNTS: tuple[int, ...] = (1, 4, 16, 32)
+
+
+class _NullSink:
+    """Sink discarding every record, so that a case measures YapLogger and loguru only."""
+
+    def write(self, message: str) -> None:
+        """Discard the message."""
+
+
+def _best_us_per_call(call: Callable[[], Any], calls: int) -> float:
+    """Best time, over ``REPEATS`` runs of ``calls`` calls, of one call in microseconds."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            call()
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best / 1000
+
+
+def _timing(call: Callable[[], Any], calls: int) -> dict[str, float]:
+    """Latency and throughput metrics of a call."""
+    us_per_call = _best_us_per_call(call, calls)
+    return {"us_per_call": round(us_per_call, 3), "calls_per_second": round(1_000_000 / us_per_call)}
+
+
+@contextlib.contextmanager
+def _sinks(log: Log, setup: Callable[[], Any]) -> Iterator[None]:
+    """Run the block with only the sinks created by ``setup`` attached to the process logger."""
+    log.shutdown()
+    setup()
+    try:
+        yield
+    finally:
+        log.shutdown()
+
+
+def _null_sink(log: Log, level: SeverityLevel = SeverityLevel.TRACE) -> Callable[[], Any]:
+    """Setup attaching a discarding sink at the given level."""
+    return lambda: log.add_sink(_NullSink(), level)
+
+
+def level_cases(log: Log) -> dict[str, Case]:
+    """One enabled call per severity level, written to a discarding sink."""
+
+    def case(method: Callable[..., None]) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            with _sinks(log, _null_sink(log)):
+                return _timing(lambda: method("Benchmark record"), calls)
+
+        return run
+
+    return {f"level.{level.name.lower()}": case(getattr(log, level.name.lower())) for level in SeverityLevel}
+
+
+def call_cases(log: Log) -> dict[str, Case]:
+    """Enabled and filtered calls, with and without extra value and exception, to a discarding INFO sink."""
+    error = ValueError("Benchmark failure")
+
+    def case(call: Callable[[], None], setup: Callable[[], Any] | None = None) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            with _sinks(log, _null_sink(log, SeverityLevel.INFO)):
+                if setup is not None:
+                    setup()
+                try:
+                    return _timing(call, calls)
+                finally:
+                    log.configure_exceptions(ExceptionRenderMode.MESSAGE)
+
+        return run
+
+    return {
+        "call.enabled": case(lambda: log.info("Benchmark record")),
+        "call.filtered": case(lambda: log.debug("Benchmark record")),
+        "call.filtered_deferred": case(lambda: log.debug(lambda: "Benchmark record")),
+        "call.extra_value": case(lambda: log.info("Benchmark record", extra_value="benchmark value")),
+        "call.exception": case(lambda: log.critical("Benchmark failure", extra_value=error)),
+        "call.exception_compact": case(
+            lambda: log.critical("Benchmark failure", extra_value=error),
+            lambda: log.configure_exceptions(ExceptionRenderMode.COMPACT),
+        ),
+    }
+
+
+def sink_cases(log: Log, directory: Path) -> dict[str, Case]:
+    """An INFO call written to each of the available sinks, stdout being redirected to the null device."""
+
+    def case(setup: Callable[[], Any]) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            with _sinks(log, setup):
+                return _timing(lambda: log.info("Benchmark record", extra_value="benchmark value"), calls)
+
+        return run
+
+    def network(calls: int) -> dict[str, float]:
+        with _sinks(log, lambda: None):
+            result = network_sink.run(records=calls)
+        return {key: value for key, value in result.items() if key.startswith(("call_", "records_per"))}
+
+    return {
+        "sink.null": case(_null_sink(log, SeverityLevel.INFO)),
+        "sink.stdout": case(log.configure_sink),
+        "sink.stdout_compiled": case(lambda: log.configure_sink(formatter=FormatterEngine.COMPILED)),
+        "sink.stdout_background": case(lambda: log.configure_sink(background=True)),
+        "sink.routes": case(
+            lambda: log.configure_routes(
+                [
+                    SinkRoute(sys.stdout, SeverityLevel.INFO, fmt="{extra[display_level]} {message}"),
+                    SinkRoute(_NullSink(), SeverityLevel.ERROR),
+                ],
+            ),
+        ),
+        "sink.ndjson": case(lambda: log.add_ndjson_sink(directory / "benchmark.ndjson")),
+        "sink.binary": case(lambda: log.add_binary_sink(directory / "benchmark.yapb")),
+        "sink.network": network,
+    }
+
+
+def thread_cases(log: Log) -> dict[str, Case]:
+    """Aggregate throughput of enabled calls made concurrently by several threads.
+
+    Records go to a discarding sink, to stdout through loguru, and to stdout through per-thread buffers. The thread
+    buffered mode is faster because it skips loguru, not because it scales with threads: the throughput of every
+    mode stays flat as threads are added, the calls holding the GIL, and the baseline was recorded on a single CPU.
+    """
+
+    def case(thread_count: int, setup: Callable[[], Any]) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            per_thread = max(1, calls // thread_count)
+            best = 0.0
+            with _sinks(log, setup):
+                for _ in range(REPEATS):
+                    barrier = threading.Barrier(thread_count + 1)
+
+                    def work(barrier: threading.Barrier = barrier) -> None:
+                        barrier.wait()
+                        for _ in range(per_thread):
+                            log.info("Benchmark record")
+
+                    threads = [threading.Thread(target=work) for _ in range(thread_count)]
+                    for thread in threads:
+                        thread.start()
+                    barrier.wait()
+                    start = time.perf_counter()
+                    for thread in threads:
+                        thread.join()
+                    best = max(best, per_thread * thread_count / (time.perf_counter() - start))
+            return {"calls_per_second": round(best)}
+
+        return run
+
+    setups: dict[str, Callable[[], Any]] = {
+        "null": _null_sink(log, SeverityLevel.INFO),
+        "stdout": log.configure_sink,
+        "buffered": lambda: log.configure_sink(thread_buffered=True),
+    }
+    return {
+        f"threads.{name}.{count}": case(count, setup) for name, setup in setups.items() for count in THREAD_COUNTS
+    }
+
+
+def memory_cases(log: Log) -> dict[str, Case]:
+    """Memory of a logging call, and of the records kept by the flight recorder and the background queue."""
+
+    def peak_per_call(calls: int) -> dict[str, float]:
+        with _sinks(log, _null_sink(log, SeverityLevel.INFO)):
+            log.info("Warm up")
+            tracemalloc.start()
+            total = 0
+            for _ in range(min(calls, 1000)):
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                log.info("Benchmark record", extra_value="benchmark value")
+                total += tracemalloc.get_traced_memory()[1] - current
+            tracemalloc.stop()
+        return {"peak_bytes_per_call": round(total / min(calls, 1000))}
+
+    def retained(setup: Callable[[], Any], teardown: Callable[[], Any] = lambda: None) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            with _sinks(log, _null_sink(log, SeverityLevel.ERROR)):
+                tracemalloc.start()
+                setup()
+                before = tracemalloc.get_traced_memory()[0]
+                for number in range(calls):
+                    log.info("Benchmark record", extra_value=number)
+                kept = tracemalloc.get_traced_memory()[0] - before
+                tracemalloc.stop()
+                teardown()
+            return {"bytes_per_record": round(kept / calls)}
+
+        return run
+
+    return {
+        "memory.call": peak_per_call,
+        "memory.recorder": retained(
+            lambda: log.configure_recorder(1 << 20, level=SeverityLevel.INFO),
+            lambda: log.configure_recorder(0),
+        ),
+        # The writer thread does not wake up before the case is over, so every record stays queued.
+        "memory.background_queue": retained(
+            lambda: log.add_sink(
+                BackgroundSink(io.StringIO(), capacity=1 << 20, batch_size=1 << 20, flush_interval=3600),
+                SeverityLevel.INFO,
+            ),
+        ),
+    }
+
+
+def calibration(calls: int) -> dict[str, float]:
+    """Time of a fixed workload of string formatting and dict lookups, independent of YapLogger."""
+    fields = {"process_uid": "calibration", "extra_value": 42}
+
+    def workload() -> str:
+        return "|".join(f"{key}={fields.get(key)!s:<12}" for key in ("process_uid", "extra_value", "missing"))
+
+    return {"us_per_call": round(_best_us_per_call(workload, calls), 3)}
+
+
+def construction_cases() -> dict[str, Case]:
+    """Cost of building the process configuration and a logger."""
+    factory: Callable[..., Log] = Log.__wrapped__  # pyright: ignore[reportFunctionMemberAccess]
+
+    def config(calls: int) -> dict[str, float]:
+        return {"us_per_call": round(_best_us_per_call(lambda: Config().configure(parameters=None), calls), 3)}
+
+    def logger(*, lazy: bool) -> Case:
+        def run(calls: int) -> dict[str, float]:
+            def build() -> None:
+                factory(parameters=None, announce=False, lazy=lazy).shutdown()
+
+            return {"us_per_call": round(_best_us_per_call(build, max(1, calls // 100)), 3)}
+
+        return run
+
+    return {
+        "construction.config": config,
+        "construction.log": logger(lazy=False),
+        "construction.log_lazy": logger(lazy=True),
+    }
+
+
+_STARTUP_SCRIPT: str = """
+import sys, time
+start = time.perf_counter_ns()
+import yaplogger
+imported = time.perf_counter_ns()
+log = yaplogger.Log(parameters=None, announce=False, lazy={lazy})
+built = time.perf_counter_ns()
+log.info("Benchmark record")
+logged = time.perf_counter_ns()
+print(imported - start, built - imported, logged - built, file=sys.stderr)
+"""
+
+
+def startup_cases() -> dict[str, Case]:
+    """Time to import YapLogger, build the process logger and emit its first record, in a fresh interpreter."""
+
+    def case(*, lazy: bool) -> Case:
+        def run(_: int) -> dict[str, float]:
+            best = [float("inf")] * 3
+            for _ in range(REPEATS):
+                completed = subprocess.run(  # noqa: S603
+                    [sys.executable, "-c", _STARTUP_SCRIPT.format(lazy=lazy)],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                )
+                timings = [int(value) for value in completed.stderr.split()[-3:]]
+                best = [min(current, timing) for current, timing in zip(best, timings, strict=True)]
+            return {
+                "import_us": round(best[0] / 1000, 1),
+                "construction_us": round(best[1] / 1000, 1),
+                "first_record_us": round(best[2] / 1000, 1),
+            }
+
+        return run
+
+    return {"startup.eager": case(lazy=False), "startup.lazy": case(lazy=True)}
+
+
+@contextlib.contextmanager
+def _quiet_stdout() -> Iterator[None]:
+    """Send everything written to stdout, by loguru included, to the null device."""
+    original = sys.stdout
+    with Path(os.devnull).open("w") as devnull:
+        sys.stdout = devnull
+        try:
+            yield
+        finally:
+            sys.stdout = original
+
+
+def run_suite(calls: int = 20_000, selected: Callable[[str], bool] = lambda _: True) -> dict[str, dict[str, float]]:
+    """Run the cases whose name is selected, returning their metrics by case name."""
+    results: dict[str, dict[str, float]] = {}
+    with _quiet_stdout(), tempfile.TemporaryDirectory() as directory:
+        log = Log(parameters=None, announce=False)
+        cases: dict[str, Case] = {
+            "calibration": calibration,
+            **level_cases(log),
+            **call_cases(log),
+            **sink_cases(log, Path(directory)),
+            **thread_cases(log),
+            **memory_cases(log),
+            **construction_cases(),
+            **startup_cases(),
+        }
+        try:
+            for name, case in cases.items():
+                if selected(name):
+                    results[name] = case(calls)
+        finally:
+            log.finish()
+            log.shutdown()
+    log.configure_sink()
+    return results
@@ -37,6 +37,7 @@ def main() -> None:
         classifiers=project["classifiers"],
         python_requires=project["requires-python"],
         install_requires=project["dependencies"],
+        entry_points={"console_scripts": [f"{name} = {target}" for name, target in project["scripts"].items()]},
         zip_safe=False,  # Required for type hints to work properly
     )
 
@@ -0,0 +1,26 @@
+#whoami::./tests/conftest.py
+"""Shared fixtures for the YapLogger tests."""
+
+import copy
+from collections.abc import Iterator
+
+import pytest
+
+from yaplogger import Log
+from yaplogger.config import Config
+
+
+@pytest.fixture(autouse=True)
+def restore_configuration() -> Iterator[None]:
+    """Restore the class-level configuration after each test, so tests do not leak state into each other."""
+    snapshot = copy.deepcopy(Config._configuration)
+    yield
+    Config._configuration.clear()
+    Config._configuration.update(snapshot)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def shutdown_log() -> Iterator[None]:
+    """Detach the process logger sinks before pytest closes the captured stdout they write to."""
+    yield
+    Log(parameters=None).shutdown()
@@ -0,0 +1,56 @@
+#whoami::./tests/test_aio.py
+"""Tests for the asyncio logging methods and the contextvar-scoped execution context."""
+import asyncio
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.registry import current_execution
+from yaplogger.utils import SeverityLevel
+
+
+def test_concurrent_tasks_are_attributed_to_their_execution() -> None:
+    """Test that records of concurrent tasks carry the process UID of the execution each task entered."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record), SeverityLevel.INFO)
+
+    async def run(process_uid: str) -> None:
+        with log.use_execution({"process_uid": process_uid}) as execution:
+            assert current_execution() is execution
+            for i in range(5):
+                await log.ainfo("Item {}", args=(i,))
+                await asyncio.sleep(0)
+            await asyncio.gather(log.awarning("Child task"))
+        assert current_execution() is None
+
+    async def main() -> None:
+        await asyncio.gather(*(run(f"task-{n}") for n in range(3)))
+
+    asyncio.run(main())
+    log.info("Outside of any execution")
+    log.remove_sink(handler_id)
+
+    for n in range(3):
+        attributed = [r["message"] for r in records if r["extra"]["process_uid"] == f"task-{n}"]
+        assert attributed == [f"Item {i}" for i in range(5)] + ["Child task"]
+    assert all(r["thread"].name.startswith("yaplogger-async") for r in records[:-1])
+    assert records[-1]["extra"]["process_uid"] != "task-0"
+
+
+def test_async_methods_keep_the_level_gate_and_critical_fields() -> None:
+    """Test that disabled async calls are discarded and critical keeps its exception field."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record), SeverityLevel.INFO)
+
+    async def main() -> None:
+        await log.adebug("Disabled")
+        await log.acritical("Failure", extra_value=ValueError("boom"))
+        await log.alog(SeverityLevel.SUCCESS, "Done", extra_value="step")
+
+    asyncio.run(main())
+    log.remove_sink(handler_id)
+
+    assert [(r["level"].name, r["message"]) for r in records] == [("CRITICAL", "Failure"), ("SUCCESS", "Done")]
+    assert str(records[0]["extra"]["exception_message"]) == "boom"
+    assert records[1]["extra"]["extra_value"] == "step"
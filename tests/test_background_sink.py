@@ -0,0 +1,112 @@
+#whoami::./tests/test_background_sink.py
+"""Tests for the BackgroundSink class."""
+import io
+import threading
+
+from yaplogger import Log
+from yaplogger.sinks import BackgroundSink
+from yaplogger.utils import OverflowPolicy, SeverityLevel
+
+
+class GatedStream(io.StringIO):
+    """StringIO whose writes wait until the test opens the gate."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+
+    def write(self, s: str) -> int:
+        self.entered.set()
+        self.gate.wait()
+        return super().write(s)
+
+
+class LeveledMessage(str):
+    """Stand-in for loguru's Message, which carries its record."""
+
+    __slots__ = ("record",)
+
+    def __new__(cls, text: str, level_no: int) -> "LeveledMessage":
+        message = super().__new__(cls, text)
+        message.record = {"level": type("Level", (), {"no": level_no})()}
+        return message
+
+
+def _fill_while_writer_blocked(sink: BackgroundSink, stream: GatedStream, messages: list[str]) -> None:
+    """Queue a first record that keeps the writer thread busy, then queue the given messages."""
+    sink.write("first\n")
+    stream.entered.wait(timeout=5)
+    for message in messages:
+        sink.write(message)
+
+
+def test_records_are_written_in_order_and_drained_on_stop() -> None:
+    """Test that stop writes every queued record in emission order."""
+    stream = io.StringIO()
+    sink = BackgroundSink(stream, batch_size=3, flush_interval=10)
+    for i in range(10):
+        sink.write(f"{i}\n")
+    sink.stop()
+    assert stream.getvalue() == "".join(f"{i}\n" for i in range(10))
+
+
+def test_drain_waits_for_pending_records() -> None:
+    """Test that drain returns once the queue has been written."""
+    stream = io.StringIO()
+    sink = BackgroundSink(stream, flush_interval=10)
+    sink.write("a\n")
+    assert sink.drain(timeout=5)
+    assert stream.getvalue() == "a\n"
+    sink.stop()
+
+
+def test_drop_oldest_policy() -> None:
+    """Test that the oldest queued records are discarded when the queue overflows."""
+    stream = GatedStream()
+    sink = BackgroundSink(stream, capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    _fill_while_writer_blocked(sink, stream, ["a\n", "b\n", "c\n", "d\n"])
+    assert sink.dropped == 2
+    stream.gate.set()
+    sink.stop()
+    assert stream.getvalue() == "first\nc\nd\n"
+
+
+def test_drop_debug_first_policy() -> None:
+    """Test that queued DEBUG records are discarded before INFO records, preserving order."""
+    stream = GatedStream()
+    sink = BackgroundSink(stream, capacity=3, overflow_policy=OverflowPolicy.DROP_DEBUG_FIRST)
+    messages = [
+        LeveledMessage("info-1\n", 20),
+        LeveledMessage("debug-1\n", 10),
+        LeveledMessage("info-2\n", 20),
+        LeveledMessage("info-3\n", 20),
+        LeveledMessage("debug-2\n", 10),
+    ]
+    _fill_while_writer_blocked(sink, stream, messages)
+    stream.gate.set()
+    sink.stop()
+    assert stream.getvalue() == "first\ninfo-1\ninfo-2\ninfo-3\n"
+    assert sink.dropped == 2
+
+
+def test_sample_policy_keeps_one_out_of_n() -> None:
+    """Test that the sample policy admits one out of every N overflowing records."""
+    stream = GatedStream()
+    sink = BackgroundSink(stream, capacity=1, overflow_policy=OverflowPolicy.SAMPLE, sample_every=3)
+    _fill_while_writer_blocked(sink, stream, ["a\n", "b\n", "c\n", "d\n"])
+    stream.gate.set()
+    sink.stop()
+    assert stream.getvalue() == "first\nd\n"
+    assert sink.dropped == 3
+
+
+def test_log_background_sink_can_be_reconfigured() -> None:
+    """Test that configure_sink can be called again and shutdown disables logging."""
+    log = Log(parameters=None)
+    log.configure_sink(background=True, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    log.info("Written by the writer thread.")
+    log.shutdown()
+    assert not log.is_enabled(SeverityLevel.CRITICAL)
+    log.configure_sink()
+    assert log.is_enabled(SeverityLevel.INFO)
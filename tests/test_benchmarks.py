@@ -0,0 +1,50 @@
+#whoami::./tests/test_benchmarks.py
+"""Tests for the comparison of benchmark results with their baseline."""
+from pathlib import Path
+
+from benchmarks import baseline
+
+
+def test_regressions_are_reported_beyond_the_tolerance() -> None:
+    """Test that slower latencies, lower throughputs and larger sizes are reported, worst first."""
+    reference = {
+        "call.enabled": {"us_per_call": 10.0, "calls_per_second": 100_000},
+        "memory.call": {"peak_bytes_per_call": 1000},
+        "removed": {"us_per_call": 1.0},
+    }
+    results = {
+        "call.enabled": {"us_per_call": 15.0, "calls_per_second": 90_000},
+        "memory.call": {"peak_bytes_per_call": 2000},
+        "added": {"us_per_call": 1.0},
+    }
+
+    regressions = baseline.compare(results, reference, tolerance=0.2)
+
+    assert [(regression.case, regression.metric) for regression in regressions] == [
+        ("memory.call", "peak_bytes_per_call"),
+        ("call.enabled", "us_per_call"),
+    ]
+    assert regressions[1].change == 0.5  # noqa: PLR2004
+
+
+def test_timings_are_scaled_by_the_calibration(tmp_path: Path) -> None:
+    """Test that a uniformly slower machine is not reported as a regression, while sizes are not scaled."""
+    path = tmp_path / "baseline.json"
+    baseline.save(
+        path,
+        {
+            baseline.CALIBRATION: {"us_per_call": 1.0},
+            "call.enabled": {"us_per_call": 10.0, "calls_per_second": 100_000},
+            "memory.call": {"peak_bytes_per_call": 1000},
+        },
+    )
+    results = {
+        baseline.CALIBRATION: {"us_per_call": 2.0},
+        "call.enabled": {"us_per_call": 20.0, "calls_per_second": 50_000},
+        "memory.call": {"peak_bytes_per_call": 2000},
+    }
+
+    regressions = baseline.compare(results, baseline.load(path))
+
+    assert [regression.case for regression in regressions] == ["memory.call"]
+    assert "+100.0%" in baseline.report(results, baseline.load(path))
@@ -0,0 +1,136 @@
+#whoami::./tests/test_binary_sink.py
+"""Tests for the binary sink, its reader and the decoder command line."""
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from yaplogger import Log
+from yaplogger.cli import main
+from yaplogger.constants import Constants
+from yaplogger.sinks import BinaryLogReader
+from yaplogger.utils import SeverityLevel
+
+
+def _write_log(path: Path) -> None:
+    """Write a few records through the process logger to a binary file."""
+    log = Log(parameters=None)
+    handler_id = log.add_binary_sink(path, SeverityLevel.TRACE, intern_limit=8)
+    log.trace("Polling", extra_value="queue-1")
+    log.trace("Polling", extra_value="queue-1")
+    log.info("Loaded", extra_value="a value longer than the intern limit")
+    log.critical("Failure", extra_value=ValueError("boom"))
+    log.remove_sink(handler_id)
+
+
+def test_records_round_trip(tmp_path: Path) -> None:
+    """Test that records are decoded back with their level, process and fields, strings being interned."""
+    path = tmp_path / "trace.yapb"
+    _write_log(path)
+    _write_log(path)
+
+    with BinaryLogReader(path) as reader:
+        records = list(reader)
+
+    assert len(records) == 8  # noqa: PLR2004
+    first, second, loaded, failure = records[4:]
+    assert (first.level, first.message, first.fields["extra_value"]) == (SeverityLevel.TRACE, "Polling", "queue-1")
+    assert first.process_uid
+    assert failure.process_uid == first.process_uid
+    assert second.time_us >= first.time_us
+    assert loaded.fields["extra_value"] == "a value longer than the intern limit"
+    assert failure.fields["exception_message"] == "boom"
+    assert "generated_timestamp" not in failure.fields
+    assert path.read_bytes().count(b"Polling") == 2  # noqa: PLR2004
+
+
+def test_decoder_command_line(tmp_path: Path) -> None:
+    """Test that the decoder writes text lines in the default format and NDJSON documents."""
+    path = tmp_path / "trace.yapb"
+    _write_log(path)
+
+    text = io.StringIO()
+    assert main(["decode", str(path), "--min-level", "INFO"], text) == 0
+    lines = text.getvalue().splitlines()
+    assert len(lines) == 2  # noqa: PLR2004
+    assert lines[0].endswith("| info     | Loaded a value longer than the intern limit ")
+    assert lines[1].endswith("| critical | Failure  boom")
+
+    ndjson = io.StringIO()
+    main(["decode", str(path), "--format", "ndjson"], ndjson)
+    documents = [json.loads(line) for line in ndjson.getvalue().splitlines()]
+    assert [document["level"] for document in documents] == ["TRACE", "TRACE", "INFO", "CRITICAL"]
+    assert documents[0]["extra_value"] == "queue-1"
+
+    completed = subprocess.run(
+        [sys.executable, "-m", "yaplogger", "decode", str(path), "--format", "ndjson"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert completed.stdout == ndjson.getvalue()
+
+
+def test_long_messages_are_not_interned(tmp_path: Path) -> None:
+    """Test that messages longer than the intern limit are written inline, leaving the table to short strings."""
+    path = tmp_path / "trace.yapb"
+    log = Log(parameters=None)
+    handler_id = log.add_binary_sink(path, intern_limit=16, max_strings=8)
+    for number in range(20):
+        log.info("A unique message longer than the limit, number {}", args=(number,))
+    log.info("Short", extra_value="short")
+    log.info("Short", extra_value="short")
+    log.remove_sink(handler_id)
+
+    with BinaryLogReader(path) as reader:
+        assert [record.message for record in reader][-3] == "A unique message longer than the limit, number 19"
+    assert path.read_bytes().count(b"short") == 1
+
+
+def test_process_extras_are_written_once(tmp_path: Path) -> None:
+    """Test that the process extras are stored once in the file and decoded back as an object."""
+    path = tmp_path / "trace.yapb"
+    log = Log(parameters=None)
+    handler_id = log.add_binary_sink(path, intern_limit=8)
+    execution = log.execution({"Batch": 7, "Source": "a source name longer than the intern limit"})
+    execution.info("First")
+    execution.info("Second")
+    log.remove_sink(handler_id)
+
+    assert path.read_bytes().count(b"a source name longer than the intern limit") == 1
+    ndjson = io.StringIO()
+    main(["decode", str(path), "--format", "ndjson"], ndjson)
+    documents = [json.loads(line) for line in ndjson.getvalue().splitlines()]
+    assert [document[Constants.PROCESS_EXTRAS_KEY] for document in documents] == [
+        {"batch": 7, "source": "a source name longer than the intern limit"},
+    ] * 2
+
+
+def test_forked_child_writes_its_own_segment(tmp_path: Path) -> None:
+    """Test that a forked child and its parent appending to the same file are both decoded with their own strings."""
+    path = tmp_path / "trace.yapb"
+    log = Log(parameters=None)
+    handler_id = log.add_binary_sink(path)
+    try:
+        log.info("Before fork", extra_value="parent value")
+        pid = os.fork()
+        if pid == 0:
+            try:
+                log.info("Child message", extra_value="child value")
+                log.remove_sink(handler_id)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        log.info("Parent message", extra_value="parent value")
+    finally:
+        log.remove_sink(handler_id)
+
+    with BinaryLogReader(path) as reader:
+        records = [(record.message, record.fields["extra_value"]) for record in reader]
+    assert records == [
+        ("Before fork", "parent value"),
+        ("Child message", "child value"),
+        ("Parent message", "parent value"),
+    ]
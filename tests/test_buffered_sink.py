@@ -0,0 +1,78 @@
+#whoami::./tests/test_buffered_sink.py
+"""Tests for the ThreadBufferedSink class and the thread buffered mode of Log."""
+import io
+import threading
+from typing import Any
+
+import pytest
+
+from yaplogger import Log
+from yaplogger.sinks.buffered import ThreadBufferedSink
+from yaplogger.utils import SeverityLevel
+
+
+def _render(record: Any) -> str:  # noqa: ANN401
+    """Render the thread name and message of a record."""
+    return f"{record['extra']['thread']} {record['message']}\n"
+
+
+def test_threads_keep_their_order_and_errors_are_written_at_once() -> None:
+    """Test that each thread's records are written in order, and that an error flushes its thread's buffer."""
+    stream = io.StringIO()
+    sink = ThreadBufferedSink(stream, _render, buffer_size=8, flush_interval=60)
+
+    sink.emit(SeverityLevel.INFO, "buffered", {"thread": "main"})
+    assert stream.getvalue() == ""
+    sink.emit(SeverityLevel.ERROR, "failure", {"thread": "main"})
+    assert stream.getvalue() == "main buffered\nmain failure\n"
+
+    def work(name: str) -> None:
+        for number in range(100):
+            sink.emit(SeverityLevel.INFO, str(number), {"thread": name})
+
+    threads = [threading.Thread(target=work, args=(f"worker-{index}",)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.stop()
+
+    lines = [line.split() for line in stream.getvalue().splitlines()[2:]]
+    for index in range(4):
+        assert [int(number) for name, number in lines if name == f"worker-{index}"] == list(range(100))
+
+
+def test_log_writes_through_thread_buffers(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the thread buffered mode writes every record, with non-decreasing timestamps per thread."""
+    log = Log(parameters=None)
+    log.configure_sink(thread_buffered=True, buffer_size=16)
+    try:
+        for number in range(50):
+            log.info("Buffered {}", args=(number,))
+        log.debug("Filtered")
+        log.error("Written at once")
+        assert "Written at once" in capsys.readouterr().out
+    finally:
+        log.configure_sink()
+
+    with pytest.raises(ValueError, match="exclusive"):
+        log.configure_sink(background=True, thread_buffered=True)
+    with pytest.raises(ValueError, match="colorize"):
+        log.configure_sink(thread_buffered=True, colorize=False)
+    log.configure_sink()
+
+
+def test_thread_buffered_timestamps_are_monotonic(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the records of a thread are written in order with non-decreasing timestamps."""
+    log = Log(parameters=None)
+    log.configure_sink(thread_buffered=True)
+    try:
+        for number in range(200):
+            log.info("Record {}", args=(number,))
+    finally:
+        log.configure_sink()
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if "Record " in line]
+    assert [int(line.split("Record ")[1]) for line in lines] == list(range(200))
+    timestamps = [line[:23] for line in lines]
+    assert timestamps == sorted(timestamps)
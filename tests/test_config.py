@@ -1,5 +1,8 @@
 #whoami::./tests/test_config.py
 """Tests for the Config class."""
+import json
+
+import pytest
 from yaplogger.config import Config
 from yaplogger.constants import Constants
 
@@ -10,7 +13,7 @@ def test_default_configuration_initialization() -> None:
     assert config.parameters[Constants.PROCESS_UID_KEY] == Constants.PROCESS_UID_DEFAULT_VALUE
     assert config.parameters[Constants.PROCESS_NAME_KEY] == Constants.PROCESS_NAME_DEFAULT_VALUE
     assert config.parameters[Constants.PROCESS_DESCRIPTION_KEY] == Constants.DESCRIPTION_DEFAULT_VALUE
-    assert config.parameters[Constants.PROCESS_EXTRAS_KEY] == []
+    assert config.parameters[Constants.PROCESS_EXTRAS_KEY] == {}
 
 
 def test_configure_with_custom_parameters() -> None:
@@ -28,7 +31,7 @@ def test_configure_with_custom_parameters() -> None:
 
 
 def test_configure_with_unrecognized_keys() -> None:
-    """Test that unrecognized keys are added to extras."""
+    """Test that unrecognized keys are added to extras, keyed by name."""
     config = Config()
     custom_parameters = {
         "unknown_key_1": "value1",
@@ -36,8 +39,24 @@ def test_configure_with_unrecognized_keys() -> None:
     }
     updated_config = config.configure(parameters=custom_parameters)
     extras = updated_config[Constants.PROCESS_EXTRAS_KEY]
-    assert {"unknown_key_1": "value1"} in extras
-    assert {"unknown_key_2": "value2"} in extras
+    assert extras == {"unknown_key_1": "value1", "unknown_key_2": "value2"}
+    assert extras["unknown_key_1"] == "value1"
+
+
+def test_extras_are_merged_without_duplicates_and_encoded_once() -> None:
+    """Test that extras replace those of the same name, and keep their encoding until they change."""
+    config = Config()
+    config.configure(parameters={Constants.PROCESS_EXTRAS_KEY: [{"team": "data"}, {"Region": "eu"}]})
+    extras = config.configure(parameters={"region": "us"})[Constants.PROCESS_EXTRAS_KEY]
+    assert extras == {"team": "data", "region": "us"}
+    assert extras.encoded is extras.encoded
+    assert json.loads(extras.encoded) == {"team": "data", "region": "us"}
+
+    assert (
+        config.configure(parameters={Constants.PROCESS_UID_KEY: "same_extras"})[Constants.PROCESS_EXTRAS_KEY] is extras
+    )
+    with pytest.raises(TypeError):
+        config.configure(parameters={Constants.PROCESS_EXTRAS_KEY: "not a mapping"})
 
 
 def test_get_process_id_default() -> None:
@@ -54,4 +73,4 @@ def test_get_process_id_after_configuration() -> None:
     process_id = config.get_process_id()
     assert process_id != Constants.PROCESS_UID_DEFAULT_VALUE
     assert isinstance(process_id, str)
-    assert len(process_id) > 0
\ No newline at end of file
+    assert len(process_id) > 0
@@ -0,0 +1,64 @@
+#whoami::./tests/test_formatter.py
+"""Tests for the compiled formatter and the timestamp cache."""
+import io
+import re
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from loguru import logger
+
+from yaplogger.constants import Constants
+from yaplogger.formatter import CompiledFormatter, TimestampCache
+from yaplogger.utils import SeverityLevel
+
+
+@pytest.mark.parametrize("colorize", [True, False])
+def test_compiled_output_is_identical_to_loguru(colorize: bool) -> None:  # noqa: FBT001
+    """Test that the compiled formatter renders records byte-identically to loguru."""
+    expected = io.StringIO()
+    records: list[Any] = []
+    bound = logger.bind(
+        process_uid="uid",
+        process_name="My Process",
+        display_level="",
+        generated_timestamp="",
+        extra_value="",
+        exception_message="",
+    )
+    handler_ids = [
+        logger.add(expected, level=0, format=Constants.STDOUT_DEFAULT_FORMAT, colorize=colorize),
+        logger.add(lambda message: records.append(message.record), level=0, format=Constants.RAW_MESSAGE_FORMAT),
+    ]
+    try:
+        for level in SeverityLevel:
+            bound.log(
+                level.name,
+                "Message with {braces}",
+                display_level=level.name.lower(),
+                generated_timestamp="2024-01-01 00:00:00.000",
+                extra_value="<extra>",
+                braces="{}",
+            )
+    finally:
+        for handler_id in handler_ids:
+            logger.remove(handler_id)
+
+    formatter = CompiledFormatter(colorize=colorize)
+    assert "".join(formatter.format(record) for record in records) == expected.getvalue()
+
+
+def test_unknown_markup_tag_is_rejected() -> None:
+    """Test that a format using an unsupported tag fails loudly when compiled."""
+    formatter = CompiledFormatter("<sparkly>{message}</sparkly>")
+    with pytest.raises(ValueError, match="sparkly"):
+        formatter._compile("INFO")
+
+
+def test_timestamp_cache_matches_datetime_format() -> None:
+    """Test that cached timestamps use the same layout and clock as datetime.now."""
+    before = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    stamp = TimestampCache().now()
+    after = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}", stamp)
+    assert before <= stamp <= after
@@ -0,0 +1,140 @@
+#whoami::./tests/test_index.py
+"""Tests for the sidecar index of NDJSON log files."""
+import io
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from yaplogger import Log
+from yaplogger.cli import main
+from yaplogger.index import LogIndex, build_index, index_path
+from yaplogger.index import _ENTRY as ENTRY  # pyright: ignore[reportPrivateUsage]
+from yaplogger.index import _HEADER as HEADER  # pyright: ignore[reportPrivateUsage]
+from yaplogger.utils import SeverityLevel
+
+
+def _write_log(path: Path) -> None:
+    """Interleave the records of two executions in an indexed NDJSON file."""
+    log = Log(parameters=None)
+    handler_id = log.add_ndjson_sink(path, SeverityLevel.DEBUG, index=True)
+    first = log.execution({"process_uid": "execution-1"})
+    second = log.execution({"process_uid": "execution-2"})
+    for i in range(20):
+        first.debug("Item {}", args=(i,))
+        second.info("Item {}", args=(i,))
+    second.error("Failed")
+    first.critical("Crashed", extra_value=RuntimeError("boom"))
+    log.remove_sink(handler_id)
+
+
+def test_live_index_finds_executions_and_windows(tmp_path: Path) -> None:
+    """Test that the index written with the file returns one execution, or the ERROR+ records of a window."""
+    path = tmp_path / "log.ndjson"
+    _write_log(path)
+    now = datetime.now(UTC)
+
+    with LogIndex(path) as index:
+        assert len(index) >= 42  # noqa: PLR2004
+        records = list(index.execution("execution-2"))
+        assert [r["message"] for r in records] == [f"Item {i}" for i in range(20)] + ["Failed"]
+        assert list(index.execution("unknown")) == []
+
+        failures = list(index.window(now - timedelta(minutes=1), now + timedelta(minutes=1)))
+        assert [(r["process_uid"], r["level"]) for r in failures] == [
+            ("execution-2", "ERROR"),
+            ("execution-1", "CRITICAL"),
+        ]
+        assert list(index.window(now - timedelta(hours=2), now - timedelta(hours=1))) == []
+
+
+def test_offline_index_matches_live_index(tmp_path: Path) -> None:
+    """Test that an index built from an existing file holds the same entries as the live one."""
+    path = tmp_path / "log.ndjson"
+    _write_log(path)
+    live = index_path(path).read_bytes()
+    index_path(path).unlink()
+
+    build_index(path)
+    offline = index_path(path).read_bytes()
+    assert offline[: HEADER.size] == live[: HEADER.size]
+    live_entries = list(ENTRY.iter_unpack(live[HEADER.size :]))
+    assert len(live_entries) == 42  # noqa: PLR2004
+    assert list(ENTRY.iter_unpack(offline[HEADER.size :])) == live_entries
+
+
+def test_window_finds_records_out_of_time_order(tmp_path: Path) -> None:
+    """Test that a time window finds its records wherever they are in the file, not only in time order."""
+    path = tmp_path / "log.ndjson"
+    timestamps = ["2024-01-01 00:01:40.000", "2024-01-01 00:03:20.000", "2024-01-01 00:00:50.000"]
+    path.write_text(
+        "".join(
+            json.dumps({"process_uid": "uid", "level": "ERROR", "timestamp": timestamp, "message": str(i)}) + "\n"
+            for i, timestamp in enumerate(timestamps)
+        ),
+    )
+
+    with LogIndex(path) as index:
+        start = datetime(2024, 1, 1, 0, 0, 50, tzinfo=UTC)
+        assert [r["message"] for r in index.window(start, start + timedelta(seconds=1))] == ["2"]
+        assert [r["message"] for r in index.window(start, start + timedelta(minutes=5))] == ["0", "1", "2"]
+
+
+def test_window_bounds_are_exact_within_a_second(tmp_path: Path) -> None:
+    """Test that records in the first and last seconds of a window are kept only when within its exact bounds."""
+    path = tmp_path / "log.ndjson"
+    timestamps = [f"2024-01-01 00:00:{second}" for second in ("10.200", "10.600", "12.300", "12.800")]
+    path.write_text(
+        "".join(
+            json.dumps({"process_uid": "uid", "level": "ERROR", "timestamp": timestamp, "message": str(i)}) + "\n"
+            for i, timestamp in enumerate(timestamps)
+        ),
+    )
+
+    with LogIndex(path) as index:
+        start = datetime(2024, 1, 1, 0, 0, 10, 500_000, tzinfo=UTC)
+        end = datetime(2024, 1, 1, 0, 0, 12, 500_000, tzinfo=UTC)
+        assert [r["message"] for r in index.window(start, end)] == ["1", "2"]
+
+
+def test_forked_child_indexes_its_own_offsets(tmp_path: Path) -> None:
+    """Test that a forked child and its parent appending to the same indexed file both index their lines right."""
+    path = tmp_path / "log.ndjson"
+    log = Log(parameters=None)
+    handler_id = log.add_ndjson_sink(path, index=True)
+    parent = log.execution({"process_uid": "parent"})
+    try:
+        parent.info("Before fork")
+        pid = os.fork()
+        if pid == 0:
+            try:
+                log.execution({"process_uid": "child"}).info("Child record")
+                log.remove_sink(handler_id)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        parent.info("After fork")
+    finally:
+        log.remove_sink(handler_id)
+
+    with LogIndex(path) as index:
+        assert [r["message"] for r in index.execution("parent")] == ["Before fork", "After fork"]
+        assert [r["message"] for r in index.execution("child")] == ["Child record"]
+
+
+def test_query_command_line(tmp_path: Path) -> None:
+    """Test the index and query commands."""
+    path = tmp_path / "log.ndjson"
+    _write_log(path)
+    index_path(path).unlink()
+
+    assert main(["index", str(path)], io.StringIO()) == 0
+    output = io.StringIO()
+    main(["query", str(path), "--uid", "execution-1"], output)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert len(records) == 21  # noqa: PLR2004
+    assert records[-1]["exception_message"] == "boom"
+
+    output = io.StringIO()
+    main(["query", str(path), "--since", "2000-01-01T00:00:00", "--min-level", "CRITICAL"], output)
+    assert [json.loads(line)["message"] for line in output.getvalue().splitlines()] == ["Crashed"]
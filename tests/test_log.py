@@ -0,0 +1,129 @@
+#whoami::./tests/test_log.py
+"""Tests for the Log class."""
+import re
+import subprocess
+import sys
+from collections.abc import Callable
+
+import pytest
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.utils import FormatterEngine, SeverityLevel
+
+
+def test_is_enabled_follows_sink_level() -> None:
+    """Test that the level gate reflects the level the sink was configured with."""
+    log = Log(parameters=None)
+    assert log.is_enabled(SeverityLevel.INFO)
+    assert log.is_enabled(SeverityLevel.CRITICAL)
+    assert not log.is_enabled(SeverityLevel.DEBUG)
+    assert not log.is_enabled(SeverityLevel.TRACE)
+
+
+def test_deferred_message_not_rendered_when_disabled() -> None:
+    """Test that a callable message is never invoked for a filtered level."""
+    log = Log(parameters=None)
+    calls: list[str] = []
+
+    def render() -> str:
+        calls.append("rendered")
+        return "expensive message"
+
+    log.debug(render)
+    log.trace(render)
+    assert calls == []
+
+    log.info(render)
+    assert calls == ["rendered"]
+
+
+def test_template_message_with_args() -> None:
+    """Test that a "{}" template is accepted together with its arguments."""
+    log = Log(parameters=None)
+    formatted: list[str] = []
+
+    class Argument:
+        def __format__(self, spec: str) -> str:
+            formatted.append(spec)
+            return "argument"
+
+    messages: list[str] = []
+    handler_id = log.add_sink(lambda message: messages.append(message.record["message"]))
+    try:
+        log.info("Loaded {} rows from {}", args=(10, "source"))
+        log.debug("Never formatted {}", args=(Argument(),))
+    finally:
+        log.remove_sink(handler_id)
+
+    assert messages == ["Loaded 10 rows from source"]
+    assert formatted == []
+
+
+def test_compiled_formatter_can_be_selected(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the compiled formatter engine can be selected, alone or with the background sink."""
+    log = Log(parameters=None)
+    try:
+        log.configure_sink(formatter=FormatterEngine.COMPILED)
+        log.info("Rendered by the compiled formatter.")
+        log.configure_sink(formatter=FormatterEngine.COMPILED, background=True)
+        log.warning("Rendered on the writer thread.", extra_value="extra")
+    finally:
+        log.configure_sink()
+
+    lines = capsys.readouterr().out.splitlines()
+    timestamp = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}"
+    assert re.fullmatch(rf"{timestamp} \| [^|]+ \| info     \| Rendered by the compiled formatter\.  ", lines[0])
+    assert re.fullmatch(rf"{timestamp} \| [^|]+ \| warning  \| Rendered on the writer thread\. extra ", lines[1])
+
+
+def test_lazy_log_starts_with_its_first_record(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that a lazy logger creates its sink and announces the process only when it emits its first record."""
+    factory: Callable[..., Log] = Log.__wrapped__  # pyright: ignore[reportFunctionMemberAccess]
+    log = factory(parameters={Constants.PROCESS_NAME_KEY: "lazy process"}, lazy=True)
+    try:
+        log.debug("Filtered, does not start the logger")
+        assert log.is_enabled(SeverityLevel.INFO)
+        assert capsys.readouterr().out == ""
+
+        log.info("First record")
+        output = capsys.readouterr().out
+        assert output.index("lazy process") < output.index("First record")
+        timestamps = [line.split(" | ")[0] for line in output.splitlines()]
+        assert timestamps == sorted(timestamps)
+    finally:
+        log.shutdown()
+
+
+def test_sinks_are_imported_on_first_access() -> None:
+    """Test that importing YapLogger does not import the optional sinks, which are imported when accessed."""
+    script = (
+        "import sys, yaplogger, yaplogger.sinks as sinks\n"
+        "assert 'yaplogger.sinks.network' not in sys.modules\n"
+        "assert sinks.NetworkSink.__module__ == 'yaplogger.sinks.network'\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)  # noqa: S603
+
+
+def test_summary_is_logged_before_the_sinks_stop_at_exit() -> None:
+    """Test that the execution summary reaches a sink added after the logger, which stops itself at exit."""
+    script = (
+        "import atexit, sys\n"
+        "from yaplogger import Log\n"
+        "class Sink:\n"
+        "    def __init__(self): self.stopped = False; atexit.register(self.stop)\n"
+        "    def stop(self): self.stopped = True\n"
+        "    def write(self, message):\n"
+        "        if not self.stopped: sys.stderr.write(message.record['message'] + '\\n')\n"
+        "log = Log(parameters=None, announce=False)\n"
+        "log.add_sink(Sink())\n"
+        "log.info('Record')\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)  # noqa: S603
+    assert completed.stderr.splitlines()[-2:] == ["Record", "Execution summary"]
+
+
+def test_lazy_log_writes_nothing_until_its_first_record() -> None:
+    """Test that building a lazy logger writes nothing, not even the configuration through loguru's default sink."""
+    script = "from yaplogger import Log\nLog(parameters={'process_name': 'quiet'}, lazy=True)\n"
+    completed = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)  # noqa: S603
+    assert (completed.stdout, completed.stderr) == ("", "")
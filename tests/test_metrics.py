@@ -0,0 +1,162 @@
+#whoami::./tests/test_metrics.py
+"""Tests for the logging metrics."""
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from yaplogger import Log
+from yaplogger.metrics import LogMetrics, MeasuredSink, render_prometheus
+from yaplogger.utils import FormatterEngine, MetricsFormat, SeverityLevel
+
+
+def test_records_and_sink_writes_are_counted() -> None:
+    """Test that emitted and filtered records, sink writes and exception emissions show up in the stats."""
+    log = Log(parameters=None)
+    stream = io.StringIO()
+    handler_id = log.add_sink(stream, SeverityLevel.INFO)
+    log.configure_metrics()
+
+    log.debug("Filtered")
+    log.info("Emitted")
+    log.warning("Emitted {}", args=(2,))
+    log.critical("Failure", extra_value=ValueError("boom"))
+    stats = log.stats()
+    log.configure_metrics(enabled=False)
+    log.remove_sink(handler_id)
+
+    assert stats.filtered == {"DEBUG": 1}
+    assert stats.emitted == {"INFO": 1, "WARNING": 1, "CRITICAL": 1}
+    assert stats.emit_latency.calls == 3  # noqa: PLR2004
+    assert stats.exception_render.calls == 1
+    sink = stats.sinks[handler_id]
+    assert sink.name == "StringIO"
+    assert sink.writes == 3  # noqa: PLR2004
+    assert sink.bytes_written == len(stream.getvalue())
+    assert sink.latency.max_ms >= sink.latency.p50_ms > 0
+    assert sink.queue_depth is None
+    assert log.stats().emitted == {}
+
+
+def test_thread_shards_are_merged() -> None:
+    """Test that counters recorded by several threads are summed in the snapshot."""
+    metrics = LogMetrics()
+    threads = [
+        threading.Thread(target=lambda: [metrics.record_filtered(SeverityLevel.TRACE) for _ in range(100)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.snapshot()[1] == {"TRACE": 400}
+
+
+def test_metrics_are_exported(tmp_path: Path) -> None:
+    """Test that a JSON snapshot is written on stop and the Prometheus rendering holds every family."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(records.append, SeverityLevel.INFO)
+    target = tmp_path / "yaplogger.json"
+    log.configure_metrics(export_path=target, export_format=MetricsFormat.JSON, export_interval=60)
+    log.info("Exported")
+    stats = log.stats()
+    log.configure_metrics(enabled=False)
+    log.remove_sink(handler_id)
+
+    exported = json.loads(target.read_text())
+    assert exported["emitted"] == {"INFO": 1}
+    assert exported["sinks"][str(handler_id)]["writes"] == 1
+
+    text = render_prometheus(stats)
+    assert 'yaplogger_records_emitted_total{level="INFO"} 1' in text
+    assert f'yaplogger_sink_writes_total{{handler="{handler_id}",sink="list.append"}} 1' in text
+    assert 'yaplogger_emit_latency_seconds_count{} 1' in text
+
+
+def test_written_sizes_are_bytes() -> None:
+    """Test that sizes are counted in bytes, and that sinks rendering their own lines count what they write."""
+    log = Log(parameters=None)
+    stream = io.StringIO()
+    handler_id = log.add_sink(stream, SeverityLevel.INFO)
+    log.configure_sink(formatter=FormatterEngine.COMPILED, background=True)
+    try:
+        log.configure_metrics()
+        log.info("Température")
+        stdout_id = log._stdout_handler_id  # noqa: SLF001
+        log._measured_sinks[stdout_id].sink.drain()  # noqa: SLF001
+        stats = log.stats()
+    finally:
+        log.configure_metrics(enabled=False)
+        log.remove_sink(handler_id)
+        log.configure_sink()
+
+    assert stats.sinks[handler_id].bytes_written == len("Température\n".encode())
+    background = stats.sinks[stdout_id]
+    assert background.bytes_written is not None
+    assert background.bytes_written > len("Température\n".encode())
+
+
+def test_compiled_stdout_size_is_not_reported() -> None:
+    """Test that the compiled stdout sink, which renders lines it does not count, reports no size."""
+    log = Log(parameters=None)
+    log.configure_sink(formatter=FormatterEngine.COMPILED)
+    try:
+        log.configure_metrics()
+        log.info("Rendered")
+        stdout_id = log._stdout_handler_id  # noqa: SLF001
+        stats = log.stats()
+    finally:
+        log.configure_metrics(enabled=False)
+        log.configure_sink()
+
+    sink = stats.sinks[stdout_id]
+    assert sink.writes == 1
+    assert sink.bytes_written is None
+
+
+def test_disabled_metrics_leave_writes_unwrapped() -> None:
+    """Test that the measured sink hands the sink's own write to loguru while the metrics are disabled."""
+    stream = io.StringIO()
+    measured = MeasuredSink(stream, "stream")
+    assert measured.write == stream.write
+    assert measured.flush == stream.flush
+    measured.metrics = LogMetrics()
+    assert measured.write != stream.write
+    measured.metrics = None
+    assert measured.write == stream.write
+
+
+def test_failed_exports_are_reported_and_retried(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that an export failing with an OSError is reported to stderr, without stopping the exporter."""
+    log = Log(parameters=None)
+    target = tmp_path / "missing" / "yaplogger.json"
+    log.configure_metrics(export_path=target, export_format=MetricsFormat.JSON, export_interval=0.01)
+    time.sleep(0.1)
+    target.parent.mkdir()
+    time.sleep(0.1)
+    log.info("Exported")
+    log.shutdown()
+
+    assert "metrics exporter failed to write" in capsys.readouterr().err
+    assert json.loads(target.read_text())["emitted"] == {"INFO": 1}
+
+
+def test_final_snapshot_is_written_at_exit(tmp_path: Path) -> None:
+    """Test that the exporter writes a last snapshot at interpreter exit, counting the execution summary."""
+    target = tmp_path / "yaplogger.json"
+    script = (
+        "from yaplogger import Log\n"
+        "from yaplogger.utils import MetricsFormat\n"
+        "log = Log(parameters=None)\n"
+        f"log.configure_metrics(export_path={str(target)!r}, export_format=MetricsFormat.JSON, export_interval=60)\n"
+        "log.info('Record')\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)  # noqa: S603
+    assert json.loads(target.read_text())["emitted"] == {"INFO": 2}
@@ -0,0 +1,43 @@
+#whoami::./tests/test_multiprocess.py
+"""Tests for the multi-process log aggregation."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pytest
+
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.multiprocess import LogAggregator
+
+
+def _work(item: int) -> int:
+    """Log from a worker process."""
+    log = Log(parameters=None)
+    log.info("Worker {} processing", args=(item,), extra_value=str(item))
+    log.debug("Filtered in the worker.")
+    return item
+
+
+@pytest.mark.parametrize("start_method", ["spawn", "fork"])
+def test_worker_records_reach_parent_sinks(start_method: str) -> None:
+    """Test that worker records are written by the parent with its process uid and a worker id."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+    context = multiprocessing.get_context(start_method)
+
+    with (
+        LogAggregator(log, context=context) as aggregator,
+        ProcessPoolExecutor(
+            max_workers=2, mp_context=context, initializer=aggregator.initializer, initargs=aggregator.initargs
+        ) as pool,
+    ):
+        assert sorted(pool.map(_work, range(4))) == [0, 1, 2, 3]
+    log.remove_sink(handler_id)
+
+    assert sorted(record["message"] for record in records) == [f"Worker {i} processing" for i in range(4)]
+    for record in records:
+        assert record["extra"][Constants.PROCESS_UID_KEY] == log.parameters[Constants.PROCESS_UID_KEY]
+        assert record["extra"][Constants.WORKER_ID_KEY] in {1, 2}
+        assert record["extra"]["extra_value"] == record["message"].split()[1]
@@ -0,0 +1,96 @@
+#whoami::./tests/test_ndjson_sink.py
+"""Tests for the NDJSONFileSink class."""
+import gzip
+import json
+from pathlib import Path
+
+from loguru import logger
+
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.sinks import NDJSONFileSink
+from yaplogger.utils import SeverityLevel
+
+
+def _emit(sink: NDJSONFileSink, count: int) -> None:
+    """Log records through a temporary loguru handler writing to the sink."""
+    bound = logger.bind(process_uid="uid-1", process_name="Näme", generated_timestamp="2024-01-01 00:00:00.000")
+    handler_id = logger.add(sink, level=0, format=Constants.RAW_MESSAGE_FORMAT)
+    try:
+        for i in range(count):
+            bound.info(f'record "{i}"', extra_value=i)
+    finally:
+        logger.remove(handler_id)
+
+
+def test_records_are_written_as_json_lines(tmp_path: Path) -> None:
+    """Test that every record becomes a JSON object with the process fields."""
+    path = tmp_path / "app.ndjson"
+    _emit(NDJSONFileSink(path, process_extras={"env": "test"}), 2)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[1] == {
+        Constants.PROCESS_UID_KEY: "uid-1",
+        Constants.PROCESS_NAME_KEY: "Näme",
+        "level": "INFO",
+        "timestamp": "2024-01-01 00:00:00.000",
+        "message": 'record "1"',
+        "extra_value": 1,
+        "exception_message": "",
+        Constants.PROCESS_EXTRAS_KEY: {"env": "test"},
+    }
+
+
+def test_rotated_segments_are_compressed(tmp_path: Path) -> None:
+    """Test that size rotation produces gzipped segments holding every record exactly once."""
+    path = tmp_path / "app.ndjson"
+    _emit(NDJSONFileSink(path, rotation_size=1024, buffer_size=256), 50)
+
+    segments = sorted(tmp_path.glob("app.*.ndjson.gz"))
+    assert segments
+    messages = [json.loads(line)["message"] for segment in segments for line in gzip.open(segment, "rt")]
+    messages += [json.loads(line)["message"] for line in path.read_text().splitlines()]
+    assert messages == [f'record "{i}"' for i in range(50)]
+
+
+def test_log_adds_ndjson_sink(tmp_path: Path) -> None:
+    """Test that the Log sink level participates in the level gate."""
+    log = Log(parameters=None)
+    path = tmp_path / "app.ndjson"
+    handler_id = log.add_ndjson_sink(path, level=SeverityLevel.DEBUG)
+    assert log.is_enabled(SeverityLevel.DEBUG)
+    log.debug("To the file only.", extra_value="x")
+    log.remove_sink(handler_id)
+    assert not log.is_enabled(SeverityLevel.DEBUG)
+
+    record = json.loads(path.read_text())
+    assert record["message"] == "To the file only."
+    assert record["level"] == "DEBUG"
+
+
+def test_execution_extras_reach_every_record(tmp_path: Path) -> None:
+    """Test that the extras of a configuration are carried by the records of its logger."""
+    log = Log(parameters=None)
+    path = tmp_path / "app.ndjson"
+    handler_id = log.add_ndjson_sink(path)
+    log.execution({Constants.PROCESS_NAME_KEY: "extras job", "Batch": 7}).info("Execution record")
+    log.remove_sink(handler_id)
+
+    record = json.loads(path.read_text())
+    assert record[Constants.PROCESS_EXTRAS_KEY] == {"batch": 7}
+
+
+def test_errors_are_flushed_at_once(tmp_path: Path) -> None:
+    """Test that an error record is written to the file with the records buffered before it."""
+    path = tmp_path / "app.ndjson"
+    sink = NDJSONFileSink(path)
+    bound = logger.bind(process_uid="uid-1", process_name="name")
+    handler_id = logger.add(sink, level=0, format=Constants.RAW_MESSAGE_FORMAT)
+    try:
+        bound.info("Buffered")
+        assert path.read_text() == ""
+        bound.error("Failure")
+        assert [json.loads(line)["message"] for line in path.read_text().splitlines()] == ["Buffered", "Failure"]
+    finally:
+        logger.remove(handler_id)
+        sink.stop()
@@ -0,0 +1,189 @@
+#whoami::./tests/test_network_sink.py
+"""Tests for the network sink against local stand-in collectors."""
+import json
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.sinks import NetworkSink
+from yaplogger.sinks.ndjson import NDJSONSerializer
+from yaplogger.sinks.network import SyslogSerializer
+from yaplogger.utils import NetworkProtocol, SeverityLevel
+
+
+class _Collector(socketserver.ThreadingTCPServer):
+    """TCP stand-in collector keeping every byte it receives."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, port: int = 0) -> None:
+        super().__init__(("127.0.0.1", port), _CollectorHandler)
+        self.received = bytearray()
+        self.lock = threading.Lock()
+
+
+class _CollectorHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server: _Collector = self.server  # type: ignore[assignment]
+        while chunk := self.request.recv(65536):
+            with server.lock:
+                server.received.extend(chunk)
+
+
+class _HTTPCollectorHandler(BaseHTTPRequestHandler):
+    bodies: list[bytes] = []  # noqa: RUF012
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.bodies.append(self.rfile.read(int(self.headers["Content-Length"])))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@contextmanager
+def _serving(server: socketserver.BaseServer) -> Iterator[None]:
+    """Serve requests from a background thread while the block runs."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _free_port() -> int:
+    """A local TCP port nothing listens on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_json_lines_over_tcp() -> None:
+    """Test that records are shipped as NDJSON lines over a persistent TCP connection."""
+    collector = _Collector()
+    with _serving(collector):
+        log = Log(parameters=None)
+        handler_id = log.add_network_sink(
+            f"tcp://127.0.0.1:{collector.server_address[1]}",
+            SeverityLevel.WARNING,
+            batch_size=2,
+            connections=2,
+        )
+        for number in range(5):
+            log.warning(f"Shipped {number}", extra_value=number)
+        log.remove_sink(handler_id)
+
+        deadline = time.monotonic() + 5
+        while collector.received.count(b"\n") < 5 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.01)
+
+    documents = [json.loads(line) for line in collector.received.splitlines()]
+    assert sorted(document["message"] for document in documents) == [f"Shipped {number}" for number in range(5)]
+    assert {document["level"] for document in documents} == {"WARNING"}
+    assert len({document[Constants.PROCESS_UID_KEY] for document in documents}) == 1
+
+
+def test_syslog_over_http() -> None:
+    """Test that records are posted as RFC 5424 messages, one per line, with the severity in the priority."""
+    _HTTPCollectorHandler.bodies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HTTPCollectorHandler)
+    with _serving(server):
+        log = Log(parameters=None)
+        handler_id = log.add_network_sink(
+            f"http://127.0.0.1:{server.server_address[1]}/ingest",
+            protocol=NetworkProtocol.SYSLOG,
+            hostname="collector test",
+        )
+        log.info("Started")
+        log.error("Failed", extra_value="disk full")
+        log.remove_sink(handler_id)
+
+    lines = b"".join(_HTTPCollectorHandler.bodies).decode().splitlines()
+    assert len(lines) == 2  # noqa: PLR2004
+    info, error = lines
+    assert info.startswith("<14>1 ")
+    assert info.endswith(" - - Started")
+    priority, timestamp, hostname, _, process_uid, message_id, structured_data, message = error.split(" ", 7)
+    assert priority == "<11>1"
+    assert timestamp.endswith("Z")
+    assert hostname == "collectortest"
+    assert process_uid != "-"
+    assert (message_id, structured_data, message) == ("-", "-", "Failed disk full")
+
+
+def test_spool_is_replayed_when_the_collector_comes_back(tmp_path: Path) -> None:
+    """Test that batches are spooled while the collector is down and delivered, in order, once it is up."""
+    port = _free_port()
+    sink = NetworkSink(
+        f"tcp://127.0.0.1:{port}",
+        flush_interval=0.02,
+        max_retries=1,
+        backoff_base=0.01,
+        backoff_max=0.05,
+        spool_path=tmp_path / "spool",
+    )
+    log = Log(parameters=None)
+    handler_id = log.add_sink(sink, SeverityLevel.INFO)
+    log.info("First")
+    assert sink.drain(5)
+    log.info("Second")
+    assert sink.drain(5)
+    assert sink.spool is not None
+    assert len(sink.spool) == 2  # noqa: PLR2004
+    assert sink.bytes_written == 0
+
+    collector = _Collector(port)
+    with _serving(collector):
+        deadline = time.monotonic() + 5
+        while sink.spool and time.monotonic() < deadline:
+            time.sleep(0.01)
+        log.info("Third")
+        log.remove_sink(handler_id)
+        while collector.received.count(b"\n") < 3 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(0.01)
+
+    messages = [json.loads(line)["message"] for line in collector.received.splitlines()]
+    assert messages == ["First", "Second", "Third"]
+    assert not list((tmp_path / "spool").iterdir())
+    assert sink.dropped == 0
+    assert sink.bytes_written == len(collector.received)
+
+
+def test_serializers_can_be_shared_between_threads() -> None:
+    """Test that threads sharing a serializer always render the process fields of their own records."""
+    serializers = (SyslogSerializer(), NDJSONSerializer())
+    mismatches: list[str] = []
+
+    def serialize(process_uid: str) -> None:
+        record = {
+            "extra": {Constants.PROCESS_UID_KEY: process_uid, Constants.PROCESS_NAME_KEY: process_uid},
+            "level": SimpleNamespace(no=SeverityLevel.INFO.value, name="INFO"),
+            "message": "message",
+            "time": datetime.now(UTC),
+        }
+        for _ in range(2000):
+            for serializer in serializers:
+                rendered = serializer.serialize(record)
+                text = rendered.decode() if isinstance(rendered, bytes) else rendered
+                if text.count(process_uid) != 2:  # noqa: PLR2004
+                    mismatches.append(text)
+
+    threads = [threading.Thread(target=serialize, args=(f"process-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert mismatches == []
@@ -0,0 +1,74 @@
+#whoami::./tests/test_recorder.py
+"""Tests for the flight recorder."""
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.recorder import FlightRecorder
+from yaplogger.utils import SeverityLevel
+
+
+def test_ring_keeps_the_last_entries_once() -> None:
+    """Test that the ring overwrites the oldest entries and a dump only returns entries not dumped yet."""
+    recorder = FlightRecorder(3)
+    for i in range(5):
+        recorder.capture(SeverityLevel.DEBUG, "Step {}", (i,), None, {})
+
+    assert [entry.args for entry in recorder.dump()] == [(2,), (3,), (4,)]
+    assert recorder.dump() == []
+
+    recorder.capture(SeverityLevel.TRACE, "Late", (), None, {})
+    assert [entry.message for entry in recorder.dump()] == ["Late"]
+
+
+def test_debug_records_are_written_before_an_error() -> None:
+    """Test that records below the sink level stay out of the sinks until an error is logged."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record), SeverityLevel.INFO)
+    log.configure_recorder(100, level=SeverityLevel.DEBUG)
+    rendered: list[str] = []
+
+    log.trace("Not captured")
+    log.debug(lambda: rendered.append("x") or "Cache miss", extra_value="key-1")
+    log.debug("Retry {}", args=(2,))
+    assert records == []
+    assert rendered == []
+    assert log.is_enabled(SeverityLevel.DEBUG)
+
+    log.error("Request failed")
+    log.error("Request failed again")
+    log.configure_recorder(0)
+    log.remove_sink(handler_id)
+
+    assert [(r["level"].name, r["extra"]["display_level"], r["message"]) for r in records] == [
+        ("ERROR", "debug", "Cache miss"),
+        ("ERROR", "debug", "Retry 2"),
+        ("ERROR", "error", "Request failed"),
+        ("ERROR", "error", "Request failed again"),
+    ]
+    assert records[0]["extra"]["extra_value"] == "key-1"
+    assert records[0]["extra"]["recorded"] is True
+    assert "recorded" not in records[2]["extra"]
+    assert records[0]["extra"]["generated_timestamp"] <= records[2]["extra"]["generated_timestamp"]
+    assert not log.is_enabled(SeverityLevel.DEBUG)
+
+
+def test_explicit_dump_with_limit() -> None:
+    """Test that dump_recent writes the most recent records at the requested level."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record), SeverityLevel.INFO)
+    execution = log.execution({"process_uid": "recorded-execution"})
+    execution.configure_recorder(10)
+    for i in range(5):
+        execution.debug("Item {}", args=(i,))
+    log.debug("Process record not captured")
+
+    assert execution.dump_recent(limit=2, level=SeverityLevel.WARNING) == 2  # noqa: PLR2004
+    assert log.dump_recent() == 0
+    log.remove_sink(handler_id)
+
+    assert [(r["level"].name, r["message"], r["extra"]["process_uid"]) for r in records] == [
+        ("WARNING", "Item 3", "recorded-execution"),
+        ("WARNING", "Item 4", "recorded-execution"),
+    ]
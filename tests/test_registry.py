@@ -0,0 +1,107 @@
+#whoami::./tests/test_registry.py
+"""Tests for the LogRegistry class."""
+import json
+from typing import Any
+
+from loguru import logger
+
+from yaplogger import Log
+from yaplogger.config import Config
+from yaplogger.constants import Constants
+from yaplogger.formatter import TimestampCache
+from yaplogger.registry import LogRegistry
+from yaplogger.utils import ExceptionRenderMode, SeverityLevel
+
+
+def test_executions_get_their_own_process_uid() -> None:
+    """Test that executions are attributed to their own UID, without touching the process configuration."""
+    log = Log(parameters=None)
+    process_uid = Config.get_process_id()
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+
+    first = log.execution({Constants.PROCESS_UID_KEY: "exec-1", Constants.PROCESS_NAME_KEY: "first"})
+    second = log.execution({Constants.PROCESS_NAME_KEY: "second"})
+    first.info("From the first execution.")
+    second.info("From the second execution.")
+    log.remove_sink(handler_id)
+
+    assert log.execution({Constants.PROCESS_UID_KEY: "exec-1"}) is first
+    assert second.process_uid not in ("exec-1", process_uid)
+    assert Config.get_process_id() == process_uid
+    assert [(r["extra"]["process_uid"], r["extra"]["process_name"]) for r in records] == [
+        ("exec-1", "first"),
+        (second.process_uid, "second"),
+    ]
+
+
+def test_level_gate_follows_process_sinks() -> None:
+    """Test that execution loggers see sink level changes made after their creation."""
+    log = Log(parameters=None)
+    execution = log.execution({Constants.PROCESS_UID_KEY: "exec-gate"})
+    assert not execution.is_enabled(SeverityLevel.DEBUG)
+    log.configure_sink(SeverityLevel.DEBUG)
+    assert execution.is_enabled(SeverityLevel.DEBUG)
+    log.configure_sink()
+    assert not execution.is_enabled(SeverityLevel.DEBUG)
+
+
+def test_least_recently_used_entries_are_evicted() -> None:
+    """Test that the registry stays bounded and keeps the recently used entries."""
+    registry = LogRegistry(SeverityLevel.INFO, TimestampCache(), max_size=10, ttl=None)
+    for i in range(10):
+        registry.get_or_create({Constants.PROCESS_UID_KEY: f"uid-{i}"})
+    assert registry.get("uid-0") is not None
+
+    registry.get_or_create({Constants.PROCESS_UID_KEY: "uid-10"})
+    assert len(registry) <= 10
+    assert registry.get("uid-0") is not None
+    assert registry.get("uid-1") is None
+
+
+def test_expired_entries_are_replaced() -> None:
+    """Test that an entry unused for longer than the TTL is created again."""
+    registry = LogRegistry(SeverityLevel.INFO, TimestampCache(), ttl=0.0)
+    entry = registry.get_or_create({Constants.PROCESS_UID_KEY: "uid"})
+    entry.last_used -= 1
+    assert registry.get("uid") is None
+    assert registry.get_or_create({Constants.PROCESS_UID_KEY: "uid"}) is not entry
+
+
+def test_evicted_entries_log_their_summary() -> None:
+    """Test that an execution logger evicted from the registry logs its summary, which finish would not see."""
+    registry = LogRegistry(SeverityLevel.INFO, TimestampCache(), max_size=1, ttl=None)
+    records: list[Any] = []
+    handler_id = logger.add(lambda message: records.append(message.record), level=0)
+    try:
+        registry.get_or_create({Constants.PROCESS_UID_KEY: "evicted"}).info("Work")
+        registry.get_or_create({Constants.PROCESS_UID_KEY: "unused"})
+        registry.get_or_create({Constants.PROCESS_UID_KEY: "newest"})
+    finally:
+        logger.remove(handler_id)
+
+    summaries = [r for r in records if r["message"] == "Execution summary"]
+    assert [r["extra"]["process_uid"] for r in summaries] == ["evicted"]
+    assert json.loads(summaries[0]["extra"]["extra_value"])["records"] == 1
+
+
+def test_scoped_records_use_the_execution_summary_and_exceptions() -> None:
+    """Test that records logged within use_execution are counted and rendered by the execution logger."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+    log.configure_exceptions(ExceptionRenderMode.COMPACT)
+    try:
+        with log.use_execution({Constants.PROCESS_UID_KEY: "exec-scoped"}) as execution:
+            log.info("Scoped")
+            log.critical("Failed", ValueError("boom"))
+    finally:
+        log.configure_exceptions(ExceptionRenderMode.MESSAGE)
+        log.remove_sink(handler_id)
+
+    summary = execution.execution_summary()
+    assert summary is not None
+    assert (summary.records, summary.levels) == (2, {"INFO": 1, "CRITICAL": 1})
+    exception_message = records[-1]["extra"]["exception_message"]
+    assert isinstance(exception_message, str)
+    assert exception_message.startswith("ValueError: boom")
@@ -0,0 +1,75 @@
+#whoami::./tests/test_router.py
+"""Tests for the routing of records to several sinks."""
+import io
+
+import pytest
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.sinks import BackgroundSink, SinkRoute
+from yaplogger.utils import SeverityLevel
+
+_FORMAT = "{extra[display_level]}|{extra[process_name]}|{message}"
+
+
+def test_records_reach_the_routes_whose_level_and_filter_they_match() -> None:
+    """Test that each route receives its levels only, rendered with its own format and filtered by process name."""
+    errors, everything, etl = io.StringIO(), io.StringIO(), io.StringIO()
+    log = Log(parameters=None)
+    handler_id = log.configure_routes(
+        [
+            SinkRoute(errors, SeverityLevel.ERROR, fmt=_FORMAT),
+            SinkRoute(everything, SeverityLevel.DEBUG, fmt=_FORMAT),
+            SinkRoute(etl, SeverityLevel.TRACE, fmt=_FORMAT, match={Constants.PROCESS_NAME_KEY: "etl"}),
+        ],
+    )
+    assert handler_id is not None
+    assert log.is_enabled(SeverityLevel.TRACE)
+
+    log.debug("Polling")
+    log.error("Failed")
+    execution = log.execution({Constants.PROCESS_NAME_KEY: "etl"})
+    execution.trace("Extracting")
+    log.configure_routes([])
+
+    name = log.parameters[Constants.PROCESS_NAME_KEY]
+    assert errors.getvalue() == f"error|{name}|Failed\n"
+    assert everything.getvalue().splitlines()[-2:] == [f"debug|{name}|Polling", f"error|{name}|Failed"]
+    assert etl.getvalue() == "trace|etl|Extracting\n"
+    assert not log.is_enabled(SeverityLevel.DEBUG)
+
+
+def test_routes_are_swapped_without_losing_records() -> None:
+    """Test that reconfiguring keeps the sinks still routed to and drains the ones that are not."""
+    kept, retired = io.StringIO(), io.StringIO()
+    background = BackgroundSink(retired, flush_interval=10)
+    log = Log(parameters=None)
+    first_id = log.configure_routes(
+        [SinkRoute(kept, SeverityLevel.INFO, fmt=_FORMAT), SinkRoute(background, SeverityLevel.INFO, fmt=_FORMAT)],
+    )
+    log.info("Before")
+    second_id = log.configure_routes([SinkRoute(kept, SeverityLevel.WARNING, fmt="{message}")])
+    log.info("Filtered")
+    log.warning("After")
+    log.configure_routes([])
+
+    assert second_id == first_id
+    assert kept.getvalue().splitlines()[-2:] == [f"info|{log.parameters[Constants.PROCESS_NAME_KEY]}|Before", "After"]
+    assert retired.getvalue().endswith("|Before\n")
+    assert background.queue_depth == 0
+
+
+def test_failing_route_does_not_stop_the_others(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that an exception raised by a sink is reported and the following routes still get the record."""
+
+    class Broken:
+        def write(self, message: str) -> None:
+            raise OSError(message)
+
+    received = io.StringIO()
+    log = Log(parameters=None)
+    log.configure_routes([SinkRoute(Broken(), name="broken"), SinkRoute(received, fmt="{message}")])
+    log.warning("Delivered")
+    log.configure_routes([])
+
+    assert received.getvalue() == "Delivered\n"
+    assert "route to broken failed" in capsys.readouterr().err
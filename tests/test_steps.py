@@ -0,0 +1,76 @@
+#whoami::./tests/test_steps.py
+"""Tests for the step timing instrumentation."""
+import asyncio
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.steps import StepStatistics, current_step
+from yaplogger.utils import SeverityLevel, timed_step
+
+
+def test_nested_steps_are_logged_and_aggregated() -> None:
+    """Test that nested steps get path ids, start/end records and statistics."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+
+    for _ in range(3):
+        with log.step("load", SeverityLevel.INFO):
+            assert current_step() == "load"
+            with log.step("parse", SeverityLevel.INFO):
+                assert current_step() == "load/parse"
+    log.remove_sink(handler_id)
+
+    assert current_step() == ""
+    assert [(r["message"], r["extra"]["step"]) for r in records[:4]] == [
+        ("Step started", "load"),
+        ("Step started", "load/parse"),
+        ("Step finished", "load/parse"),
+        ("Step finished", "load"),
+    ]
+    summary = log.step_summary()
+    assert summary["load"].calls >= 3
+    assert summary["load/parse"].calls >= 3
+    assert summary["load"].max_ms >= summary["load"].p95_ms >= summary["load"].p50_ms
+
+
+def test_disabled_step_is_still_timed() -> None:
+    """Test that a step at a disabled level logs nothing but is still measured."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+    with log.step("filtered", SeverityLevel.TRACE):
+        assert current_step() == "filtered"
+    log.remove_sink(handler_id)
+
+    assert records == []
+    assert log.step_summary()["filtered"].calls >= 1
+
+
+def test_timed_step_decorator() -> None:
+    """Test that the decorator times sync and async functions, failures included."""
+    log = Log(parameters=None)
+
+    @timed_step("sync-step", level=SeverityLevel.INFO, log=log)
+    def sync_step() -> str:
+        return current_step()
+
+    @timed_step(level=SeverityLevel.INFO, log=log)
+    async def async_step() -> str:
+        return current_step()
+
+    assert sync_step() == "sync-step"
+    assert asyncio.run(async_step()).endswith("async_step")
+    assert log.step_summary()["sync-step"].calls >= 1
+
+
+def test_percentiles_use_bounded_samples() -> None:
+    """Test that percentiles come from a bounded reservoir while count and total stay exact."""
+    statistics = StepStatistics(reservoir_size=10)
+    for duration in range(1, 1001):
+        statistics.record("step", duration * 1_000_000)
+    summary = statistics.summary()["step"]
+    assert summary.calls == 1000
+    assert summary.total_ms == sum(range(1, 1001))
+    assert summary.max_ms == 1000
+    assert len(statistics._steps["step"].samples) == 10
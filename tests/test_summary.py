@@ -0,0 +1,85 @@
+#whoami::./tests/test_summary.py
+"""Tests for the execution summary and its message template aggregation."""
+import json
+import threading
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.constants import Constants
+from yaplogger.summary import RecordStatistics
+from yaplogger.utils import SeverityLevel
+
+
+def test_templates_are_counted_with_bounded_memory() -> None:
+    """Test that the frequent templates survive a stream of distinct messages, with exact level counts."""
+    statistics = RecordStatistics("uid", top_k=4)
+    for number in range(100):
+        statistics.record(SeverityLevel.INFO, "Loaded {} rows")
+        statistics.record(SeverityLevel.DEBUG, f"Unique message {number}")
+    statistics.record(SeverityLevel.ERROR, "Loaded {} rows")
+
+    summary = statistics.summary()
+    assert summary.records == 201  # noqa: PLR2004
+    assert summary.levels == {"DEBUG": 100, "INFO": 100, "ERROR": 1}
+    assert len(summary.templates) == 4  # noqa: PLR2004
+    assert summary.templates[0][:3] == ("INFO", "Loaded {} rows", 100)
+    assert summary.templates[0].error == 0
+    assert summary.evicted > 0
+
+
+def test_threads_are_counted_in_their_own_shards() -> None:
+    """Test that the counts of several threads are merged, an untracked template adding the floor of its shard."""
+    statistics = RecordStatistics("uid", top_k=2)
+
+    def work(template: str) -> None:
+        for _ in range(50):
+            statistics.record(SeverityLevel.INFO, "Loaded {} rows")
+        for _ in range(10):
+            statistics.record(SeverityLevel.INFO, template)
+
+    threads = [threading.Thread(target=work, args=(f"Thread {number}",)) for number in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    statistics.record(SeverityLevel.INFO, "Main")
+    statistics.record(SeverityLevel.INFO, "Other main")
+    statistics.record(SeverityLevel.INFO, "Thread 0")
+
+    summary = statistics.summary()
+    assert summary.records == 243  # noqa: PLR2004
+    assert summary.levels == {"INFO": 243}
+    assert summary.templates[0] == ("INFO", "Loaded {} rows", 201, 1)
+    assert summary.templates[1] == ("INFO", "Thread 0", 42, 31)
+    assert summary.evicted == 5  # noqa: PLR2004
+
+
+def test_finish_logs_one_summary_per_execution() -> None:
+    """Test that finishing logs the summary of the executions with records, then of the process, once."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+    execution = log.execution({Constants.PROCESS_NAME_KEY: "summary job"})
+    for number in range(3):
+        execution.warning("Retrying {}", args=(number,))
+    idle = log.execution({Constants.PROCESS_NAME_KEY: "idle job"})
+
+    log.finish()
+    log.finish()
+    log.remove_sink(handler_id)
+
+    summaries = {
+        summary["process_uid"]: summary
+        for summary in (
+            json.loads(record["extra"]["extra_value"]) for record in records if record["message"] == "Execution summary"
+        )
+    }
+    process_summary = log.execution_summary()
+    assert process_summary is not None
+    assert list(summaries)[-1] == process_summary.process_uid
+    assert summaries[list(summaries)[-1]]["wall_time_s"] > 0
+    assert idle.process_uid not in summaries
+    assert summaries[execution.process_uid]["levels"] == {"WARNING": 3}
+    assert summaries[execution.process_uid]["templates"] == [
+        {"level": "WARNING", "template": "Retrying {}", "records": 3, "error": 0},
+    ]
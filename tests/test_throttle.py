@@ -0,0 +1,126 @@
+#whoami::./tests/test_throttle.py
+"""Tests for the record throttling."""
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from yaplogger import Log
+from yaplogger.utils import SeverityLevel
+
+
+@pytest.fixture
+def captured() -> Iterator[tuple[Any, list[Any]]]:
+    """Process logger with a sink collecting the records, without throttling once the test is over."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record))
+    yield log, records
+    log.configure_throttling()
+    log.remove_sink(handler_id)
+
+
+def test_rate_limit_per_message_template(captured: tuple[Any, list[Any]]) -> None:
+    """Test that each template gets its own token bucket and suppressed records are counted."""
+    log, records = captured
+    log.configure_throttling(rate=0.001, burst=3)
+    for i in range(10):
+        log.warning("Downstream failed: {}", args=(i,))
+        log.error("Other failure")
+
+    assert [r["message"] for r in records].count("Other failure") == 3
+    assert [r["message"] for r in records if r["message"].startswith("Downstream")] == [
+        "Downstream failed: 0",
+        "Downstream failed: 1",
+        "Downstream failed: 2",
+    ]
+    assert log.suppressed_counts()["rate_limited"] == {"WARNING": 7, "ERROR": 7}
+
+
+def test_rate_limit_per_call_site(captured: tuple[Any, list[Any]]) -> None:
+    """Test that call-site keys tell apart calls sharing a template."""
+    log, records = captured
+    log.configure_throttling(rate=0.001, burst=1, call_site=True)
+    for _ in range(5):
+        log.warning("Same text")
+        log.warning("Same text")
+    assert len(records) == 2
+
+
+def test_async_call_sites_are_told_apart(captured: tuple[Any, list[Any]]) -> None:
+    """Test that the call site of an asynchronous call is its line in the calling task, not the writer thread."""
+    log, records = captured
+    log.configure_throttling(rate=0.001, burst=1, call_site=True)
+
+    async def main() -> None:
+        for _ in range(3):
+            await log.ainfo("first site")
+            await log.ainfo("second site")
+            await log.awarning("third site")
+
+    asyncio.run(main())
+    assert [r["message"] for r in records] == ["first site", "second site", "third site"]
+
+
+def test_deferred_messages_are_rate_limited(captured: tuple[Any, list[Any]]) -> None:
+    """Test that deferred messages built by the same code share a token bucket."""
+    log, records = captured
+    log.configure_throttling(rate=0.001, burst=1)
+    for number in range(3):
+        log.info(lambda number=number: f"Deferred {number}")
+    assert [r["message"] for r in records] == ["Deferred 0"]
+    assert log.suppressed_counts()["rate_limited"] == {"INFO": 2}
+
+
+def test_sampling_per_level(captured: tuple[Any, list[Any]]) -> None:
+    """Test that a level sampled at zero is always suppressed while others pass."""
+    log, records = captured
+    log.configure_throttling(sampling={SeverityLevel.INFO: 0.0})
+    for _ in range(5):
+        log.info("Sampled out")
+        log.warning("Kept")
+    assert [r["message"] for r in records] == ["Kept"] * 5
+    assert log.suppressed_counts()["sampled"] == {"INFO": 5}
+
+
+def test_consecutive_identical_records_are_collapsed(captured: tuple[Any, list[Any]]) -> None:
+    """Test that repeats become a single "repeated N times" record, emitted before the next distinct one."""
+    log, records = captured
+    log.configure_throttling(collapse=True)
+    for _ in range(4):
+        log.error("Connection refused", extra_value="db")
+    log.info("Recovered")
+    log.error("Connection refused", extra_value="db")
+    log.error("Connection refused", extra_value="db")
+    log.configure_throttling()
+
+    assert [(r["level"].name, r["message"], r["extra"]["extra_value"]) for r in records] == [
+        ("ERROR", "Connection refused", "db"),
+        ("ERROR", "Previous message repeated 3 times", "Connection refused"),
+        ("INFO", "Recovered", ""),
+        ("ERROR", "Connection refused", "db"),
+        ("ERROR", "Previous message repeated 1 times", "Connection refused"),
+    ]
+    assert log.suppressed_counts() == {}
+
+
+def test_identical_deferred_messages_are_collapsed(captured: tuple[Any, list[Any]]) -> None:
+    """Test that deferred messages with the same code and captured values collapse, and differing ones do not."""
+    log, records = captured
+    log.configure_throttling(collapse=True)
+    for _ in range(3):
+        log.info(lambda: "Same deferred")
+    for number in range(2):
+        log.info(lambda number=number: f"Deferred {number}")
+    for number in (7, 7):
+        log.info(lambda: f"Captured {number}")  # noqa: B023
+    log.configure_throttling()
+
+    assert [(r["message"], r["extra"]["extra_value"]) for r in records] == [
+        ("Same deferred", ""),
+        ("Previous message repeated 2 times", "test_identical_deferred_messages_are_collapsed.<locals>.<lambda>"),
+        ("Deferred 0", ""),
+        ("Deferred 1", ""),
+        ("Captured 7", ""),
+        ("Previous message repeated 1 times", "test_identical_deferred_messages_are_collapsed.<locals>.<lambda>"),
+    ]
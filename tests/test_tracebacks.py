@@ -0,0 +1,69 @@
+#whoami::./tests/test_tracebacks.py
+"""Tests for the exception rendering modes."""
+from typing import Any
+
+from yaplogger import Log
+from yaplogger.tracebacks import ExceptionRenderer
+from yaplogger.utils import ExceptionRenderMode, SeverityLevel
+
+
+def _failure(attempt: int) -> ValueError:
+    """Raise and catch an exception from always the same place."""
+    try:
+        raise ValueError(f"timeout on attempt {attempt}")  # noqa: TRY301
+    except ValueError as error:
+        return error
+
+
+def test_repeated_exceptions_are_rendered_once() -> None:
+    """Test that a fingerprint is rendered on its first occurrence, then referenced with a count."""
+    renderer = ExceptionRenderer(ExceptionRenderMode.FULL)
+    first = renderer.render(_failure(1))
+    second = renderer.render(_failure(2))
+    other = renderer.render(KeyError("missing"))
+
+    reference = first.splitlines()[0]
+    assert "Traceback (most recent call last)" in first
+    assert first.endswith("ValueError: timeout on attempt 1")
+    assert second == f"ValueError {reference} seen 2 times"
+    assert reference not in other
+
+
+def test_fingerprint_cache_is_bounded() -> None:
+    """Test that an evicted fingerprint is rendered again."""
+    renderer = ExceptionRenderer(ExceptionRenderMode.COMPACT, cache_size=1)
+    first = renderer.render(_failure(1))
+    renderer.render(KeyError("missing"))
+    assert renderer.render(_failure(2)) == first.replace("attempt 1", "attempt 2")
+
+
+def test_critical_modes() -> None:
+    """Test the legacy message mode and the compact mode of critical records."""
+    log = Log(parameters=None)
+    records: list[Any] = []
+    handler_id = log.add_sink(lambda message: records.append(message.record), SeverityLevel.INFO)
+
+    log.critical("Failure", extra_value=_failure(1))
+    log.configure_exceptions(ExceptionRenderMode.COMPACT)
+    log.critical("Failure", extra_value=_failure(2))
+    log.critical("Failure", extra_value=_failure(3))
+    log.configure_exceptions(ExceptionRenderMode.MESSAGE)
+    log.remove_sink(handler_id)
+
+    legacy, compact, repeated = (r["extra"]["exception_message"] for r in records)
+    assert isinstance(legacy, ValueError)
+    assert compact.startswith("ValueError: timeout on attempt 2 at ")
+    assert " in _failure [" in compact
+    assert repeated == f"ValueError {compact[compact.rindex('['):]} seen 2 times"
+
+
+def test_exceptions_never_raised_are_told_apart_by_message() -> None:
+    """Test that exceptions without traceback share a fingerprint only when their message is the same."""
+    renderer = ExceptionRenderer(ExceptionRenderMode.COMPACT)
+    first = renderer.render(ValueError("disk /dev/sdb failed"))
+    other = renderer.render(ValueError("disk /dev/sda failed"))
+    repeated = renderer.render(ValueError("disk /dev/sda failed"))
+
+    assert first.startswith("ValueError: disk /dev/sdb failed [")
+    assert other.startswith("ValueError: disk /dev/sda failed [")
+    assert repeated == f"ValueError {other[other.rindex('['):]} seen 2 times"
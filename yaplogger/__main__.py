@@ -0,0 +1,6 @@
+# whoami::./yaplogger/__main__.py
+"""Run the ``yaplogger`` command line as ``python -m yaplogger``."""
+
+from yaplogger.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,61 @@
+# whoami::./yaplogger/aio.py
+"""Hand-off of the records logged from asyncio code to a writer thread, so the event loop never waits on a sink."""
+
+import asyncio
+import contextvars
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+class AsyncWriter:
+    """Runs logging calls on a single dedicated thread, in the order they were submitted.
+
+    Each call runs within a copy of the submitting task's context, so context variables such as the current
+    execution and step are seen by the writer thread as they were when the call was made. The thread is started
+    on the first call, and a forked child starts its own.
+    """
+
+    def __init__(self) -> None:
+        """Async writer init method."""
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def run(self, call: Callable[..., Any], *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Run a call on the writer thread and wait for it without blocking the event loop."""
+        context = contextvars.copy_context()
+        await asyncio.wrap_future(self._get_executor().submit(context.run, call, *args, **kwargs))
+
+    def drain(self) -> None:
+        """Wait for every submitted call, then stop the writer thread until the next call."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is not None:
+            return executor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yaplogger-async")
+            return self._executor
+
+    def _reset_after_fork(self) -> None:
+        """Forget the writer thread and lock, which do not exist in a forked child."""
+        self._lock = threading.Lock()
+        self._executor = None
+
+
+ASYNC_WRITER = AsyncWriter()
+
+
+def _reset_writer_after_fork() -> None:
+    """Reset the async writer in a forked child."""
+    ASYNC_WRITER._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(after_in_child=_reset_writer_after_fork)
@@ -0,0 +1,156 @@
+# whoami::./yaplogger/cli.py
+"""The ``yaplogger`` command line: tools working on the files written by YapLogger's sinks."""
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, TextIO, cast
+
+from yaplogger.constants import Constants
+from yaplogger.emitter import DISPLAY_LEVELS
+from yaplogger.formatter import CompiledFormatter, format_timestamp
+from yaplogger.index import LogIndex, build_index
+from yaplogger.sinks import BinaryLogReader
+from yaplogger.utils import SeverityLevel
+
+if TYPE_CHECKING:
+    from loguru import Record
+
+    from yaplogger.sinks.binary import BinaryRecord
+
+_LEVEL_CHOICES: list[str] = [level.name for level in SeverityLevel]
+
+
+class _DecodedLevel:
+    """Stands for the level of a loguru record when rendering a decoded record."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def _fields_of(record: "BinaryRecord") -> dict[str, str]:
+    """Record fields with the defaults every YapLogger record carries."""
+    level = SeverityLevel(record.level)
+    return {
+        Constants.PROCESS_UID_KEY: record.process_uid,
+        Constants.PROCESS_NAME_KEY: record.process_name,
+        "display_level": DISPLAY_LEVELS[level],
+        "generated_timestamp": format_timestamp(record.time_us * 1000),
+        "extra_value": "",
+        "exception_message": "",
+        **record.fields,
+    }
+
+
+def _write_text(records: "Iterable[BinaryRecord]", output: TextIO) -> None:
+    """Write decoded records in the default text format, without colors."""
+    formatter = CompiledFormatter(colorize=False)
+    for record in records:
+        decoded = {
+            "message": record.message,
+            "level": _DecodedLevel(SeverityLevel(record.level).name),
+            "extra": _fields_of(record),
+            "exception": None,
+        }
+        output.write(formatter.format(cast("Record", decoded)))
+
+
+def _write_ndjson(records: "Iterable[BinaryRecord]", output: TextIO) -> None:
+    """Write decoded records as NDJSON, with the keys of the NDJSON sink, the process extras decoded as an object."""
+    for record in records:
+        fields = _fields_of(record)
+        document = {
+            Constants.PROCESS_UID_KEY: fields.pop(Constants.PROCESS_UID_KEY),
+            Constants.PROCESS_NAME_KEY: fields.pop(Constants.PROCESS_NAME_KEY),
+            "level": SeverityLevel(record.level).name,
+            "timestamp": fields.pop("generated_timestamp"),
+            "message": record.message,
+            "extra_value": fields.pop("extra_value"),
+            "exception_message": fields.pop("exception_message"),
+            Constants.PROCESS_EXTRAS_KEY: json.loads(fields.pop(Constants.PROCESS_EXTRAS_KEY, "{}")),
+        }
+        fields.pop("display_level")
+        document.update(fields)
+        output.write(json.dumps(document) + "\n")
+
+
+def _decode(arguments: argparse.Namespace, output: TextIO) -> int:
+    """Stream a binary log file out as text or NDJSON."""
+    min_level = SeverityLevel[arguments.min_level]
+    write = _write_ndjson if arguments.format == "ndjson" else _write_text
+    with BinaryLogReader(arguments.file) as reader:
+        write((record for record in reader if record.level >= min_level), output)
+    return 0
+
+
+def _index(arguments: argparse.Namespace, output: TextIO) -> int:
+    """Build the sidecar index of an NDJSON log file."""
+    output.write(f"{build_index(arguments.file)}\n")
+    return 0
+
+
+def _datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date and time, UTC when it carries no offset."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _query(arguments: argparse.Namespace, output: TextIO) -> int:
+    """Write the records of an execution, or of a time window, found through the index of an NDJSON log file."""
+    with LogIndex(arguments.file) as index:
+        if arguments.uid is not None:
+            records = index.execution(arguments.uid)
+        else:
+            since = arguments.since or datetime.fromtimestamp(0, UTC)
+            until = arguments.until or datetime.now(UTC)
+            records = index.window(since, until, SeverityLevel[arguments.min_level])
+        for record in records:
+            output.write(json.dumps(record) + "\n")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the ``yaplogger`` command line."""
+    parser = argparse.ArgumentParser(prog="yaplogger", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    decode = commands.add_parser("decode", help="Decode a binary log file written by BinaryFileSink.")
+    decode.add_argument("file", help="The binary log file.")
+    decode.add_argument("--format", choices=["text", "ndjson"], default="text", help="Output format.")
+    decode.add_argument("--min-level", choices=_LEVEL_CHOICES, default="TRACE", help="Lowest level written.")
+    decode.set_defaults(handler=_decode)
+
+    index = commands.add_parser("index", help="Build the sidecar index of an NDJSON log file.")
+    index.add_argument("file", help="The NDJSON log file.")
+    index.set_defaults(handler=_index)
+
+    query = commands.add_parser("query", help="Find records of an NDJSON log file through its sidecar index.")
+    query.add_argument("file", help="The NDJSON log file, indexed first when it has no index.")
+    selection = query.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--uid", help="Write every record of this process UID.")
+    selection.add_argument("--since", type=_datetime, help="Write the records from this ISO 8601 time on.")
+    query.add_argument("--until", type=_datetime, help="With --since, the end of the time window. Defaults to now.")
+    query.add_argument("--min-level", choices=_LEVEL_CHOICES, default="ERROR", help="With --since, lowest level.")
+    query.set_defaults(handler=_query)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None, output: TextIO | None = None) -> int:
+    """Run the ``yaplogger`` command line.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, ``sys.argv`` when None.
+        output (TextIO | None): Where results are written, ``sys.stdout`` when None.
+
+    Returns:
+        int: The exit status.
+    """
+    arguments = build_parser().parse_args(argv)
+    try:
+        return arguments.handler(arguments, output or sys.stdout)
+    except BrokenPipeError:
+        return 0
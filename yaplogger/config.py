@@ -5,9 +5,8 @@ import time
 import uuid
 from typing import Any, ClassVar
 
-from loguru import logger
-
 from yaplogger.constants import Constants
+from yaplogger.extras import EMPTY_EXTRAS, ProcessExtras, normalize_key
 
 
 class Config:
@@ -26,42 +25,70 @@ class Config:
         Constants.PROCESS_UID_KEY: Constants.PROCESS_UID_DEFAULT_VALUE,
         Constants.PROCESS_NAME_KEY: Constants.PROCESS_NAME_DEFAULT_VALUE,
         Constants.PROCESS_DESCRIPTION_KEY: Constants.DESCRIPTION_DEFAULT_VALUE,
-        Constants.PROCESS_EXTRAS_KEY: [],
+        Constants.PROCESS_EXTRAS_KEY: EMPTY_EXTRAS,
     }
 
     def configure(self, *, parameters: dict[str, Any] | None) -> dict[str, Any]:
         """Configures the application with given settings.
 
         This static method modifies the application's internal configuration based on the provided data.
-        If no configuration is provided, default values will be used. Unrecognized keys will be collected into
-        an extras section for further processing.
+        If no configuration is provided, default values will be used. Unrecognized keys are collected, along with
+        the ``process_extras`` parameter, into the ``ProcessExtras`` mapping bound to every record.
 
         Args:
             parameters (dict[str, Any] | None): A dictionary of configuration settings where keys
             represent configuration names, and the values are their corresponding settings.
             If None, default configuration will be applied.
         """
-        logger.debug(f"Config keys: {parameters.keys() if parameters else []}")
+        self._merge(Config._configuration, parameters)
+        self.__set_process_id()
+        return self.parameters
 
-        if not parameters:
-            logger.debug("No information provided for configuration.")
-            logger.debug("Default values will be applied.")
-
-        else:
-            for k, v in parameters.items():
-                clean_key: str = str(k).lower().strip()
-                logger.debug(f"Validating key: {clean_key}.")
-                if clean_key in self._configuration:
-                    Config._configuration[clean_key] = v
-                    logger.debug(f"Key <{clean_key}> set with value: <{v}>")
-                else:
-                    logger.debug(f"Key '{k}' not found in default configuration, will be added to extras.")
-                    Config._configuration[Constants.PROCESS_EXTRAS_KEY].append({clean_key: v})
+    @classmethod
+    def for_execution(cls, parameters: dict[str, Any] | None) -> dict[str, Any]:
+        """Builds the configuration of an independent execution, leaving the process configuration untouched.
 
-        self.__set_process_id()
-        logger.debug(f"Configuration values: {self.parameters}")
+        The given parameters are validated the same way ``configure`` does, on top of the default values. When no
+        process UID is informed, a random one is generated, so that executions started within the same second
+        under the same name still get distinct identifiers.
 
-        return self.parameters
+        Args:
+            parameters (dict[str, Any] | None): The execution configuration settings.
+
+        Returns:
+            dict[str, Any]: A new dictionary containing the execution configuration.
+        """
+        configuration: dict[str, Any] = {
+            Constants.PROCESS_UID_KEY: Constants.PROCESS_UID_DEFAULT_VALUE,
+            Constants.PROCESS_NAME_KEY: Constants.PROCESS_NAME_DEFAULT_VALUE,
+            Constants.PROCESS_DESCRIPTION_KEY: Constants.DESCRIPTION_DEFAULT_VALUE,
+            Constants.PROCESS_EXTRAS_KEY: EMPTY_EXTRAS,
+        }
+        cls._merge(configuration, parameters)
+        if configuration[Constants.PROCESS_UID_KEY] in (None, "", Constants.PROCESS_UID_DEFAULT_VALUE):
+            configuration[Constants.PROCESS_UID_KEY] = str(uuid.uuid4())
+        return configuration
+
+    @staticmethod
+    def _merge(configuration: dict[str, Any], parameters: dict[str, Any] | None) -> None:
+        """Validates the given parameters into a configuration, collecting unrecognized keys into the extras.
+
+        A ``process_extras`` parameter replaces the extras, then unrecognized keys are added to them, replacing the
+        extras of the same name. The extras are only rebuilt, and so re-encoded, when they change.
+        """
+        if not parameters:
+            return
+
+        unrecognized: dict[str, Any] = {}
+        for k, v in parameters.items():
+            clean_key: str = normalize_key(k)
+            if clean_key == Constants.PROCESS_EXTRAS_KEY:
+                configuration[clean_key] = ProcessExtras.from_parameter(v)
+            elif clean_key in configuration:
+                configuration[clean_key] = v
+            else:
+                unrecognized[clean_key] = v
+        configuration[Constants.PROCESS_EXTRAS_KEY] = configuration[Constants.PROCESS_EXTRAS_KEY].merged(unrecognized)
 
     @classmethod
     def get_process_id(cls) -> str:
@@ -103,8 +130,6 @@ class Config:
             and len(config[Constants.PROCESS_UID_KEY]) > 0
             and config[Constants.PROCESS_UID_KEY] != Constants.PROCESS_UID_DEFAULT_VALUE
         ):
-            logger.debug(f"Process has already set the uid to: {config[Constants.PROCESS_UID_KEY]}")
-            logger.debug("Skipping to generate new process uid.")
             return
 
         unix_epoch_timestamp: int = int(time.time())
@@ -17,6 +17,7 @@ class Constants:
     PROCESS_NAME_KEY: str = "process_name"
     PROCESS_DESCRIPTION_KEY: str = "process_description"
     PROCESS_EXTRAS_KEY: str = "process_extras"
+    WORKER_ID_KEY: str = "worker_id"
 
     # default values
     PROCESS_UID_DEFAULT_VALUE: str = "<not_informed>"
@@ -31,3 +32,4 @@ class Constants:
         " <blue>{extra[extra_value]}</blue>"
         " <level>{extra[exception_message]}</level>"
     )
+    RAW_MESSAGE_FORMAT: str = "{message}"
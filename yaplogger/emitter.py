@@ -0,0 +1,699 @@
+# whoami::./yaplogger/emitter.py
+"""Logging methods shared by every YapLogger logger: level gate, deferred messages and record emission."""
+
+import json
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from yaplogger.aio import ASYNC_WRITER
+from yaplogger.extras import EMPTY_EXTRAS, ProcessExtras
+from yaplogger.formatter import TimestampCache, format_timestamp
+from yaplogger.metrics import LogMetrics
+from yaplogger.recorder import FlightRecorder
+from yaplogger.steps import StepStatistics, StepSummary, StepTimer
+from yaplogger.summary import ExecutionSummary, RecordStatistics
+from yaplogger.throttle import CallSite, Throttle, caller_site
+from yaplogger.tracebacks import ExceptionRenderer
+from yaplogger.utils import ExceptionRenderMode, SeverityLevel
+
+if TYPE_CHECKING:
+    from yaplogger.sinks.buffered import ThreadBufferedSink
+
+type LogMessage = str | Callable[[], str]
+
+DISABLED_LEVEL: int = SeverityLevel.CRITICAL + 1
+DISPLAY_LEVELS: dict[SeverityLevel, str] = {level: level.name.lower() for level in SeverityLevel}
+
+
+def context_fields(
+    process_uid: str | None,
+    process_name: str | None,
+    process_extras: ProcessExtras = EMPTY_EXTRAS,
+) -> dict[str, Any]:
+    """The process context and the default record fields, carried by every record of a logger.
+
+    Args:
+        process_uid (str | None): The process unique identifier written with every record.
+        process_name (str | None): The process name written with every record.
+        process_extras (ProcessExtras): The process extras carried by every record.
+
+    Returns:
+        dict[str, Any]: The record fields, as bound to loguru's logger by ``bind_context``.
+    """
+    return {
+        "process_uid": process_uid,
+        "process_name": process_name,
+        "process_extras": process_extras,
+        "display_level": "",
+        "generated_timestamp": "",
+        "extra_value": "",
+        "exception_message": "",
+    }
+
+
+def bind_context(
+    process_uid: str | None,
+    process_name: str | None,
+    process_extras: ProcessExtras = EMPTY_EXTRAS,
+) -> Any:  # noqa: ANN401
+    """Bind the process context and the default record fields to loguru's logger.
+
+    The extras are bound once here, so every record carries them without any per-call cost.
+
+    Args:
+        process_uid (str | None): The process unique identifier written with every record.
+        process_name (str | None): The process name written with every record.
+        process_extras (ProcessExtras): The process extras carried by every record.
+
+    Returns:
+        Any: The bound loguru logger, sharing the sinks of every other bound logger.
+    """
+    return logger.bind(**context_fields(process_uid, process_name, process_extras))
+
+
+class LogEmitter:
+    """Provides the logging methods on top of a bound loguru logger.
+
+    Every logging method first compares its level with the cached minimum level, so a disabled call returns
+    before any timestamp, binding or message rendering takes place. Subclasses own the bound logger, the cached
+    levels and the timestamp cache.
+
+    Each method has an asynchronous counterpart prefixed with ``a``, e.g. ``ainfo``, for asyncio code: the level
+    gate runs in the calling task, and the rest of the call runs on YapLogger's writer thread, in submission order
+    and within the calling task's context, so no sink write ever blocks the event loop.
+
+    Attributes:
+    ----------
+    parameters : dict[str, Any]
+        The configuration of the logger, process UID included.
+    _logger : Any
+        The bound loguru logger records are emitted through.
+    _min_level : int
+        The lowest severity level accepted by at least one sink or by the flight recorder.
+    _sink_level : int
+        The lowest severity level accepted by at least one sink.
+    _timestamps : TimestampCache
+        Produces the ``generated_timestamp`` field.
+    _step_statistics : StepStatistics
+        Durations of the steps timed through ``step``.
+    _throttle : Throttle | None
+        Rate limiting, sampling and collapsing applied to the records, if configured.
+    _recorder : FlightRecorder | None
+        Keeps the records below the sink level until an error occurs, if configured.
+    _metrics : LogMetrics | None
+        Counts the records and times their emission, when the metrics are enabled.
+    _exceptions : ExceptionRenderer | None
+        Renders the exceptions given to ``critical``, unless only their message is written.
+    _record_statistics : RecordStatistics | None
+        Counts the emitted records per level and message template, unless the summary is disabled.
+    _context : dict[str, Any]
+        The fields bound to ``_logger``, given to the thread buffered sink with every record.
+    _thread_sink : ThreadBufferedSink | None
+        Receives the records directly, without going through loguru, when thread buffering is configured.
+    """
+
+    __slots__ = ()
+
+    parameters: dict[str, Any]
+    _logger: Any
+    _min_level: int
+    _sink_level: int
+    _timestamps: TimestampCache
+    _step_statistics: StepStatistics
+    _throttle: Throttle | None
+    _recorder: FlightRecorder | None
+    _metrics: LogMetrics | None
+    _exceptions: ExceptionRenderer | None
+    _record_statistics: RecordStatistics | None
+    _context: dict[str, Any]
+    _thread_sink: "ThreadBufferedSink | None"
+
+    def configure_throttling(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        sampling: dict[SeverityLevel, float] | None = None,
+        collapse: bool = False,
+        call_site: bool = False,
+    ) -> None:
+        """Rate limit, sample and collapse the records of this logger before they are rendered.
+
+        Calling it without arguments removes the throttling.
+
+        Args:
+            rate (float | None): Records per second allowed per message template, or per calling line.
+            burst (float | None): Records allowed at once per template or line. Defaults to ``rate``.
+            sampling (dict[SeverityLevel, float] | None): Probability, per level, that a record is kept.
+            collapse (bool): Replace consecutive identical records with a single "repeated N times" record.
+            call_site (bool): Rate limit per calling line instead of per message template.
+        """
+        if self._throttle is not None:
+            self._throttle.flush()
+
+        if rate is None and not sampling and not collapse:
+            self._throttle = None
+            return
+
+        self._throttle = Throttle(
+            self._emit_repeated,
+            rate=rate,
+            burst=burst,
+            sampling=sampling,
+            collapse=collapse,
+            call_site=call_site,
+        )
+
+    def suppressed_counts(self) -> dict[str, dict[str, int]]:
+        """Number of records suppressed by the throttling, by reason and level name."""
+        return self._throttle.suppressed_counts() if self._throttle is not None else {}
+
+    def configure_recorder(
+        self,
+        capacity: int = 1_000,
+        *,
+        level: SeverityLevel = SeverityLevel.TRACE,
+        trigger_level: SeverityLevel = SeverityLevel.ERROR,
+    ) -> None:
+        """Keep the last records below the sink level in memory, and write them once an error is logged.
+
+        Records below the level of every sink, down to ``level``, are captured by a flight recorder instead of
+        being discarded. Logging a record at ``trigger_level`` or above, or calling ``dump_recent``, writes the
+        records captured since the previous dump before it. Calling it with a zero capacity removes the recorder.
+
+        Args:
+            capacity (int): Number of records kept in memory; older ones are overwritten.
+            level (SeverityLevel): Minimum severity level captured.
+            trigger_level (SeverityLevel): Severity level from which a logged record dumps the recorder.
+        """
+        self._recorder = FlightRecorder(capacity, level=level, trigger_level=trigger_level) if capacity else None
+        self._set_sink_level(self._sink_level)
+
+    def dump_recent(self, limit: int | None = None, level: SeverityLevel | None = None) -> int:
+        """Write the records captured by the flight recorder since its previous dump, oldest first.
+
+        The records keep their original ``display_level`` and ``generated_timestamp``, and are flagged with
+        ``recorded=True``. They are emitted at ``level``, so that sinks filtering out their own level receive them.
+
+        Args:
+            limit (int | None): Only write the most recent records, up to this number.
+            level (SeverityLevel | None): Severity level the records are emitted at. Defaults to the trigger level.
+
+        Returns:
+            int: The number of records written.
+        """
+        recorder = self._recorder
+        if recorder is None:
+            return 0
+        return self._dump(recorder, level or recorder.trigger_level, limit)
+
+    def configure_exceptions(self, mode: ExceptionRenderMode, *, cache_size: int = 256) -> None:
+        """Choose how the exceptions given to ``critical`` are written in the ``exception_message`` field.
+
+        ``MESSAGE``, the default, writes the exception text. ``COMPACT`` writes a single line with the exception
+        type, text and raising location, and ``FULL`` the whole traceback. In both, exceptions are fingerprinted by
+        type and frame locations, and only the first occurrence of a fingerprint is rendered: later ones write a
+        reference to it and an occurrence count.
+
+        Args:
+            mode (ExceptionRenderMode): The rendering mode.
+            cache_size (int): Number of exception fingerprints remembered.
+        """
+        if mode is ExceptionRenderMode.MESSAGE:
+            self._exceptions = None
+            return
+        self._exceptions = ExceptionRenderer(mode, cache_size)
+
+    def step(self, name: str, level: SeverityLevel = SeverityLevel.DEBUG) -> AbstractContextManager[Any]:
+        """Time a step of the workflow, to be used as ``with log.step("load"):``.
+
+        Steps entered within a step are nested under it, e.g. ``load/parse``. Start and end records are logged at
+        the given level and the duration is added to the step statistics. The step is timed even when its level is
+        disabled: only its records are skipped, so the step statistics cover every step.
+
+        Args:
+            name (str): The step name.
+            level (SeverityLevel): The severity level of the start and end records.
+
+        Returns:
+            AbstractContextManager[Any]: The step context manager.
+        """
+        return StepTimer(self, self._step_statistics, name, level)
+
+    def step_summary(self) -> dict[str, StepSummary]:
+        """Aggregate durations of every step timed so far: count, total, p50, p95 and max."""
+        return self._step_statistics.summary()
+
+    def log_step_summary(self, level: SeverityLevel = SeverityLevel.INFO) -> None:
+        """Log one record per timed step with its aggregate durations."""
+        for step_id, summary in self.step_summary().items():
+            self.log(
+                level,
+                "Step summary",
+                extra_value=(
+                    f"{step_id}: count={summary.calls} total={summary.total_ms:.3f} ms p50={summary.p50_ms:.3f} ms "
+                    f"p95={summary.p95_ms:.3f} ms max={summary.max_ms:.3f} ms"
+                ),
+            )
+
+    def execution_summary(self) -> ExecutionSummary | None:
+        """Records emitted so far per level, noisiest message templates and wall time, None when disabled."""
+        statistics = self._record_statistics
+        return statistics.summary() if statistics is not None else None
+
+    def log_execution_summary(self, level: SeverityLevel = SeverityLevel.INFO) -> None:
+        """Log one record carrying the execution summary as a compact JSON object in ``extra_value``."""
+        summary = self.execution_summary()
+        if summary is not None:
+            self.log(level, "Execution summary", json.dumps(summary.as_dict(), separators=(",", ":")))
+
+    def log(
+        self,
+        level: SeverityLevel,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Log with the severity level given as argument."""
+        if level < self._min_level:
+            if self._metrics is not None:
+                self._metrics.record_filtered(level)
+            return
+        if level is SeverityLevel.CRITICAL:
+            self._log(level, message, exception_message=extra_value, extra_value=None, args=args, **kwargs)
+            return
+        self._log(level, message, extra_value, args=args, **kwargs)
+
+    def replay(self, level: SeverityLevel, message: str, **fields: Any) -> None:  # noqa: ANN401
+        """Emit an already rendered record, such as one received from a worker process.
+
+        The record keeps the fields it was produced with, its ``generated_timestamp`` included, and the message is
+        written as is, without being formatted again.
+
+        Args:
+            level (SeverityLevel): The record severity level.
+            message (str): The rendered message.
+            **fields: Record fields overriding the ones bound to this logger.
+        """
+        if level < self._sink_level:
+            return
+        self._logger.bind(**fields).log(level.name, message)
+        if self._thread_sink is not None:
+            self._buffer(level, message, (), {}, fields)
+
+    def is_enabled(self, level: SeverityLevel) -> bool:
+        """Tells whether a record with the given severity level would reach a sink or the flight recorder."""
+        return level >= self._min_level
+
+    def _log(
+        self,
+        level: SeverityLevel,
+        message: LogMessage,
+        extra_value: str | None,
+        exception_message: str | Exception | None = None,
+        args: tuple[Any, ...] = (),
+        call_site: CallSite | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Unique point to apply changes and log.
+
+        The public logging methods check the level gate before calling this method, so everything done here
+        is paid only by records that will be emitted or recorded. Records below the sink level are handed over
+        to the flight recorder as they are. The throttling, when configured, runs before the message is rendered.
+        Deferred messages are resolved at this point: a callable is invoked to produce the message, while a
+        ``"{}"`` template is handed over to loguru together with ``args`` and only formatted by it.
+
+        The call site, needed by call-site throttling, is the caller of the public method calling this one, unless
+        given: the asynchronous methods find it in the calling task, since this method then runs on another thread.
+        """
+        recorder = self._recorder
+        if level < self._sink_level:
+            if recorder is not None:
+                recorder.capture(level, message, args, extra_value or exception_message, kwargs)
+            if self._metrics is not None:
+                self._metrics.record_filtered(level)
+            return
+
+        throttle = self._throttle
+        if throttle is not None:
+            if call_site is None and throttle.call_site:
+                call_site = caller_site(2)
+            if not throttle.admit(level, message, args, extra_value, call_site):
+                if self._metrics is not None:
+                    self._metrics.record_filtered(level)
+                return
+
+        if recorder is not None and level >= recorder.trigger_level:
+            self._dump(recorder, level, None)
+
+        if callable(message):
+            message = message()
+
+        self._emit(level, message, extra_value, exception_message, args, kwargs)
+
+    def _set_sink_level(self, sink_level: int) -> None:
+        """Cache the lowest level accepted by the sinks, and the level gate including the flight recorder."""
+        self._sink_level = sink_level
+        recorder = self._recorder
+        self._min_level = min(sink_level, recorder.level) if recorder is not None else sink_level
+
+    def _dump(self, recorder: FlightRecorder, level: SeverityLevel, limit: int | None) -> int:
+        """Emit the entries taken from the flight recorder at the given level."""
+        entries = recorder.dump(limit)
+        for entry in entries:
+            message = entry.message() if callable(entry.message) else entry.message
+            fields = {
+                "display_level": DISPLAY_LEVELS[entry.level],
+                "generated_timestamp": format_timestamp(entry.time_ns),
+                "extra_value": entry.extra_value or "",
+                "recorded": True,
+            }
+            self._logger.log(level.name, message, *entry.args, **(entry.kwargs or {}), **fields)
+            if self._thread_sink is not None:
+                self._buffer(level, message, entry.args, entry.kwargs or {}, fields)
+        return len(entries)
+
+    def _emit_repeated(self, level: SeverityLevel, count: int, message: Any) -> None:  # noqa: ANN401
+        """Emit the record standing for the collapsed repetitions of a message."""
+        template = message if isinstance(message, str) else getattr(message, "__qualname__", repr(message))
+        self._emit(level, "Previous message repeated {} times", template, None, (count,), {})
+
+    def _emit(
+        self,
+        level: SeverityLevel,
+        message: str,
+        extra_value: Any,  # noqa: ANN401
+        exception_message: str | Exception | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Hand a record over to loguru, timing its emission when the metrics are enabled."""
+        statistics = self._record_statistics
+        if statistics is not None:
+            statistics.record(level, message)
+
+        metrics = self._metrics
+        if metrics is None:
+            self._write(level, message, extra_value, exception_message, args, kwargs)
+            return
+
+        start = time.perf_counter_ns()
+        self._write(level, message, extra_value, exception_message, args, kwargs)
+        metrics.record_emitted(level, time.perf_counter_ns() - start, exception=bool(exception_message))
+
+    def _write(
+        self,
+        level: SeverityLevel,
+        message: str,
+        extra_value: Any,  # noqa: ANN401
+        exception_message: str | Exception | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Hand a record over to loguru with the timestamp and display fields, and to the thread buffered sink."""
+        now: str = self._timestamps.now()
+
+        renderer = self._exceptions
+        if renderer is not None and isinstance(exception_message, BaseException):
+            exception_message = renderer.render(exception_message)
+
+        if exception_message:
+            self._logger.log(
+                level.name,
+                message,
+                *args,
+                **kwargs,
+                display_level=DISPLAY_LEVELS[level],
+                generated_timestamp=now,
+                exception_message=exception_message,
+            )
+        elif extra_value:
+            self._logger.log(
+                level.name,
+                message,
+                *args,
+                **kwargs,
+                display_level=DISPLAY_LEVELS[level],
+                generated_timestamp=now,
+                extra_value=extra_value,
+            )
+        else:
+            self._logger.log(
+                level.name,
+                message,
+                *args,
+                **kwargs,
+                display_level=DISPLAY_LEVELS[level],
+                generated_timestamp=now,
+            )
+
+        if self._thread_sink is not None:
+            fields: dict[str, Any] = {"display_level": DISPLAY_LEVELS[level], "generated_timestamp": now}
+            if exception_message:
+                fields["exception_message"] = exception_message
+            elif extra_value:
+                fields["extra_value"] = extra_value
+            self._buffer(level, message, args, kwargs, fields)
+
+    def _buffer(
+        self,
+        level: SeverityLevel,
+        message: Any,  # noqa: ANN401
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        fields: dict[str, Any],
+    ) -> None:
+        """Hand a record over to the thread buffered sink, with its message and fields as loguru would make them.
+
+        It runs after the record went through loguru, so that a lazily started logger announces itself first.
+        """
+        sink = self._thread_sink
+        if sink is None or level < sink.level:
+            return
+        text = message.format(*args, **kwargs) if args or kwargs else str(message)
+        sink.emit(level, text, {**self._context, **kwargs, **fields})
+
+    def trace(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated trace method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.TRACE:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.TRACE)
+            return
+        self._log(SeverityLevel.TRACE, message, args=args, **kwargs, extra_value=extra_value)
+
+    def debug(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated debug method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.DEBUG:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.DEBUG)
+            return
+        self._log(SeverityLevel.DEBUG, message, args=args, **kwargs, extra_value=extra_value)
+
+    def info(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated info method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.INFO:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.INFO)
+            return
+        self._log(SeverityLevel.INFO, message, extra_value, args=args, **kwargs)
+
+    def success(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated success method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.SUCCESS:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.SUCCESS)
+            return
+        self._log(SeverityLevel.SUCCESS, message, args=args, **kwargs, extra_value=extra_value)
+
+    def warning(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated warning method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.WARNING:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.WARNING)
+            return
+        self._log(SeverityLevel.WARNING, message, args=args, **kwargs, extra_value=extra_value)
+
+    def error(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated error method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.ERROR:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.ERROR)
+            return
+        self._log(SeverityLevel.ERROR, message, args=args, **kwargs, extra_value=extra_value)
+
+    def critical(
+        self,
+        message: LogMessage,
+        extra_value: str | Exception | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Encapsulated critical method with automatic UID inclusion."""
+        if self._min_level > SeverityLevel.CRITICAL:
+            if self._metrics is not None:
+                self._metrics.record_filtered(SeverityLevel.CRITICAL)
+            return
+        self._log(SeverityLevel.CRITICAL, message, exception_message=extra_value, extra_value=None, args=args, **kwargs)
+
+    async def alog(
+        self,
+        level: SeverityLevel,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronously log with the severity level given as argument."""
+        if level is SeverityLevel.CRITICAL:
+            await self._alog(level, message, None, extra_value, args, kwargs, self._call_site())
+            return
+        await self._alog(level, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def atrace(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous trace method, never blocking the event loop."""
+        await self._alog(SeverityLevel.TRACE, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def adebug(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous debug method, never blocking the event loop."""
+        await self._alog(SeverityLevel.DEBUG, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def ainfo(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous info method, never blocking the event loop."""
+        await self._alog(SeverityLevel.INFO, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def asuccess(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous success method, never blocking the event loop."""
+        await self._alog(SeverityLevel.SUCCESS, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def awarning(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous warning method, never blocking the event loop."""
+        await self._alog(SeverityLevel.WARNING, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def aerror(
+        self,
+        message: LogMessage,
+        extra_value: str | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous error method, never blocking the event loop."""
+        await self._alog(SeverityLevel.ERROR, message, extra_value, None, args, kwargs, self._call_site())
+
+    async def acritical(
+        self,
+        message: LogMessage,
+        extra_value: str | Exception | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Asynchronous critical method, never blocking the event loop."""
+        await self._alog(SeverityLevel.CRITICAL, message, None, extra_value, args, kwargs, self._call_site())
+
+    async def _alog(
+        self,
+        level: SeverityLevel,
+        message: LogMessage,
+        extra_value: str | None,
+        exception_message: str | Exception | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call_site: CallSite | None,
+    ) -> None:
+        """Check the level gate in the calling task, then run ``_log`` on the writer thread."""
+        if level < self._min_level:
+            if self._metrics is not None:
+                self._metrics.record_filtered(level)
+            return
+        await ASYNC_WRITER.run(self._log, level, message, extra_value, exception_message, args, call_site, **kwargs)
+
+    def _call_site(self) -> CallSite | None:
+        """Call site of the caller of the public method calling this one, when the throttling needs it."""
+        throttle = self._throttle
+        return caller_site(2) if throttle is not None and throttle.call_site else None
@@ -0,0 +1,99 @@
+# whoami::./yaplogger/extras.py
+"""Process extras: the free-form key/value pairs of a configuration, carried by every record."""
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+
+class ProcessExtras(Mapping[str, Any]):
+    """Immutable mapping of the process extras, with its JSON encoding cached.
+
+    Keys are normalized like the configuration keys, lowercased and stripped, so the same extra given twice keeps its
+    last value instead of accumulating. Instances are never modified: a configuration change builds a new instance,
+    so the JSON encoding is computed once per configuration, on first use, and shared by every record and sink.
+    """
+
+    __slots__ = ("_encoded", "_values")
+
+    def __init__(self, values: Mapping[str, Any] | None = None) -> None:
+        """Process extras init method.
+
+        Args:
+            values (Mapping[str, Any] | None): The extras, keyed by name.
+        """
+        self._values: dict[str, Any] = {normalize_key(key): value for key, value in (values or {}).items()}
+        self._encoded: str | None = None
+
+    @classmethod
+    def from_parameter(cls, value: Any) -> "ProcessExtras":  # noqa: ANN401
+        """Validate the ``process_extras`` parameter of a configuration.
+
+        Args:
+            value (Any): ``None``, a mapping, or an iterable of mappings such as the single-key dicts accepted by
+                earlier versions, merged in order.
+
+        Returns:
+            ProcessExtras: The validated extras.
+
+        Raises:
+            TypeError: When the value is neither a mapping nor an iterable of mappings.
+        """
+        if value is None or isinstance(value, ProcessExtras):
+            return value or EMPTY_EXTRAS
+        if isinstance(value, Mapping):
+            return cls(value)  # pyright: ignore[reportUnknownArgumentType]
+        if isinstance(value, Iterable) and not isinstance(value, str | bytes):
+            merged: dict[str, Any] = {}
+            for item in value:  # pyright: ignore[reportUnknownVariableType]
+                if not isinstance(item, Mapping):
+                    msg = f"process extras must be mappings, got {type(item).__name__}"  # pyright: ignore[reportUnknownArgumentType]
+                    raise TypeError(msg)
+                merged.update(item)  # pyright: ignore[reportUnknownArgumentType]
+            return cls(merged)
+        msg = f"process extras must be a mapping, got {type(value).__name__}"
+        raise TypeError(msg)
+
+    def merged(self, updates: Mapping[str, Any]) -> "ProcessExtras":
+        """Return new extras with the given ones added, replacing those with the same key."""
+        if not updates:
+            return self
+        return ProcessExtras({**self._values, **updates})
+
+    @property
+    def encoded(self) -> str:
+        """The extras encoded as a JSON object."""
+        if self._encoded is None:
+            self._encoded = json.dumps(self._values, default=str)
+        return self._encoded
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        """Return the value of an extra."""
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the extras names."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """Return the number of extras."""
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        """Represent the extras as their mapping."""
+        return f"ProcessExtras({self._values!r})"
+
+
+def normalize_key(key: Any) -> str:  # noqa: ANN401
+    """Normalize a configuration key, lowercased and stripped."""
+    return str(key).lower().strip()
+
+
+def encode_extras(value: Any) -> str:  # noqa: ANN401
+    """Encode extras as a JSON object, reusing the cached encoding of ``ProcessExtras``."""
+    if isinstance(value, ProcessExtras):
+        return value.encoded
+    return json.dumps(value if value is not None else {}, default=str)
+
+
+EMPTY_EXTRAS: ProcessExtras = ProcessExtras()
@@ -0,0 +1,187 @@
+# whoami::./yaplogger/formatter.py
+"""Compiled rendering of YapLogger's text format and cached timestamps."""
+
+import re
+import string
+import time
+import traceback
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from yaplogger.constants import Constants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from loguru import Record
+
+_STYLES: dict[str, int] = {
+    "bold": 1,
+    "dim": 2,
+    "italic": 3,
+    "underline": 4,
+    "blink": 5,
+    "reverse": 7,
+    "hide": 8,
+    "strike": 9,
+    "normal": 22,
+}
+_COLORS: dict[str, int] = {
+    "black": 0,
+    "red": 1,
+    "green": 2,
+    "yellow": 3,
+    "blue": 4,
+    "magenta": 5,
+    "cyan": 6,
+    "white": 7,
+}
+_RESET: str = "\033[0m"
+_TAG_PATTERN = re.compile(r"<(/?)([a-zA-Z-]*)>")
+
+
+def _ansi_code(tag: str) -> str:
+    """Translate a loguru markup tag into its ANSI escape sequence, exactly as loguru would."""
+    if tag in _STYLES:
+        return f"\033[{_STYLES[tag]}m"
+
+    light = tag.lower().startswith("light-")
+    color = tag.lower().removeprefix("light-")
+    if color not in _COLORS:
+        msg = f"Unsupported markup tag in format: <{tag}>."
+        raise ValueError(msg)
+
+    base = 40 if tag.isupper() else 30
+    return f"\033[{base + _COLORS[color] + (60 if light else 0)}m"
+
+
+def format_timestamp(time_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as the ``generated_timestamp`` string, ``YYYY-MM-DD HH:MM:SS.mmm`` in UTC."""
+    second, remainder = divmod(time_ns // 1_000_000, 1000)
+    return f"{datetime.fromtimestamp(second, UTC).strftime('%Y-%m-%d %H:%M:%S.')}{remainder:03d}"
+
+
+class TimestampCache:
+    """Produces the ``generated_timestamp`` string, reusing it while the clock stays within the same millisecond.
+
+    The date and time part is formatted once per second; within a second only the milliseconds are appended. The
+    last results are stored as tuples, so concurrent callers always read a consistent pair.
+
+    With the monotonic clock, the time is the wall clock time read once, advanced by the monotonic clock, so the
+    timestamps taken by a thread never go backwards, even when the system clock is adjusted.
+    """
+
+    __slots__ = ("_last", "_offset_ns", "_second")
+
+    def __init__(self) -> None:
+        """Timestamp cache init method."""
+        self._last: tuple[int, str] = (-1, "")
+        self._second: tuple[int, str] = (-1, "")
+        self._offset_ns: int | None = None
+
+    def use_monotonic_clock(self, *, enabled: bool = True) -> None:
+        """Derive the timestamps from the monotonic clock, anchored to the current wall clock time, or stop."""
+        self._offset_ns = time.time_ns() - time.monotonic_ns() if enabled else None
+
+    def now(self) -> str:
+        """Current UTC time as ``YYYY-MM-DD HH:MM:SS.mmm``."""
+        offset = self._offset_ns
+        millis = (time.time_ns() if offset is None else offset + time.monotonic_ns()) // 1_000_000
+        last_millis, last_text = self._last
+        if millis == last_millis:
+            return last_text
+
+        second, remainder = divmod(millis, 1000)
+        cached_second, prefix = self._second
+        if second != cached_second:
+            prefix = datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%d %H:%M:%S.")
+            self._second = (second, prefix)
+
+        text = f"{prefix}{remainder:03d}"
+        self._last = (millis, text)
+        return text
+
+
+class CompiledFormatter:
+    """Renders loguru records with a format compiled once, instead of through loguru's formatting machinery.
+
+    The markup of the format is resolved ahead of time into one template per level, with the ``<level>`` tags
+    replaced by that level's ANSI codes, or with every tag removed when colors are disabled. Rendering a record is
+    then a single ``format_map`` over the record, whose output is byte-identical to loguru's for the same format.
+
+    Exceptions attached to the record through ``logger.opt(exception=...)`` are rendered with the standard
+    ``traceback`` module, since loguru's ``diagnose`` output is not reproduced.
+    """
+
+    def __init__(self, fmt: str = Constants.STDOUT_DEFAULT_FORMAT, *, colorize: bool = True) -> None:
+        """Compiled formatter init method.
+
+        Args:
+            fmt (str): A loguru format string, markup tags included.
+            colorize (bool): Whether to translate the markup into ANSI codes or strip it.
+        """
+        self._fields, self._literals = self._split(fmt)
+        self._colorize = colorize
+        self._renderers: dict[str, Callable[[Record], str]] = {}
+
+    def format(self, record: "Record") -> str:
+        """Render a record as a line of text, newline included."""
+        level_name = record["level"].name
+        render = self._renderers.get(level_name)
+        if render is None:
+            render = self._compile(level_name)
+
+        text = render(record)
+        exception = record["exception"]
+        if exception is not None:
+            text += "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        return text
+
+    @staticmethod
+    def _split(fmt: str) -> tuple[list[str], list[str]]:
+        """Split a format into its replacement fields and the literal texts preceding each of them."""
+        fields: list[str] = []
+        literals: list[str] = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(fmt):
+            literals.append(literal)
+            if field_name is None:
+                continue
+            field = field_name + (f"!{conversion}" if conversion else "") + (f":{format_spec}" if format_spec else "")
+            fields.append("{" + field + "}")
+        return fields, literals
+
+    def _compile(self, level_name: str) -> "Callable[[Record], str]":
+        """Build and cache the renderer of a level."""
+        level_codes: list[str] = []
+        if self._colorize:
+            level_codes = [_ansi_code(tag) for _, tag in _TAG_PATTERN.findall(logger.level(level_name).color)]
+
+        opened: list[str] = []
+        parts: list[str] = []
+        for index, literal in enumerate(self._literals):
+            parts.append(self._resolve_markup(literal, opened, level_codes).replace("{", "{{").replace("}", "}}"))
+            if index < len(self._fields):
+                parts.append(self._fields[index])
+        parts.append("\n")
+
+        render = "".join(parts).format_map
+        self._renderers[level_name] = render
+        return render
+
+    def _resolve_markup(self, literal: str, opened: list[str], level_codes: list[str]) -> str:
+        """Replace the markup tags of a literal text, tracking the tags still open across literals."""
+
+        def replace(match: re.Match[str]) -> str:
+            closing, tag = match.groups()
+            if closing:
+                if opened:
+                    opened.pop()
+                return _RESET + "".join(opened) if self._colorize else ""
+
+            code = "".join(level_codes) if tag == "level" else _ansi_code(tag) if self._colorize else ""
+            opened.append(code)
+            return code
+
+        return _TAG_PATTERN.sub(replace, literal)
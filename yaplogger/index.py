@@ -0,0 +1,290 @@
+# whoami::./yaplogger/index.py
+"""Sidecar index of NDJSON log files, mapping process UID, level and time to line offsets, and its queries."""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+from yaplogger.constants import Constants
+from yaplogger.utils import SeverityLevel
+
+INDEX_SUFFIX: str = ".idx"
+MAGIC: bytes = b"YAPI"
+VERSION: int = 1
+
+_HEADER = struct.Struct("<4sB3x")
+_ENTRY = struct.Struct("<8sQIB")
+_SECOND_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+_TIMESTAMP_FORMAT: str = "%Y-%m-%d %H:%M:%S.%f"
+_SECOND_LENGTH: int = 19
+
+
+def index_path(path: str | Path) -> Path:
+    """Path of the sidecar index of a log file."""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def uid_key(process_uid: str) -> bytes:
+    """The 8-byte digest of a process UID stored in the index entries."""
+    return hashlib.blake2b(process_uid.encode(), digest_size=8).digest()
+
+
+class IndexWriter:
+    """Appends the entries of a sidecar index, one per log line.
+
+    The index starts with an 8-byte header, the ``YAPI`` magic and the format version, followed by fixed-size
+    entries packed as ``<8sQIB``: the digest of the record process UID, the offset of its line in the log file,
+    its time bucket in seconds since the epoch and its ``SeverityLevel`` value. Entries are fixed-size so that the
+    index can be searched in place, and the digest comes first so that the entries of a process UID are found with
+    a plain byte search.
+
+    The time bucket is read from the record ``timestamp``, so the live index and one built from the file agree.
+    Entries are buffered and appended whole, in a single write, so that processes sharing an index never split
+    each other's entries, and are therefore not necessarily in the order of the log lines.
+    """
+
+    def __init__(self, path: str | Path, buffer_size: int = 1 << 16) -> None:
+        """Index writer init method.
+
+        Args:
+            path (str | Path): The index file, created with its header when missing, appended to otherwise.
+            buffer_size (int): Size, in bytes, of the write buffer.
+        """
+        self._path = Path(path)
+        self._buffer_size = buffer_size
+        self._file = self._path.open("ab", buffering=0)
+        self._buffer = bytearray() if self._file.tell() else bytearray(_HEADER.pack(MAGIC, VERSION))
+        self._last_uid = ""
+        self._last_key = uid_key("")
+        self._last_second = ""
+        self._last_bucket = 0
+
+    @property
+    def path(self) -> Path:
+        """The index file."""
+        return self._path
+
+    def add(self, process_uid: str, offset: int, timestamp: str, level: int) -> None:
+        """Append the entry of a log line, given the ``timestamp`` of its record."""
+        if process_uid != self._last_uid:
+            self._last_uid = process_uid
+            self._last_key = uid_key(process_uid)
+        second = timestamp[:_SECOND_LENGTH]
+        if second != self._last_second:
+            self._last_second = second
+            self._last_bucket = _parse_second(second)
+        self._buffer += _ENTRY.pack(self._last_key, offset, self._last_bucket, level)
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the buffered entries to the index file."""
+        if not self._buffer or self._file.closed:
+            return
+        chunk = memoryview(self._buffer)
+        while chunk:
+            chunk = chunk[self._file.write(chunk) :]
+        self._buffer = bytearray()
+
+    def reopen(self) -> None:
+        """Reopen the index file, as a forked child does to stop sharing the parent's open file."""
+        self._file.close()
+        self._file = self._path.open("ab", buffering=0)
+
+    def close(self) -> None:
+        """Flush and close the index file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _parse_second(value: str) -> int:
+    """Seconds since the epoch of the ``YYYY-MM-DD HH:MM:SS`` part of a ``timestamp``, 0 when it cannot be parsed."""
+    try:
+        return int(datetime.strptime(value, _SECOND_FORMAT).replace(tzinfo=UTC).timestamp())
+    except ValueError:
+        return 0
+
+
+def _parse_time(value: Any) -> float | None:  # noqa: ANN401
+    """Seconds since the epoch of a ``timestamp``, None when it cannot be parsed."""
+    try:
+        return datetime.strptime(str(value), _TIMESTAMP_FORMAT).replace(tzinfo=UTC).timestamp()
+    except ValueError:
+        return None
+
+
+def build_index(path: str | Path) -> Path:
+    """Build the sidecar index of an existing NDJSON log file, replacing any previous one.
+
+    Args:
+        path (str | Path): The NDJSON log file.
+
+    Returns:
+        Path: The index file.
+    """
+    target = index_path(path)
+    temporary = target.with_name(target.name + ".tmp")
+    temporary.unlink(missing_ok=True)
+    writer = IndexWriter(temporary, buffer_size=1 << 20)
+    offset = 0
+    with Path(path).open("rb") as log_file:
+        for line in log_file:
+            try:
+                document: dict[str, Any] = json.loads(line)
+            except ValueError:
+                offset += len(line)
+                continue
+            level = SeverityLevel.__members__.get(str(document.get("level")))
+            writer.add(
+                str(document.get(Constants.PROCESS_UID_KEY, "")),
+                offset,
+                str(document.get("timestamp", "")),
+                level.value if level is not None else 0,
+            )
+            offset += len(line)
+    writer.close()
+    temporary.replace(target)
+    return target
+
+
+class LogIndex:
+    """Queries an NDJSON log file through its sidecar index, to be used as ``with LogIndex(path) as index:``.
+
+    Both files are memory-mapped. The entries of a process UID are found by searching the index for the digest
+    of the UID, and the entries of a time window by scanning the fixed-size entries, since records replayed from
+    the flight recorder, forwarded by workers or written by other processes are not in time order. Only the
+    matching lines of the log file are then read and parsed, in file order, and lines whose process UID does not
+    match exactly, on a digest collision, are skipped.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Log index init method.
+
+        Args:
+            path (str | Path): The NDJSON log file. Its index is built first when missing.
+
+        Raises:
+            ValueError: If the index file is not a YapLogger index of a supported version.
+        """
+        self._path = Path(path)
+        if not index_path(self._path).exists():
+            build_index(self._path)
+
+        self._log_file = self._path.open("rb")
+        self._index_file = index_path(self._path).open("rb")
+        self._log = self._map(self._log_file)
+        self._index = self._map(self._index_file)
+
+        if self._index is None or _HEADER.unpack_from(self._index, 0) != (MAGIC, VERSION):
+            self.close()
+            msg = f"Unsupported index file: {index_path(self._path)}."
+            raise ValueError(msg)
+        self._count = (len(self._index) - _HEADER.size) // _ENTRY.size
+
+    def __enter__(self) -> Self:
+        """Return the index."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the memory maps and the files."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of indexed lines."""
+        return self._count
+
+    def close(self) -> None:
+        """Close the memory maps and the files."""
+        for data in (self._log, self._index):
+            if data is not None:
+                data.close()
+        self._log = self._index = None
+        self._log_file.close()
+        self._index_file.close()
+
+    def execution(self, process_uid: str) -> Iterator[dict[str, Any]]:
+        """Records of one execution, in file order."""
+        index = self._index
+        if index is None:
+            return
+
+        key = uid_key(process_uid)
+        offsets: list[int] = []
+        position = index.find(key, _HEADER.size)
+        while position != -1:
+            if (position - _HEADER.size) % _ENTRY.size:
+                position = index.find(key, position + 1)
+                continue
+            offsets.append(_ENTRY.unpack_from(index, position)[1])
+            position = index.find(key, position + _ENTRY.size)
+
+        for offset in sorted(offsets):
+            record = self._read(offset)
+            if record is not None and record.get(Constants.PROCESS_UID_KEY) == process_uid:
+                yield record
+
+    def window(
+        self,
+        start: datetime,
+        end: datetime,
+        min_level: SeverityLevel = SeverityLevel.ERROR,
+    ) -> Iterator[dict[str, Any]]:
+        """Records of at least the given level whose time falls within ``[start, end]``, in file order.
+
+        The index only holds the second of each record, so the records of the first and last seconds of the window
+        are checked against their exact ``timestamp`` once read.
+        """
+        index = self._index
+        if index is None:
+            return
+
+        start_time, end_time = start.timestamp(), end.timestamp()
+        first_bucket, last_bucket = int(start_time), int(end_time)
+        with memoryview(index) as view, view[_HEADER.size : _HEADER.size + self._count * _ENTRY.size] as entries:
+            matches = sorted(
+                (offset, bucket)
+                for _, offset, bucket, level in _ENTRY.iter_unpack(entries)
+                if level >= min_level and first_bucket <= bucket <= last_bucket
+            )
+
+        for offset, bucket in matches:
+            record = self._read(offset)
+            if record is None:
+                continue
+            if bucket in (first_bucket, last_bucket):
+                record_time = _parse_time(record.get("timestamp"))
+                if record_time is None or not start_time <= record_time <= end_time:
+                    continue
+            yield record
+
+    def _read(self, offset: int) -> dict[str, Any] | None:
+        """Parse the log line starting at the given offset, None when it is missing or not valid JSON."""
+        data = self._log
+        if data is None or offset >= len(data):
+            return None
+        end = data.find(b"\n", offset)
+        try:
+            return json.loads(data[offset : end if end != -1 else len(data)])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _map(file: BinaryIO) -> mmap.mmap | None:
+        """Memory-map a whole file for reading, None when it is empty."""
+        if not os.fstat(file.fileno()).st_size:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
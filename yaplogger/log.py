@@ -1,25 +1,83 @@
 # whoami::./yaplogger/log.py
 """Instantiate, configure and retrieve the log handler from YapLogger."""
 
+# ``singleton`` turns ``Log`` into a function, so pyright no longer sees it as a subclass of ``LogEmitter`` and would
+# report every use of the emitter's protected members made here.
+# pyright: reportPrivateUsage=false
+
+import atexit
+import contextlib
+import functools
 import sys
-from datetime import UTC, datetime
-from typing import Any
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 from loguru import logger
 
+from yaplogger.aio import ASYNC_WRITER
 from yaplogger.config import Config
 from yaplogger.constants import Constants
-from yaplogger.utils import SeverityLevel, singleton
+from yaplogger.emitter import DISABLED_LEVEL, LogEmitter, context_fields
+from yaplogger.formatter import CompiledFormatter, TimestampCache
+from yaplogger.metrics import LogMetrics, LogStats, MeasuredSink, MetricsExporter, measure_sink
+from yaplogger.registry import ExecutionLog, ExecutionScope, LogRegistry, current_execution
+from yaplogger.sinks.background import BackgroundSink
+from yaplogger.sinks.stream import TextStreamSink
+from yaplogger.steps import StepStatistics
+from yaplogger.summary import RecordStatistics
+from yaplogger.utils import (
+    ExceptionRenderMode,
+    FormatterEngine,
+    MetricsFormat,
+    OverflowPolicy,
+    SeverityLevel,
+    singleton,
+)
+
+if TYPE_CHECKING:
+    from yaplogger.sinks.buffered import ThreadBufferedSink
+    from yaplogger.sinks.router import SinkRoute, SinkRouter
+
+
+class _DeferredStart:
+    """Stands for the bound loguru logger of a lazily started ``Log`` until its first record.
+
+    Every record of a ``Log`` goes through ``log`` or ``bind`` of its bound logger, so the first call made on this
+    placeholder starts the logger, which replaces it with the real bound logger, and is then forwarded to it.
+    """
+
+    __slots__ = ("_start",)
+
+    def __init__(self, start: Callable[[], Any]) -> None:
+        """Deferred start init method.
+
+        Args:
+            start (Callable[[], Any]): Starts the logger and returns its bound loguru logger.
+        """
+        self._start = start
+
+    def log(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Start the logger, then log through its bound logger."""
+        self._start().log(*args, **kwargs)
+
+    def bind(self, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Start the logger, then bind through its bound logger."""
+        return self._start().bind(**kwargs)
 
 
 @singleton
-class Log:
+class Log(LogEmitter):
     """Provides a logging class for application-wide logging functionality.
 
     The Log class configures the Loguru logger with specified parameters
     and ensures the logger is available for consistent usage throughout
     the application. It initializes logging configuration and provides a
     customized sink for proper formatting and output of log messages.
+    Built with ``lazy=True``, it only creates that sink, and announces the
+    process, when the first record is emitted.
 
     Attributes:
     ----------
@@ -27,29 +85,130 @@ class Log:
         A dictionary containing the logging parameters for configuration.
     logger : Any
         The Loguru Logger instance used for logging operations.
+    registry : LogRegistry
+        The loggers of independent executions sharing this logger sinks.
 
     Methods:
     -------
     logger
         Returns the Loguru Logger instance.
-    configure_sink(**kwargs: Any)
+    configure_sink(level: SeverityLevel, **kwargs: Any)
         Configures the sink for Loguru to customize log output.
+    add_sink(sink: Any, level: SeverityLevel)
+        Adds a sink receiving the records as raw loguru messages.
+    add_ndjson_sink(path: str | Path, level: SeverityLevel, **options: Any)
+        Adds a structured NDJSON file sink.
+    add_binary_sink(path: str | Path, level: SeverityLevel, **options: Any)
+        Adds a compact binary file sink.
+    add_network_sink(url: str, level: SeverityLevel, **options: Any)
+        Adds a sink shipping batches of records to a collector over TCP or HTTP.
+    configure_routes(routes: Iterable[SinkRoute])
+        Routes the records to several sinks, each with its own level, format and filter.
+    remove_sink(handler_id: int)
+        Detaches a sink added by this logger.
+    is_enabled(level: SeverityLevel)
+        Tells whether a record of the given severity would reach a sink or the flight recorder.
+    configure_recorder(capacity: int, level: SeverityLevel, trigger_level: SeverityLevel)
+        Keeps the records below the sink level in memory until an error is logged.
+    dump_recent(limit: int | None, level: SeverityLevel | None)
+        Writes the records kept by the flight recorder.
+    configure_exceptions(mode: ExceptionRenderMode, cache_size: int)
+        Chooses how the exceptions given to ``critical`` are rendered.
+    configure_metrics(enabled: bool, export_path: str | Path | None, ...)
+        Enables the logging metrics and their periodic export.
+    stats()
+        Returns a snapshot of the logging metrics.
+    execution(parameters: dict[str, Any] | None)
+        Returns the logger of an independent execution.
+    use_execution(parameters: dict[str, Any] | None)
+        Attributes this logger's records to an execution within a thread or asyncio task.
+    configure_summary(top_k: int)
+        Chooses how many message templates the execution summaries track.
+    finish(level: SeverityLevel)
+        Logs the summary of every execution and of the process, once.
+    shutdown()
+        Drains and detaches the configured sinks.
     """
 
-    def __init__(self, parameters: dict[str, Any] | None) -> None:
-        """Logger class init method."""
+    def __init__(self, parameters: dict[str, Any] | None, *, announce: bool = True, lazy: bool = False) -> None:
+        """Logger class init method.
+
+        Args:
+            parameters (dict[str, Any] | None): The process configuration, see ``Config.configure``.
+            announce (bool): Whether to log the process name, description and UID once the sink is configured.
+            lazy (bool): Defer the creation of the stdout sink, and the process announcement, until the first
+                record is emitted, so that short-lived processes only pay for them when they log something.
+        """
         self.parameters: dict[str, Any] = Config().configure(parameters=parameters)
-        self._logger = logger
+        self._logger: Any = logger
+        self._context: dict[str, Any] = {}
+        self._thread_sink: ThreadBufferedSink | None = None
+        self._deferred_sink: tuple[SeverityLevel, Callable[[], None]] | None = None
+        self._deferred_announce = False
+        self._start_lock = threading.RLock()
         self._display_process_name: str | None = None
         self._process_UID: str | None = None
-        self._start_process()
+        self._recorder = None
+        self._metrics = None
+        self._exceptions = None
+        self._record_statistics: RecordStatistics | None = None
+        self._started_ns = time.perf_counter_ns()
+        self._finished = False
+        self._exporter: MetricsExporter | None = None
+        self._measured_sinks: dict[int, MeasuredSink] = {}
+        self._sink_level: int = SeverityLevel.INFO
+        self._min_level: int = SeverityLevel.INFO
+        self._handler_levels: dict[int, SeverityLevel] = {}
+        self._stdout_handler_id: int | None = None
+        self._router: SinkRouter | None = None
+        self._router_handler_id: int | None = None
+        self._timestamps = TimestampCache()
+        self.registry = LogRegistry(self._sink_level, self._timestamps)
+        self._step_statistics = StepStatistics()
+        self._throttle = None
+        self._register_exit_hooks()
+        self._start_process(announce=announce, lazy=lazy)
 
-    def _start_process(self) -> None:
-        """Configure sink and log information regarding the process start."""
+    def _start_process(self, *, announce: bool, lazy: bool) -> None:
+        """Configure sink and log information regarding the process start, or defer both to the first record."""
         self._display_process_name = self.parameters[Constants.PROCESS_NAME_KEY]
         self._process_UID = self.parameters[Constants.PROCESS_UID_KEY]
+        self._started_ns = time.perf_counter_ns()
+        self._record_statistics = RecordStatistics(
+            self.parameters[Constants.PROCESS_UID_KEY], started_ns=self._started_ns
+        )
 
+        if lazy:
+            self._logger = _DeferredStart(self._start_deferred)
+            self._deferred_announce = announce
         self.configure_sink()
+        if announce and not lazy:
+            self._announce()
+
+    def _start_deferred(self) -> Any:  # noqa: ANN401
+        """Create the deferred stdout sink and announce the process, once; returns the bound loguru logger."""
+        with self._start_lock:
+            if isinstance(self._logger, _DeferredStart):
+                deferred, self._deferred_sink = self._deferred_sink, None
+                self._logger = self._bind_context()
+                if deferred is not None:
+                    deferred[1]()
+                self._refresh_min_level()
+                if self._deferred_announce:
+                    self._announce()
+        return self._logger
+
+    def _bind_context(self) -> Any:  # noqa: ANN401
+        """Bind the process UID, name and extras of the configuration to loguru's logger."""
+        self._context = context_fields(
+            self._process_UID,
+            self._display_process_name,
+            self.parameters[Constants.PROCESS_EXTRAS_KEY],
+        )
+        return logger.bind(**self._context)
+
+    def _announce(self) -> None:
+        """Log the process name, description and UID."""
         self.info("Process", extra_value=self._display_process_name)
         self.info("Description", extra_value=self.parameters[Constants.PROCESS_DESCRIPTION_KEY])
         self.info("Process UID", extra_value=self.parameters[Constants.PROCESS_UID_KEY])
@@ -59,23 +218,140 @@ class Log:
         """Returns the Loguru Logger instance."""
         return self
 
-    def configure_sink(self, **kwargs: Any) -> None:  # noqa: ANN401
-        """Set the configuration for loguru sink."""
-        self._logger = logger.bind(
-            process_uid=self._process_UID,
-            process_name=self._display_process_name,
-            display_level="",
-            generated_timestamp="",
-            extra_value="",
-            exception_message="",
+    def configure_sink(
+        self,
+        level: SeverityLevel = SeverityLevel.INFO,
+        *,
+        background: bool = False,
+        queue_capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        formatter: FormatterEngine = FormatterEngine.LOGURU,
+        thread_buffered: bool = False,
+        buffer_size: int = 256,
+        flush_interval: float = 0.2,
+        flush_level: SeverityLevel = SeverityLevel.ERROR,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Set the configuration for loguru sink.
+
+        The lowest level across the configured sinks is cached as the effective minimum level, so records below it
+        are discarded by the logging methods before any timestamp, binding or message rendering takes place.
+        Calling this method again replaces the stdout sink previously configured by it. On a lazily started logger
+        that has not emitted any record yet, the sink is only created with the first record.
+
+        In thread buffered mode, stdout is not a loguru handler: every thread renders its records with the compiled
+        formatter and writes them in batches, see ``ThreadBufferedSink``, so threads neither wait on loguru's
+        handler lock nor on each other's writes. The records of a thread keep their order and their timestamps,
+        taken from the monotonic clock, never go backwards. The other sinks still receive the records through
+        loguru. The gain comes from skipping loguru's handler, not from scaling with threads: the benchmarks show
+        the same throughput, about three times that of the stdout handler, from 1 to 32 threads.
+
+        Args:
+            level (SeverityLevel): Minimum severity level written by the sink.
+            background (bool): Deliver records to stdout from a dedicated writer thread through a bounded queue,
+                so logging calls never block on terminal or pipe I/O.
+            queue_capacity (int): Maximum number of records waiting in the background queue.
+            overflow_policy (OverflowPolicy): What to do with records arriving while the background queue is full.
+            formatter (FormatterEngine): Engine rendering the records. ``COMPILED`` renders the default format
+                from a template compiled once, on the writer thread in background mode, and only emits ANSI colors
+                when stdout is a TTY. Thread buffered mode always uses ``COMPILED``.
+            thread_buffered (bool): Write the records to stdout in per-thread batches, bypassing loguru.
+            buffer_size (int): Number of records of a thread written at once in thread buffered mode.
+            flush_interval (float): Maximum time, in seconds, a record stays buffered in thread buffered mode.
+            flush_level (SeverityLevel): Severity level from which a record, and the records its thread buffered
+                before it, are written at once in thread buffered mode.
+            **kwargs: Extra arguments handed over to loguru's ``add``, not accepted in thread buffered mode.
+
+        Raises:
+            ValueError: When both background and thread buffered modes are requested, or when extra arguments for
+                loguru are given in thread buffered mode, which does not use loguru.
+        """
+        if background and thread_buffered:
+            msg = "The background and thread buffered modes are exclusive."
+            raise ValueError(msg)
+        if thread_buffered and kwargs:
+            msg = f"The thread buffered mode does not use loguru, unexpected arguments: {', '.join(sorted(kwargs))}."
+            raise ValueError(msg)
+
+        if self._stdout_handler_id is not None:
+            self.remove_sink(self._stdout_handler_id)
+        self._deferred_sink = None
+        self._set_thread_sink(None)
+        with contextlib.suppress(ValueError):
+            logger.remove(0)
+
+        self._timestamps.use_monotonic_clock(enabled=thread_buffered)
+        if thread_buffered:
+            from yaplogger.sinks.buffered import ThreadBufferedSink
+
+            # Cheap to create, unlike a loguru handler, so it is never deferred by a lazy start.
+            render = CompiledFormatter(colorize=sys.stdout.isatty()).format
+            sink = ThreadBufferedSink(
+                sys.stdout,
+                render,
+                level,
+                buffer_size=buffer_size,
+                flush_interval=flush_interval,
+                flush_level=flush_level,
+            )
+            if not isinstance(self._logger, _DeferredStart):
+                self._logger = self._bind_context()
+            self._set_thread_sink(sink)
+            return
+
+        add_handler = functools.partial(
+            self._add_stdout_handler,
+            level,
+            background=background,
+            queue_capacity=queue_capacity,
+            overflow_policy=overflow_policy,
+            formatter=formatter,
+            **kwargs,
         )
-        self._logger.remove(0)
-        self._logger.add(
-            sink=sys.stdout,
-            level=SeverityLevel.INFO.name,
-            format=Constants.STDOUT_DEFAULT_FORMAT,
+        if isinstance(self._logger, _DeferredStart):
+            self._deferred_sink = (level, add_handler)
+            self._refresh_min_level()
+            return
+
+        self._logger = self._bind_context()
+        add_handler()
+
+    def _set_thread_sink(self, sink: "ThreadBufferedSink | None") -> None:
+        """Replace the thread buffered sink, stopping the previous one, and share it with the execution loggers."""
+        previous, self._thread_sink = self._thread_sink, sink
+        self.registry.set_thread_sink(sink)
+        self._refresh_min_level()
+        if previous is not None:
+            previous.stop()
+        if sink is not None:
+            self._register_exit_hooks()
+
+    def _add_stdout_handler(
+        self,
+        level: SeverityLevel,
+        *,
+        background: bool,
+        queue_capacity: int,
+        overflow_policy: OverflowPolicy,
+        formatter: FormatterEngine,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Add the stdout sink described by the arguments of ``configure_sink``."""
+        compiled = formatter is FormatterEngine.COMPILED
+        render = CompiledFormatter(colorize=sys.stdout.isatty()).format if compiled else None
+
+        sink: TextIO | BackgroundSink | TextStreamSink = sys.stdout
+        if background:
+            sink = BackgroundSink(sys.stdout, capacity=queue_capacity, overflow_policy=overflow_policy, render=render)
+        elif render is not None:
+            sink = TextStreamSink(sys.stdout, render)
+
+        handler_id = self._add_handler(
+            sink,
+            level,
+            format=Constants.RAW_MESSAGE_FORMAT if compiled else Constants.STDOUT_DEFAULT_FORMAT,
             filter=None,
-            colorize=True,
+            colorize=not compiled,
             serialize=False,
             backtrace=True,
             diagnose=True,
@@ -84,72 +360,366 @@ class Log:
             catch=True,
             **kwargs,
         )
+        self._stdout_handler_id = handler_id
 
-    def _log(
+    def add_sink(self, sink: Any, level: SeverityLevel = SeverityLevel.INFO) -> int:  # noqa: ANN401
+        """Add a sink receiving every record as a loguru message, whose text is the bare log message.
+
+        The sink may be any object loguru accepts; it finds the timestamp, level and process fields in the loguru
+        record carried by the message.
+
+        Args:
+            sink (Any): The sink, usually an object with a ``write`` method.
+            level (SeverityLevel): Minimum severity level received by the sink.
+
+        Returns:
+            int: The handler id, to be given to ``remove_sink``.
+        """
+        return self._add_handler(
+            sink,
+            level,
+            format=Constants.RAW_MESSAGE_FORMAT,
+            colorize=False,
+            enqueue=False,
+            catch=True,
+        )
+
+    def add_ndjson_sink(
         self,
-        level: SeverityLevel,
-        message: str,
-        extra_value: str | None,
-        exception_message: str | Exception | None = None,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> None:
-        """Unique point to apply changes and log."""
-        now: str = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-        if exception_message:
-            self._logger.log(
-                level.name,
-                message,
-                **kwargs,
-                display_level=level.name.lower(),
-                generated_timestamp=now,
-                exception_message=exception_message,
+        path: str | Path,
+        level: SeverityLevel = SeverityLevel.INFO,
+        **options: Any,  # noqa: ANN401
+    ) -> int:
+        """Add a sink writing one JSON object per record to a file.
+
+        Args:
+            path (str | Path): The file records are appended to.
+            level (SeverityLevel): Minimum severity level written by the sink.
+            **options: Buffering, rotation and compression options handed over to ``NDJSONFileSink``.
+
+        Returns:
+            int: The handler id, to be given to ``remove_sink``.
+        """
+        from yaplogger.sinks.ndjson import NDJSONFileSink  # imported on use, like every optional sink
+
+        options.setdefault(Constants.PROCESS_EXTRAS_KEY, self.parameters[Constants.PROCESS_EXTRAS_KEY])
+        return self.add_sink(NDJSONFileSink(path, **options), level)
+
+    def add_binary_sink(
+        self,
+        path: str | Path,
+        level: SeverityLevel = SeverityLevel.INFO,
+        **options: Any,  # noqa: ANN401
+    ) -> int:
+        """Add a sink writing the records to a file in the compact binary format, see ``BinaryFileSink``.
+
+        The file is decoded back to text or NDJSON by the ``yaplogger decode`` command.
+
+        Args:
+            path (str | Path): The file records are appended to.
+            level (SeverityLevel): Minimum severity level written by the sink.
+            **options: Buffering and interning options handed over to ``BinaryFileSink``.
+
+        Returns:
+            int: The handler id, to be given to ``remove_sink``.
+        """
+        from yaplogger.sinks.binary import BinaryFileSink
+
+        return self.add_sink(BinaryFileSink(path, **options), level)
+
+    def add_network_sink(
+        self,
+        url: str,
+        level: SeverityLevel = SeverityLevel.INFO,
+        **options: Any,  # noqa: ANN401
+    ) -> int:
+        """Add a sink shipping the records to a remote collector in batches, see ``NetworkSink``.
+
+        Args:
+            url (str): The collector, as ``tcp://host:port``, ``http://host:port/path`` or ``https://...``.
+            level (SeverityLevel): Minimum severity level shipped by the sink.
+            **options: Protocol, batching, connection, retry and spool options handed over to ``NetworkSink``.
+
+        Returns:
+            int: The handler id, to be given to ``remove_sink``.
+        """
+        from yaplogger.sinks.network import NetworkSink
+
+        options.setdefault(Constants.PROCESS_EXTRAS_KEY, self.parameters[Constants.PROCESS_EXTRAS_KEY])
+        return self.add_sink(NetworkSink(url, **options), level)
+
+    def configure_routes(self, routes: Iterable["SinkRoute"]) -> int | None:
+        """Route the records to several sinks, each with its own minimum level, format and filter.
+
+        Every route is served by a single loguru handler, which looks the routes of a record up in a table
+        precomputed per level, so a record only reaches the sinks whose level it meets, and only their filters are
+        evaluated. Calling this method again swaps the routing table in place: no record is lost nor dispatched
+        twice, sinks kept from one configuration to the next are left open, and the sinks no longer routed to are
+        stopped once the records they accepted are written. The stdout sink of ``configure_sink`` and the sinks
+        added by ``add_sink`` are not affected.
+
+        Args:
+            routes (Iterable[SinkRoute]): The destinations of the records. Routing stops when empty.
+
+        Returns:
+            int | None: The handler id of the routes, None when there is no route.
+        """
+        routes = tuple(routes)
+        if not routes:
+            if self._router_handler_id is not None:
+                self.remove_sink(self._router_handler_id)
+            return None
+
+        if self._router is None or self._router_handler_id is None:
+            from yaplogger.sinks.router import SinkRouter
+
+            self._router = SinkRouter(routes)
+            self._router_handler_id = self._add_handler(
+                self._router,
+                SeverityLevel.TRACE,
+                format=Constants.RAW_MESSAGE_FORMAT,
+                colorize=False,
+                enqueue=False,
+                catch=True,
             )
+        else:
+            self._router.update(routes)
+            self._register_exit_hooks()
+
+        self._handler_levels[self._router_handler_id] = SeverityLevel(self._router.min_level)
+        self._refresh_min_level()
+        return self._router_handler_id
+
+    def remove_sink(self, handler_id: int) -> None:
+        """Detach a sink added by this logger, flushing it first."""
+        logger.remove(handler_id)
+        self._handler_levels.pop(handler_id, None)
+        self._measured_sinks.pop(handler_id, None)
+        if handler_id == self._stdout_handler_id:
+            self._stdout_handler_id = None
+        if handler_id == self._router_handler_id:
+            self._router = self._router_handler_id = None
+        self._refresh_min_level()
+
+    def shutdown(self) -> None:
+        """Drain and detach the sinks configured by this logger.
+
+        Records logged through the asynchronous methods are written first. Background sinks write every queued
+        record, and file and thread buffered sinks flush their buffers, before this method returns. Logging calls
+        made afterwards are discarded until ``configure_sink`` is called again, including those of a lazily started
+        logger that never created its stdout sink.
+        """
+        with self._start_lock:
+            if isinstance(self._logger, _DeferredStart):
+                self._deferred_sink = None
+                self._logger = self._bind_context()
+        ASYNC_WRITER.drain()
+        if self._throttle is not None:
+            self._throttle.flush()
+        self._stop_exporter()
+        for handler_id in list(self._handler_levels):
+            self.remove_sink(handler_id)
+        self._set_thread_sink(None)
+
+    def configure_summary(self, top_k: int = 32) -> None:
+        """Choose how many message templates the execution summaries track, or disable them with zero.
+
+        The counts of this logger start over, while its wall time is still measured from the process start.
+        Execution loggers created afterwards track the same number of templates.
+
+        Args:
+            top_k (int): Maximum number of message templates tracked per logger.
+        """
+        self._record_statistics = (
+            RecordStatistics(self.parameters[Constants.PROCESS_UID_KEY], top_k, self._started_ns) if top_k else None
+        )
+        self.registry.set_summary_size(top_k)
+
+    def finish(self, level: SeverityLevel = SeverityLevel.INFO) -> None:
+        """Log the summary of every registered execution, then of the process, once.
+
+        Each summary is a single record counting the records emitted per level, listing the noisiest message
+        templates and giving the wall time, so that offline analysis does not need to scan the whole log. Executions
+        without any record are skipped. It runs at interpreter exit unless called before, and a lazily started
+        logger that never emitted a record logs nothing.
+
+        Args:
+            level (SeverityLevel): The severity level of the summary records.
+        """
+        if self._finished or isinstance(self._logger, _DeferredStart):
             return
+        self._finished = True
+        for execution in self.registry.executions():
+            summary = execution.execution_summary()
+            if summary is not None and summary.records:
+                execution.log_execution_summary(level)
+        self.log_execution_summary(level)
 
-        if extra_value:
-            self._logger.log(
-                level.name,
-                message,
-                **kwargs,
-                display_level=level.name.lower(),
-                generated_timestamp=now,
-                extra_value=extra_value,
-            )
+    def configure_metrics(
+        self,
+        *,
+        enabled: bool = True,
+        export_path: str | Path | None = None,
+        export_format: MetricsFormat = MetricsFormat.PROMETHEUS,
+        export_interval: float = 15.0,
+    ) -> None:
+        """Enable or disable the logging metrics, shared by this logger and its execution loggers.
+
+        Once enabled, records are counted by level as emitted or filtered, their emission and every sink write
+        are timed, and the bytes written by each sink are counted. Counters live in one shard per thread,
+        so collecting them takes no lock. While disabled, which is the default, none of this takes place.
+
+        Args:
+            enabled (bool): Whether the metrics are collected. Disabling them discards the collected values.
+            export_path (str | Path | None): File a snapshot is periodically written to, and a last time at shutdown
+                and at interpreter exit. No export when None.
+            export_format (MetricsFormat): Format of the exported file.
+            export_interval (float): Seconds between two exports.
+        """
+        self._stop_exporter()
+
+        if not enabled:
+            self._set_metrics(None)
             return
 
-        self._logger.log(
-            level.name,
-            message,
-            **kwargs,
-            display_level=level.name.lower(),
-            generated_timestamp=now,
+        if self._metrics is None:
+            self._set_metrics(LogMetrics())
+        if export_path is not None:
+            self._exporter = MetricsExporter(
+                self.stats,
+                export_path,
+                export_format=export_format,
+                interval=export_interval,
+            )
+
+    def stats(self) -> LogStats:
+        """Snapshot of the logging metrics, empty while they are disabled, see ``configure_metrics``."""
+        metrics = self._metrics or LogMetrics()
+        emitted, filtered, emit_latency, exception_render, sink_shards = metrics.snapshot()
+        return LogStats(
+            emitted=emitted,
+            filtered=filtered,
+            suppressed=self.suppressed_counts(),
+            emit_latency=emit_latency,
+            exception_render=exception_render,
+            sinks={
+                handler_id: LogMetrics.sink_stats(measured.name, measured.sink, sink_shards.get(handler_id))
+                for handler_id, measured in list(self._measured_sinks.items())
+            },
         )
 
-    def trace(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated trace method with automatic UID inclusion."""
-        self._log(SeverityLevel.TRACE, message, **kwargs, extra_value=extra_value)
+    def _register_exit_hooks(self) -> None:
+        """Register the step and execution summaries to run at exit before the sinks added so far are stopped.
+
+        Sinks register their own exit hooks when they are created, and ``atexit`` runs the hooks in the reverse
+        order of their registration, so the summaries are registered again after every new sink. The metrics
+        exporter is stopped after the summaries, so its final snapshot counts them.
+        """
+        atexit.unregister(self._stop_exporter)
+        atexit.unregister(self.finish)
+        atexit.unregister(self.log_step_summary)
+        atexit.register(self._stop_exporter)
+        atexit.register(self.finish)
+        atexit.register(self.log_step_summary)
+
+    def _stop_exporter(self) -> None:
+        """Stop the metrics exporter, if any, after it writes a last snapshot."""
+        if self._exporter is not None:
+            self._exporter.stop()
+            self._exporter = None
+
+    def _add_handler(self, sink: Any, level: SeverityLevel, **options: Any) -> int:  # noqa: ANN401
+        """Add a sink to loguru, wrapped so that its writes can be measured, and track its level."""
+        name = "stdout" if sink is sys.stdout else getattr(sink, "__qualname__", type(sink).__name__)
+        measured = measure_sink(sink, name)
+        target: Any = measured if measured is not None else sink
+        handler_id = logger.add(sink=target, level=level.name, **options)
+        if measured is not None:
+            measured.handler_id = handler_id
+            measured.metrics = self._metrics
+            self._measured_sinks[handler_id] = measured
+        self._handler_levels[handler_id] = level
+        self._refresh_min_level()
+        self._register_exit_hooks()
+        return handler_id
 
-    def debug(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated debug method with automatic UID inclusion."""
-        self._log(SeverityLevel.DEBUG, message, **kwargs, extra_value=extra_value)
+    def _set_metrics(self, metrics: LogMetrics | None) -> None:
+        """Share the metrics with the emission path, the sinks and the execution loggers."""
+        self._metrics = metrics
+        for measured in list(self._measured_sinks.values()):
+            measured.metrics = metrics
+        self.registry.set_metrics(metrics)
 
-    def info(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated info method with automatic UID inclusion."""
-        self._log(SeverityLevel.INFO, message, extra_value, **kwargs)
+    def _refresh_min_level(self) -> None:
+        """Cache the lowest level accepted by the configured sinks, the deferred stdout sink included."""
+        levels = list(self._handler_levels.values())
+        if self._deferred_sink is not None:
+            levels.append(self._deferred_sink[0])
+        if self._thread_sink is not None:
+            levels.append(self._thread_sink.level)
+        self._set_sink_level(min(levels, default=DISABLED_LEVEL))
+        self.registry.set_min_level(self._sink_level)
 
-    def success(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated success method with automatic UID inclusion."""
-        self._log(SeverityLevel.SUCCESS, message, **kwargs, extra_value=extra_value)
+    def execution(self, parameters: dict[str, Any] | None) -> ExecutionLog:
+        """Return the logger of an independent execution, sharing this logger sinks.
 
-    def warning(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated warning method with automatic UID inclusion."""
-        self._log(SeverityLevel.WARNING, message, **kwargs, extra_value=extra_value)
+        Unlike ``Log(parameters=...)``, which always returns the process logger, every distinct process UID gets
+        its own execution logger, kept in ``registry``.
 
-    def error(self, message: str, extra_value: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated error method with automatic UID inclusion."""
-        self._log(SeverityLevel.ERROR, message, **kwargs, extra_value=extra_value)
+        Args:
+            parameters (dict[str, Any] | None): The execution configuration, see ``Config.configure``.
 
-    def critical(self, message: str, extra_value: str | Exception | None = None, **kwargs: Any) -> None:  # noqa: ANN401
-        """Encapsulated critical method with automatic UID inclusion."""
-        self._log(SeverityLevel.CRITICAL, message, exception_message=extra_value, extra_value=None, **kwargs)
+        Returns:
+            ExecutionLog: The execution logger.
+        """
+        if isinstance(self._logger, _DeferredStart):
+            self._start_deferred()
+        return self.registry.get_or_create(parameters)
+
+    def use_execution(self, parameters: dict[str, Any] | None) -> ExecutionScope:
+        """Attribute the records of this logger to an execution, within a ``with`` block.
+
+        The execution is kept in a context variable, so each thread and asyncio task sees the execution it entered,
+        and tasks created within the block inherit it: concurrent tasks running different executions can all log
+        through this logger and get their records attributed to their own execution, without binding anything per
+        call. The records are counted in the execution summary and their exceptions rendered by the execution
+        logger, while throttling, flight recorder and step statistics remain the ones of this logger.
+
+        Args:
+            parameters (dict[str, Any] | None): The execution configuration, see ``execution``.
+
+        Returns:
+            ExecutionScope: The context manager, whose ``with`` target is the execution logger.
+        """
+        return ExecutionScope(self.execution(parameters))
+
+    def configure_exceptions(self, mode: ExceptionRenderMode, *, cache_size: int = 256) -> None:
+        """Choose how the exceptions given to ``critical`` are written, by this logger and its execution loggers.
+
+        See ``LogEmitter.configure_exceptions``. The renderer is shared with the execution loggers, so an exception
+        is fingerprinted once whichever logger writes it.
+        """
+        super().configure_exceptions(mode, cache_size=cache_size)
+        self.registry.set_exceptions(self._exceptions)
+
+    def _emit(
+        self,
+        level: SeverityLevel,
+        message: str,
+        extra_value: Any,  # noqa: ANN401
+        exception_message: str | Exception | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Emit a record, through the logger of the current execution when there is one.
+
+        A lazily started logger is started first, so the announcement is written, and timestamped, before the
+        record that triggered it.
+        """
+        if isinstance(self._logger, _DeferredStart):
+            self._start_deferred()
+        execution = current_execution()
+        if execution is None:
+            super()._emit(level, message, extra_value, exception_message, args, kwargs)
+            return
+        execution._emit(level, message, extra_value, exception_message, args, kwargs)  # noqa: SLF001
@@ -0,0 +1,430 @@
+# whoami::./yaplogger/metrics.py
+"""Self-observability of YapLogger: record counters, latency histograms, per-sink statistics and their export."""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, cast
+
+from yaplogger.utils import MetricsFormat, SeverityLevel
+
+_BUCKETS: int = 48
+_LEVEL_SLOTS: int = SeverityLevel.CRITICAL + 1
+_QUANTILES: tuple[tuple[str, str], ...] = (("0.5", "p50_ms"), ("0.95", "p95_ms"), ("0.99", "p99_ms"))
+
+
+class LatencySummary(NamedTuple):
+    """Aggregate durations, in milliseconds. Percentiles are the upper bound of their power-of-two bucket."""
+
+    calls: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+class SinkStats(NamedTuple):
+    """Statistics of one sink.
+
+    ``bytes_written`` is the size of what the sink wrote when it counts it, and otherwise the size of the messages
+    it received. It is None for sinks rendering their own lines without counting them. Queue depth and drops are
+    None for sinks without a queue.
+    """
+
+    name: str
+    writes: int
+    bytes_written: int | None
+    latency: LatencySummary
+    queue_depth: int | None
+    dropped: int | None
+
+
+class LogStats(NamedTuple):
+    """Snapshot of the logging metrics.
+
+    ``emitted`` and ``filtered`` count records by level name: emitted records were handed over to the sinks, while
+    filtered ones were discarded by the level gate or the throttling, or kept by the flight recorder.
+    ``emit_latency`` measures the whole emission of a record, formatting and every sink write included, and
+    ``exception_render`` the emission of the records carrying an exception.
+    """
+
+    emitted: dict[str, int]
+    filtered: dict[str, int]
+    suppressed: dict[str, dict[str, int]]
+    emit_latency: LatencySummary
+    exception_render: LatencySummary
+    sinks: dict[int, SinkStats]
+
+
+class _Histogram:
+    """Durations counted in power-of-two nanosecond buckets."""
+
+    __slots__ = ("buckets", "count", "maximum", "total")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def add(self, duration_ns: int) -> None:
+        self.buckets[min(duration_ns.bit_length(), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += duration_ns
+        self.maximum = max(self.maximum, duration_ns)
+
+    def merge(self, other: "_Histogram") -> None:
+        for bucket, count in enumerate(other.buckets):
+            self.buckets[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def summary(self) -> LatencySummary:
+        def percentile(fraction: float) -> float:
+            rank = fraction * self.count
+            seen = 0
+            for bucket, count in enumerate(self.buckets):
+                seen += count
+                if seen >= rank:
+                    return min(1 << bucket, self.maximum) / 1e6
+            return self.maximum / 1e6
+
+        if not self.count:
+            return LatencySummary(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        return LatencySummary(
+            calls=self.count,
+            total_ms=self.total / 1e6,
+            p50_ms=percentile(0.5),
+            p95_ms=percentile(0.95),
+            p99_ms=percentile(0.99),
+            max_ms=self.maximum / 1e6,
+        )
+
+
+class _SinkShard:
+    """Write statistics of one sink, within one thread."""
+
+    __slots__ = ("bytes_written", "latency")
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+        self.latency = _Histogram()
+
+
+class _Shard:
+    """Counters updated by a single thread, so no lock is needed to update them."""
+
+    __slots__ = ("emit", "emitted", "exception", "filtered", "sinks")
+
+    def __init__(self) -> None:
+        self.emitted = [0] * _LEVEL_SLOTS
+        self.filtered = [0] * _LEVEL_SLOTS
+        self.emit = _Histogram()
+        self.exception = _Histogram()
+        self.sinks: dict[int, _SinkShard] = {}
+
+
+class LogMetrics:
+    """Collects the logging metrics with one shard of counters per thread.
+
+    Every thread updates its own shard, found through a thread local, so recording takes no lock; the lock is
+    only taken when a thread records its first metric and when a snapshot is taken. Snapshots read the shards
+    while they may be updated, so a snapshot may miss the records logged while it is taken, never more.
+    """
+
+    def __init__(self) -> None:
+        """Log metrics init method."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+
+    def record_filtered(self, level: SeverityLevel) -> None:
+        """Count a record that did not reach the sinks."""
+        self._shard().filtered[level] += 1
+
+    def record_emitted(self, level: SeverityLevel, duration_ns: int, *, exception: bool) -> None:
+        """Count a record handed over to the sinks, with the time its emission took."""
+        shard = self._shard()
+        shard.emitted[level] += 1
+        shard.emit.add(duration_ns)
+        if exception:
+            shard.exception.add(duration_ns)
+
+    def record_write(self, handler_id: int, duration_ns: int, size: int) -> None:
+        """Count a sink write, with its duration and the size of the written message in bytes."""
+        shard = self._shard()
+        sink = shard.sinks.get(handler_id)
+        if sink is None:
+            sink = shard.sinks[handler_id] = _SinkShard()
+        sink.bytes_written += size
+        sink.latency.add(duration_ns)
+
+    def snapshot(self) -> tuple[dict[str, int], dict[str, int], LatencySummary, LatencySummary, dict[int, _SinkShard]]:
+        """Merge the shards into the record counters, the latency summaries and the per-sink write statistics."""
+        emitted = [0] * _LEVEL_SLOTS
+        filtered = [0] * _LEVEL_SLOTS
+        emit = _Histogram()
+        exception = _Histogram()
+        sinks: dict[int, _SinkShard] = {}
+        with self._lock:
+            shards = list(self._shards)
+
+        for shard in shards:
+            for level in SeverityLevel:
+                emitted[level] += shard.emitted[level]
+                filtered[level] += shard.filtered[level]
+            emit.merge(shard.emit)
+            exception.merge(shard.exception)
+            for handler_id, sink_shard in list(shard.sinks.items()):
+                merged = sinks.setdefault(handler_id, _SinkShard())
+                merged.bytes_written += sink_shard.bytes_written
+                merged.latency.merge(sink_shard.latency)
+
+        return (
+            {level.name: emitted[level] for level in SeverityLevel if emitted[level]},
+            {level.name: filtered[level] for level in SeverityLevel if filtered[level]},
+            emit.summary(),
+            exception.summary(),
+            sinks,
+        )
+
+    @staticmethod
+    def sink_stats(name: str, sink: Any, shard: _SinkShard | None) -> SinkStats:  # noqa: ANN401
+        """Build the statistics of a sink from its write statistics and its own counters, when it has any."""
+        latency = shard.latency.summary() if shard is not None else _Histogram().summary()
+        written = shard.bytes_written if shard is not None else 0
+        return SinkStats(
+            name=name,
+            writes=latency.calls,
+            bytes_written=getattr(sink, "bytes_written", written),
+            latency=latency,
+            queue_depth=getattr(sink, "queue_depth", None),
+            dropped=getattr(sink, "dropped", None),
+        )
+
+    def _shard(self) -> _Shard:
+        """The shard of the current thread, created on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+
+class MeasuredSink:
+    """Forwards the writes to a sink, timing them and counting the written bytes when metrics are enabled.
+
+    Sinks are always wrapped when added, so enabling the metrics later measures them too. While the metrics are
+    disabled, ``write`` and ``flush`` are the sink's own methods, which loguru calls directly, so the wrapper adds
+    nothing to a write; setting ``metrics`` swaps ``write`` for the measuring method. ``flush`` is only set when
+    the sink has one, since loguru decides whether to call it from its presence, and ``stop`` forwards to the
+    sink's own.
+    """
+
+    __slots__ = ("_metrics", "_write", "flush", "handler_id", "name", "sink", "write")
+
+    def __init__(self, sink: Any, name: str) -> None:  # noqa: ANN401
+        """Measured sink init method.
+
+        Args:
+            sink (Any): An object with a ``write`` method, or a callable receiving the messages.
+            name (str): The sink name reported in the statistics.
+        """
+        self.sink = sink
+        self.name = name
+        self.handler_id = -1
+        self._metrics: LogMetrics | None = None
+        self._write: Callable[[str], Any] = sink.write if hasattr(sink, "write") else sink
+        self.write: Callable[[Any], None] = self._write
+        flush = getattr(sink, "flush", None)
+        if hasattr(sink, "write") and callable(flush):
+            self.flush: Callable[[], Any] = flush
+
+    @property
+    def metrics(self) -> LogMetrics | None:
+        """The metrics the writes are recorded in, None while they are disabled."""
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: LogMetrics | None) -> None:
+        self._metrics = metrics
+        self.write = self._measured_write if metrics is not None else self._write
+
+    def stop(self) -> None:
+        """Stop the sink, if it can be stopped."""
+        stop = getattr(self.sink, "stop", None)
+        if callable(stop):
+            stop()
+
+    def _measured_write(self, message: str) -> None:
+        """Write a message to the sink, recording the write duration and the message size in bytes."""
+        metrics = self._metrics
+        start = time.perf_counter_ns()
+        self._write(message)
+        duration_ns = time.perf_counter_ns() - start
+        if metrics is not None:
+            metrics.record_write(self.handler_id, duration_ns, len(message.encode("utf-8", "surrogatepass")))
+
+
+def measure_sink(sink: Any, name: str) -> MeasuredSink | None:  # noqa: ANN401
+    """Wrap a sink with a measured sink, or return None for the sinks loguru handles by itself (paths, handlers)."""
+    if hasattr(sink, "write") or (callable(sink) and not isinstance(sink, type)):
+        return MeasuredSink(sink, name)
+    return None
+
+
+def _plain(value: Any) -> Any:  # noqa: ANN401
+    """Convert the named tuples of a snapshot into dictionaries, recursively."""
+    if isinstance(value, LogStats | SinkStats | LatencySummary):
+        return {key: _plain(item) for key, item in value._asdict().items()}
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in cast("dict[Any, Any]", value).items()}
+    return value
+
+
+def render_json(stats: LogStats) -> str:
+    """Render a snapshot as one JSON document."""
+    return json.dumps(_plain(stats), sort_keys=True)
+
+
+def render_prometheus(stats: LogStats) -> str:
+    """Render a snapshot in the Prometheus text exposition format."""
+    lines: list[str] = []
+
+    def counter(name: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} counter"))
+        lines.extend(f"{name}{{{labels}}} {value}" for labels, value in samples)
+
+    def gauge(name: str, help_text: str, samples: list[tuple[str, float]]) -> None:
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} gauge"))
+        lines.extend(f"{name}{{{labels}}} {value}" for labels, value in samples)
+
+    def summary(name: str, help_text: str, latencies: list[tuple[str, LatencySummary]]) -> None:
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} summary"))
+        for labels, latency in latencies:
+            prefix = f"{labels}," if labels else ""
+            lines.extend(
+                f'{name}{{{prefix}quantile="{quantile}"}} {getattr(latency, field) / 1e3}'
+                for quantile, field in _QUANTILES
+            )
+            lines.extend(
+                (f"{name}_sum{{{labels}}} {latency.total_ms / 1e3}", f"{name}_count{{{labels}}} {latency.calls}")
+            )
+
+    counter(
+        "yaplogger_records_emitted_total",
+        "Records handed over to the sinks.",
+        [(f'level="{level}"', count) for level, count in stats.emitted.items()],
+    )
+    counter(
+        "yaplogger_records_filtered_total",
+        "Records discarded before the sinks.",
+        [(f'level="{level}"', count) for level, count in stats.filtered.items()],
+    )
+    counter(
+        "yaplogger_records_suppressed_total",
+        "Records suppressed by the throttling.",
+        [
+            (f'reason="{reason}",level="{level}"', count)
+            for reason, counts in stats.suppressed.items()
+            for level, count in counts.items()
+        ],
+    )
+    summary("yaplogger_emit_latency_seconds", "Time taken to emit a record.", [("", stats.emit_latency)])
+    summary(
+        "yaplogger_exception_render_seconds",
+        "Time taken to emit a record carrying an exception.",
+        [("", stats.exception_render)],
+    )
+
+    sinks = [(f'handler="{handler_id}",sink="{sink.name}"', sink) for handler_id, sink in stats.sinks.items()]
+    counter("yaplogger_sink_writes_total", "Writes to the sink.", [(labels, sink.writes) for labels, sink in sinks])
+    counter(
+        "yaplogger_sink_written_bytes_total",
+        "Bytes written by the sink.",
+        [(labels, sink.bytes_written) for labels, sink in sinks if sink.bytes_written is not None],
+    )
+    summary(
+        "yaplogger_sink_write_latency_seconds",
+        "Time taken by a sink write.",
+        [(labels, sink.latency) for labels, sink in sinks],
+    )
+    gauge(
+        "yaplogger_sink_queue_depth",
+        "Records waiting in the sink queue.",
+        [(labels, sink.queue_depth) for labels, sink in sinks if sink.queue_depth is not None],
+    )
+    counter(
+        "yaplogger_sink_dropped_total",
+        "Records dropped by the sink overflow policy.",
+        [(labels, sink.dropped) for labels, sink in sinks if sink.dropped is not None],
+    )
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """Writes a metrics snapshot to a file periodically, from a daemon thread.
+
+    Every export writes a temporary file first and renames it over the target, so readers such as the Prometheus
+    textfile collector never see a partial file. A failed periodic or final export is reported to stderr, and the
+    thread keeps exporting at the next interval.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], LogStats],
+        path: str | Path,
+        *,
+        export_format: MetricsFormat = MetricsFormat.PROMETHEUS,
+        interval: float = 15.0,
+    ) -> None:
+        """Metrics exporter init method.
+
+        Args:
+            collect (Callable[[], LogStats]): Takes the snapshot to export.
+            path (str | Path): The file the snapshot is written to.
+            export_format (MetricsFormat): The format of the file.
+            interval (float): Seconds between two exports.
+        """
+        self._collect = collect
+        self._path = Path(path)
+        self._render = render_json if export_format is MetricsFormat.JSON else render_prometheus
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="yaplogger-metrics", daemon=True)
+        self._thread.start()
+
+    def export(self) -> None:
+        """Write a snapshot now."""
+        temporary = self._path.with_name(f"{self._path.name}.tmp")
+        temporary.write_text(self._render(self._collect()), encoding="utf-8")
+        temporary.replace(self._path)
+
+    def stop(self) -> None:
+        """Stop the exporting thread, after writing a last snapshot. Calling it again is a no-op."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._export_reporting_failures()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._export_reporting_failures()
+
+    def _export_reporting_failures(self) -> None:
+        """Write a snapshot, reporting failures to stderr instead of raising in the caller."""
+        try:
+            self.export()
+        except Exception:  # noqa: BLE001
+            sys.stderr.write(f"--- YapLogger metrics exporter failed to write {self._path} ---\n")
+            traceback.print_exc(file=sys.stderr)
@@ -0,0 +1,154 @@
+# whoami::./yaplogger/multiprocess.py
+"""Aggregation of the records logged by worker processes into the parent process sinks."""
+
+import multiprocessing
+import threading
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+from yaplogger.constants import Constants
+from yaplogger.emitter import LogEmitter
+from yaplogger.log import Log
+from yaplogger.utils import SeverityLevel
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.sharedctypes import Synchronized
+
+type ForwardedRecord = tuple[int, str, dict[str, Any]]
+
+_FORWARDED_FIELDS: tuple[str, ...] = ("generated_timestamp", "display_level", "extra_value", "exception_message")
+
+
+class QueueForwardSink:
+    """Worker side sink, forwarding every record to the parent process through a multiprocessing queue.
+
+    Only the level, the rendered message and the fields needed to render the record again are sent, as plain
+    picklable values; exceptions are sent as their text.
+    """
+
+    def __init__(self, queue: "Queue[ForwardedRecord | None]", worker_id: int) -> None:
+        """Queue forward sink init method.
+
+        Args:
+            queue (Queue[ForwardedRecord | None]): The queue read by the parent ``LogAggregator``.
+            worker_id (int): Identifier of the worker process, added to every record.
+        """
+        self._queue = queue
+        self._worker_id = worker_id
+
+    def write(self, message: str) -> None:
+        """Send the record carried by a loguru message to the parent process."""
+        record: Any = getattr(message, "record", None)
+        if record is None:
+            return
+
+        extra = record["extra"]
+        fields = {key: extra[key] if isinstance(extra[key], str) else str(extra[key]) for key in _FORWARDED_FIELDS}
+        fields[Constants.WORKER_ID_KEY] = self._worker_id
+        self._queue.put((record["level"].no, record["message"], fields))
+
+
+def initialize_worker(
+    queue: "Queue[ForwardedRecord | None]",
+    parameters: dict[str, Any],
+    level: SeverityLevel,
+    counter: "Synchronized[int]",
+) -> None:
+    """Configure logging in a worker process, to be used as a process pool ``initializer``.
+
+    The worker logger is configured with the parent parameters, so it shares the parent ``process_uid`` instead of
+    generating its own, and its sinks are replaced with one forwarding the records to the parent. Each worker takes
+    the next id from the shared counter.
+
+    Args:
+        queue (Queue[ForwardedRecord | None]): The queue read by the parent ``LogAggregator``.
+        parameters (dict[str, Any]): The parent logger parameters.
+        level (SeverityLevel): Minimum severity level forwarded to the parent.
+        counter (Synchronized[int]): Counter handing out the worker ids.
+    """
+    with counter.get_lock():
+        counter.value += 1
+        worker_id = counter.value
+
+    log = Log(parameters=parameters, announce=False)
+    log.shutdown()
+    log.add_sink(QueueForwardSink(queue, worker_id), level)
+
+
+class LogAggregator:
+    """Parent side of multi-process logging: writes the records of worker processes through the parent sinks.
+
+    Workers set up with ``initializer`` and ``initargs`` forward their records over a multiprocessing queue. A
+    listener thread in the parent reads them in arrival order and replays them through the parent ``Log``, keeping
+    the worker timestamp and adding the ``worker_id`` field. Records of one worker are written in the order they
+    were logged.
+
+    Example:
+    -------
+        with LogAggregator(log) as aggregator, ProcessPoolExecutor(
+            initializer=aggregator.initializer, initargs=aggregator.initargs
+        ) as pool:
+            pool.map(work, items)
+    """
+
+    def __init__(self, log: LogEmitter, *, context: BaseContext | None = None) -> None:
+        """Log aggregator init method.
+
+        Args:
+            log (LogEmitter): The parent logger, whose sinks receive the worker records.
+            context (BaseContext | None): The multiprocessing context used by the workers. Defaults to the current
+                start method.
+        """
+        context = context or multiprocessing.get_context()
+        self._log = log
+        self._queue: Queue[ForwardedRecord | None] = context.Queue()
+        self._counter: Synchronized[int] = context.Value("i", 0)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def initializer(self) -> Any:  # noqa: ANN401
+        """Worker initializer function, to be given to the process pool."""
+        return initialize_worker
+
+    @property
+    def initargs(self) -> tuple[Any, ...]:
+        """Worker initializer arguments, to be given to the process pool."""
+        level = min((level for level in SeverityLevel if self._log.is_enabled(level)), default=SeverityLevel.CRITICAL)
+        return self._queue, dict(self._log.parameters), level, self._counter
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="yaplogger-aggregator", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Write the records still queued and stop the listener thread, once the workers are done."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> Self:
+        """Start the listener thread."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the listener thread."""
+        self.stop()
+
+    def _run(self) -> None:
+        """Listener thread loop: replay the worker records until the stop sentinel arrives."""
+        while (item := self._queue.get()) is not None:
+            level_no, message, fields = item
+            fields.setdefault(Constants.PROCESS_UID_KEY, self._log.parameters[Constants.PROCESS_UID_KEY])
+            self._log.replay(SeverityLevel(level_no), message, **fields)
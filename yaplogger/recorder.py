@@ -0,0 +1,99 @@
+# whoami::./yaplogger/recorder.py
+"""Flight recorder: a bounded in-memory ring of the records below the sink level, dumped when something fails."""
+
+import itertools
+import threading
+import time
+from typing import Any, NamedTuple
+
+from yaplogger.utils import SeverityLevel
+
+
+class RecordedEntry(NamedTuple):
+    """A record kept by the flight recorder, exactly as it was logged and not rendered yet."""
+
+    sequence: int
+    level: SeverityLevel
+    time_ns: int
+    message: Any
+    args: tuple[Any, ...]
+    extra_value: Any
+    kwargs: dict[str, Any] | None
+
+
+class FlightRecorder:
+    """Keeps the last records logged below the sink level, so they can be written once an error occurs.
+
+    Capturing a record stores a single tuple in a preallocated slot of the ring: nothing is formatted, bound or
+    written, and a deferred message is kept as is. Slots are picked from an atomic counter, so capturing takes no
+    lock, and every slot is replaced with one assignment, so a dump never reads a half-written entry. Memory is
+    bounded by the capacity, although the message arguments stay referenced until their slot is reused.
+
+    Dumping returns the entries captured since the previous dump, oldest first.
+    """
+
+    __slots__ = ("_dump_lock", "_dumped", "_entries", "_sequence", "capacity", "level", "trigger_level")
+
+    def __init__(
+        self,
+        capacity: int = 1_000,
+        *,
+        level: SeverityLevel = SeverityLevel.TRACE,
+        trigger_level: SeverityLevel = SeverityLevel.ERROR,
+    ) -> None:
+        """Flight recorder init method.
+
+        Args:
+            capacity (int): Number of records kept; older ones are overwritten.
+            level (SeverityLevel): Minimum severity level captured.
+            trigger_level (SeverityLevel): Severity level of the records that dump the recorder when logged.
+        """
+        if capacity < 1:
+            msg = "capacity must be positive."
+            raise ValueError(msg)
+
+        self.capacity = capacity
+        self.level = level
+        self.trigger_level = trigger_level
+        self._entries: list[RecordedEntry | None] = [None] * capacity
+        self._sequence = itertools.count(1)
+        self._dumped = 0
+        self._dump_lock = threading.Lock()
+
+    def capture(
+        self,
+        level: SeverityLevel,
+        message: Any,  # noqa: ANN401
+        args: tuple[Any, ...],
+        extra_value: Any,  # noqa: ANN401
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Store a record in the ring, overwriting the oldest one once full."""
+        sequence = next(self._sequence)
+        self._entries[sequence % self.capacity] = RecordedEntry(
+            sequence,
+            level,
+            time.time_ns(),
+            message,
+            args,
+            extra_value,
+            kwargs or None,
+        )
+
+    def dump(self, limit: int | None = None) -> list[RecordedEntry]:
+        """Take the entries captured since the previous dump, oldest first.
+
+        Args:
+            limit (int | None): Only take the most recent entries, up to this number.
+
+        Returns:
+            list[RecordedEntry]: The entries, which will not be returned by later dumps.
+        """
+        with self._dump_lock:
+            entries = sorted(
+                (entry for entry in self._entries if entry is not None and entry.sequence > self._dumped),
+                key=lambda entry: entry.sequence,
+            )
+            if entries:
+                self._dumped = entries[-1].sequence
+        return entries[-limit:] if limit else entries
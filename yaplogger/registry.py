@@ -0,0 +1,297 @@
+# whoami::./yaplogger/registry.py
+"""Registry of lightweight per-execution loggers sharing the process sinks."""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from yaplogger.config import Config
+from yaplogger.constants import Constants
+from yaplogger.emitter import LogEmitter, context_fields
+from yaplogger.formatter import TimestampCache
+from yaplogger.metrics import LogMetrics
+from yaplogger.steps import StepStatistics
+from yaplogger.summary import RecordStatistics
+from yaplogger.tracebacks import ExceptionRenderer
+
+if TYPE_CHECKING:
+    from yaplogger.sinks.buffered import ThreadBufferedSink
+
+_CURRENT_EXECUTION: "ContextVar[ExecutionLog | None]" = ContextVar("yaplogger_current_execution", default=None)
+
+
+def current_execution() -> "ExecutionLog | None":
+    """Execution logger in use in the current thread or task, see ``Log.use_execution``."""
+    return _CURRENT_EXECUTION.get()
+
+
+class ExecutionLog(LogEmitter):
+    """Logger of a single execution, identified by its own process UID.
+
+    The execution context is bound to loguru's logger once, when the execution logger is created, so its records
+    carry the execution ``process_uid`` and ``process_name`` while being written by the sinks configured on ``Log``.
+    The level gate is kept in sync with those sinks by the registry.
+
+    Attributes:
+    ----------
+    parameters : dict[str, Any]
+        The execution configuration.
+    last_used : float
+        Monotonic time of the last lookup, used for the LRU and TTL eviction.
+    """
+
+    __slots__ = (
+        "_context",
+        "_exceptions",
+        "_logger",
+        "_metrics",
+        "_min_level",
+        "_record_statistics",
+        "_recorder",
+        "_sink_level",
+        "_step_statistics",
+        "_thread_sink",
+        "_throttle",
+        "_timestamps",
+        "last_used",
+        "parameters",
+    )
+
+    def __init__(
+        self,
+        parameters: dict[str, Any],
+        min_level: int,
+        timestamps: TimestampCache,
+        metrics: LogMetrics | None = None,
+        summary_size: int = 32,
+        thread_sink: "ThreadBufferedSink | None" = None,
+        exceptions: ExceptionRenderer | None = None,
+    ) -> None:
+        """Execution logger init method.
+
+        Args:
+            parameters (dict[str, Any]): The execution configuration, process UID included.
+            min_level (int): The lowest severity level accepted by the sinks.
+            timestamps (TimestampCache): The timestamp cache shared with the process logger.
+            metrics (LogMetrics | None): The metrics shared with the process logger, when enabled.
+            summary_size (int): Message templates tracked by the execution summary, disabled when zero.
+            thread_sink (ThreadBufferedSink | None): The thread buffered sink of the process logger, if configured.
+            exceptions (ExceptionRenderer | None): The exception renderer shared with the process logger, if any.
+        """
+        self.parameters = parameters
+        self._context = context_fields(
+            parameters[Constants.PROCESS_UID_KEY],
+            parameters[Constants.PROCESS_NAME_KEY],
+            parameters[Constants.PROCESS_EXTRAS_KEY],
+        )
+        self._logger = logger.bind(**self._context)
+        self._thread_sink = thread_sink
+        self._timestamps = timestamps
+        self._step_statistics = StepStatistics()
+        self._throttle = None
+        self._recorder = None
+        self._metrics = metrics
+        self._exceptions = exceptions
+        self._record_statistics = (
+            RecordStatistics(parameters[Constants.PROCESS_UID_KEY], summary_size) if summary_size else None
+        )
+        self._set_sink_level(min_level)
+        self.last_used = time.monotonic()
+
+    @property
+    def process_uid(self) -> str:
+        """The execution process UID."""
+        return self.parameters[Constants.PROCESS_UID_KEY]
+
+
+class ExecutionScope:
+    """Context manager making an execution logger the current one, in a thread or asyncio task.
+
+    The execution logger is kept in a context variable, so concurrent tasks each see the execution they entered,
+    and tasks created within the scope inherit it.
+    """
+
+    __slots__ = ("_execution", "_token")
+
+    def __init__(self, execution: ExecutionLog) -> None:
+        """Execution scope init method.
+
+        Args:
+            execution (ExecutionLog): The execution logger made current.
+        """
+        self._execution = execution
+        self._token: Token[ExecutionLog | None] | None = None
+
+    def __enter__(self) -> ExecutionLog:
+        """Make the execution logger the current one and return it."""
+        self._token = _CURRENT_EXECUTION.set(self._execution)
+        return self._execution
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Restore the execution logger current before the scope."""
+        if self._token is not None:
+            _CURRENT_EXECUTION.reset(self._token)
+            self._token = None
+
+
+class LogRegistry:
+    """Keeps the execution loggers of a process, keyed by process UID.
+
+    Lookups read the underlying dictionary without any lock. Only the creation of a missing execution logger takes
+    the registry lock, which is private to the registry, so concurrent lookups never wait on each other nor on the
+    singleton lock. Entries idle for longer than the TTL are treated as missing and replaced, and once the registry
+    grows past its maximum size, expired entries and then the least recently used tenth of the entries are evicted
+    in one sweep, which keeps the amortized creation cost bounded. Evicted and replaced execution loggers log their
+    summary first, once the lock is released, since ``Log.finish`` only sees the registered ones.
+    """
+
+    def __init__(
+        self,
+        min_level: int,
+        timestamps: TimestampCache,
+        *,
+        max_size: int = 10_000,
+        ttl: float | None = 3600.0,
+    ) -> None:
+        """Log registry init method.
+
+        Args:
+            min_level (int): The lowest severity level accepted by the sinks.
+            timestamps (TimestampCache): The timestamp cache shared with the process logger.
+            max_size (int): Number of execution loggers above which the eviction sweep runs.
+            ttl (float | None): Seconds an execution logger may stay unused before being evicted. Never when None.
+        """
+        if max_size < 1:
+            msg = "max_size must be positive."
+            raise ValueError(msg)
+
+        self._entries: dict[str, ExecutionLog] = {}
+        self._lock = threading.Lock()
+        self._min_level = min_level
+        self._timestamps = timestamps
+        self._max_size = max_size
+        self._ttl = ttl
+        self._metrics: LogMetrics | None = None
+        self._summary_size = 32
+        self._thread_sink: ThreadBufferedSink | None = None
+        self._exceptions: ExceptionRenderer | None = None
+
+    def __len__(self) -> int:
+        """Number of execution loggers currently registered."""
+        return len(self._entries)
+
+    def get(self, process_uid: str) -> ExecutionLog | None:
+        """Lock-free lookup of an execution logger, returning None when missing or expired."""
+        entry = self._entries.get(process_uid)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if self._ttl is not None and now - entry.last_used > self._ttl:
+            return None
+        entry.last_used = now
+        return entry
+
+    def get_or_create(self, parameters: dict[str, Any] | None) -> ExecutionLog:
+        """Return the execution logger of the given parameters, creating it when missing.
+
+        Args:
+            parameters (dict[str, Any] | None): The execution configuration. A random process UID is generated
+                when none is informed, so every such call creates a new execution logger.
+
+        Returns:
+            ExecutionLog: The execution logger.
+        """
+        process_uid = (parameters or {}).get(Constants.PROCESS_UID_KEY)
+        if process_uid and (entry := self.get(process_uid)) is not None:
+            return entry
+
+        configuration = Config.for_execution(parameters)
+        process_uid = configuration[Constants.PROCESS_UID_KEY]
+        with self._lock:
+            if (entry := self.get(process_uid)) is not None:
+                return entry
+
+            expired = self._entries.get(process_uid)
+            evicted = [expired] if expired is not None else []
+            entry = ExecutionLog(
+                configuration,
+                self._min_level,
+                self._timestamps,
+                self._metrics,
+                self._summary_size,
+                self._thread_sink,
+                self._exceptions,
+            )
+            self._entries[process_uid] = entry
+            if len(self._entries) > self._max_size:
+                evicted += self._evict()
+
+        for execution in evicted:
+            summary = execution.execution_summary()
+            if summary is not None and summary.records:
+                execution.log_execution_summary()
+        return entry
+
+    def remove(self, process_uid: str) -> None:
+        """Forget an execution logger, typically once its execution is over."""
+        with self._lock:
+            self._entries.pop(process_uid, None)
+
+    def set_min_level(self, min_level: int) -> None:
+        """Propagate a new sink minimum level to every execution logger."""
+        self._min_level = min_level
+        for entry in list(self._entries.values()):
+            entry._set_sink_level(min_level)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def set_metrics(self, metrics: LogMetrics | None) -> None:
+        """Share the process logger metrics with every execution logger, or stop collecting them when None."""
+        self._metrics = metrics
+        for entry in list(self._entries.values()):
+            entry._metrics = metrics  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def set_thread_sink(self, sink: "ThreadBufferedSink | None") -> None:
+        """Share the thread buffered sink of the process logger with every execution logger, or stop when None."""
+        self._thread_sink = sink
+        for entry in list(self._entries.values()):
+            entry._thread_sink = sink  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def set_exceptions(self, exceptions: ExceptionRenderer | None) -> None:
+        """Share the exception renderer of the process logger with every execution logger, or stop when None."""
+        self._exceptions = exceptions
+        for entry in list(self._entries.values()):
+            entry._exceptions = exceptions  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def set_summary_size(self, summary_size: int) -> None:
+        """Set the number of message templates tracked by the summary of the execution loggers created from now on."""
+        self._summary_size = summary_size
+
+    def executions(self) -> list[ExecutionLog]:
+        """The execution loggers currently registered."""
+        return list(self._entries.values())
+
+    def _evict(self) -> list[ExecutionLog]:
+        """Evict the expired entries, then the least recently used ones, with the lock held; returns them."""
+        evicted: list[ExecutionLog] = []
+        if self._ttl is not None:
+            deadline = time.monotonic() - self._ttl
+            expired = [uid for uid, entry in self._entries.items() if entry.last_used < deadline]
+            evicted.extend(self._entries.pop(process_uid) for process_uid in expired)
+
+        excess = len(self._entries) - self._max_size
+        if excess <= 0:
+            return evicted
+
+        by_age = sorted(self._entries.items(), key=lambda item: item[1].last_used)
+        for process_uid, _ in by_age[: max(excess, self._max_size // 10)]:
+            evicted.append(self._entries.pop(process_uid))
+        return evicted
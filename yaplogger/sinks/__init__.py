@@ -0,0 +1,53 @@
+# whoami::./yaplogger/sinks/__init__.py
+"""YapLogger Sinks.
+
+Sinks are imported from their module on first access, so importing YapLogger does not pay for the network, file
+and routing machinery of sinks that are never used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from yaplogger.sinks.background import BackgroundSink  # noqa: TCH004
+    from yaplogger.sinks.binary import BinaryFileSink, BinaryLogReader  # noqa: TCH004
+    from yaplogger.sinks.buffered import ThreadBufferedSink  # noqa: TCH004
+    from yaplogger.sinks.ndjson import NDJSONFileSink  # noqa: TCH004
+    from yaplogger.sinks.network import NetworkSink  # noqa: TCH004
+    from yaplogger.sinks.router import SinkRoute, SinkRouter  # noqa: TCH004
+    from yaplogger.sinks.stream import TextStreamSink  # noqa: TCH004
+
+_MODULES: dict[str, str] = {
+    "BackgroundSink": "background",
+    "BinaryFileSink": "binary",
+    "BinaryLogReader": "binary",
+    "NDJSONFileSink": "ndjson",
+    "NetworkSink": "network",
+    "SinkRoute": "router",
+    "SinkRouter": "router",
+    "TextStreamSink": "stream",
+    "ThreadBufferedSink": "buffered",
+}
+
+__all__ = [
+    "BackgroundSink",
+    "BinaryFileSink",
+    "BinaryLogReader",
+    "NDJSONFileSink",
+    "NetworkSink",
+    "SinkRoute",
+    "SinkRouter",
+    "TextStreamSink",
+    "ThreadBufferedSink",
+]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a sink from its module on first access."""
+    module = _MODULES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,261 @@
+# whoami::./yaplogger/sinks/background.py
+"""Non-blocking sink that hands formatted records over to a dedicated writer thread."""
+
+import atexit
+import os
+import sys
+import threading
+import traceback
+import weakref
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from yaplogger.utils import OverflowPolicy, SeverityLevel
+
+_LIVE_SINKS: "weakref.WeakSet[BackgroundSink]" = weakref.WeakSet()
+
+
+class BackgroundSink:
+    """Delivers log records to a stream from a dedicated writer thread.
+
+    Loguru hands every formatted record to ``write``, which only appends it to a bounded in-memory queue, so the
+    calling thread never waits on terminal or pipe I/O. The writer thread wakes up whenever a full batch is
+    queued or the flush interval elapses, and writes the whole batch with a single ``write``/``flush`` pair.
+
+    When the queue is full, the configured overflow policy decides what happens to the incoming record. TRACE and
+    DEBUG records are kept in their own lane under ``DROP_DEBUG_FIRST``, and both lanes are merged back by sequence
+    number, so the output order is always the emission order.
+
+    When a render function is given, loguru's own formatting is bypassed and records are rendered by the writer
+    thread, so the calling thread only pays for the append.
+
+    The queue is drained when the sink is stopped, which loguru does when the handler is removed, and at the
+    latest on interpreter exit. In a forked child, the locks are recreated, the records queued by the parent are
+    discarded, since the parent writes them, and a new writer thread is started.
+
+    Attributes:
+    ----------
+    bytes_written : int
+        Number of bytes written to the stream, UTF-8 encoded, counted by the writer thread.
+    dropped : int
+        Number of records discarded by the overflow policy.
+    queue_depth : int
+        Number of records waiting to be written.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        *,
+        capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+        sample_every: int = 10,
+        render: Callable[[Any], str] | None = None,
+    ) -> None:
+        """Background sink init method.
+
+        Args:
+            stream (TextIO): The stream the writer thread writes to.
+            capacity (int): Maximum number of records waiting in the queue.
+            overflow_policy (OverflowPolicy): What to do with a record arriving while the queue is full.
+            batch_size (int): Number of queued records that wakes the writer thread up before the interval.
+            flush_interval (float): Maximum time, in seconds, a record waits in the queue.
+            sample_every (int): Under ``SAMPLE``, one out of this many overflowing records is kept.
+            render (Callable[[Any], str] | None): Renders the loguru record carried by each message on the writer
+                thread. The message text is written as is when None.
+        """
+        if capacity < 1 or batch_size < 1 or sample_every < 1:
+            msg = "capacity, batch_size and sample_every must be positive."
+            raise ValueError(msg)
+
+        self._stream = stream
+        self._capacity = capacity
+        self._policy = overflow_policy
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._sample_every = sample_every
+        self._render = render
+
+        self._high: deque[tuple[int, str]] = deque()
+        self._low: deque[tuple[int, str]] = deque()
+        self._sequence = 0
+        self._overflow_count = 0
+        self._dropped = 0
+        self._written = 0
+        self._in_flight = 0
+        self._closed = False
+
+        self._start_writer()
+        atexit.register(self.stop)
+        _LIVE_SINKS.add(self)
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes written to the stream, UTF-8 encoded, counted by the writer thread."""
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Number of records discarded by the overflow policy."""
+        return self._dropped
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records waiting to be written."""
+        return len(self._high) + len(self._low)
+
+    def write(self, message: str) -> None:
+        """Queue a formatted record for the writer thread."""
+        is_low = self._policy is OverflowPolicy.DROP_DEBUG_FIRST and self._level_of(message) < SeverityLevel.INFO
+
+        with self._lock:
+            if self._closed:
+                self._stream.write(message)
+                return
+
+            if len(self._high) + len(self._low) >= self._capacity and not self._make_room(is_low=is_low):
+                self._dropped += 1
+                return
+
+            self._sequence += 1
+            (self._low if is_low else self._high).append((self._sequence, message))
+            if len(self._high) + len(self._low) >= self._batch_size:
+                self._not_empty.notify()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued record has been written.
+
+        Args:
+            timeout (float | None): Maximum time to wait, in seconds. Waits indefinitely when None.
+
+        Returns:
+            bool: True when the queue was drained, False when the timeout expired first.
+        """
+        with self._lock:
+            self._not_empty.notify()
+            return self._idle.wait_for(lambda: not (self._high or self._low or self._in_flight), timeout)
+
+    def stop(self) -> None:
+        """Stop the writer thread after writing every queued record. Calling it again is a no-op."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        self._thread.join()
+        atexit.unregister(self.stop)
+
+    def _start_writer(self) -> None:
+        """Create the synchronization primitives and start the writer thread."""
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._thread = threading.Thread(target=self._run, name="yaplogger-background-sink", daemon=True)
+        self._thread.start()
+
+    def _reset_after_fork(self) -> None:
+        """Make the sink usable in a forked child, where the locks may be held and the writer thread is gone."""
+        self._high.clear()
+        self._low.clear()
+        self._in_flight = 0
+        if not self._closed:
+            self._start_writer()
+
+    @staticmethod
+    def _level_of(message: str) -> int:
+        """Severity of a loguru message, which carries its record; plain strings are treated as INFO."""
+        record: Any = getattr(message, "record", None)
+        return record["level"].no if record is not None else SeverityLevel.INFO
+
+    def _make_room(self, *, is_low: bool) -> bool:
+        """Apply the overflow policy with the lock held; returns whether the incoming record may be queued."""
+        if self._policy is OverflowPolicy.BLOCK:
+            self._not_full.wait_for(lambda: self._closed or len(self._high) + len(self._low) < self._capacity)
+            return not self._closed
+
+        if self._policy is OverflowPolicy.DROP_DEBUG_FIRST:
+            if self._low:
+                self._low.popleft()
+            elif is_low:
+                return False
+            else:
+                self._high.popleft()
+            self._dropped += 1
+            return True
+
+        if self._policy is OverflowPolicy.SAMPLE:
+            self._overflow_count += 1
+            if self._overflow_count % self._sample_every:
+                return False
+
+        self._pop_oldest()
+        self._dropped += 1
+        return True
+
+    def _pop_oldest(self) -> str:
+        """Remove and return the oldest queued record across both lanes."""
+        if not self._low or (self._high and self._high[0][0] < self._low[0][0]):
+            return self._high.popleft()[1]
+        return self._low.popleft()[1]
+
+    def _take_batch(self) -> list[str]:
+        """Remove up to one batch of records from the queue, in emission order."""
+        batch: list[str] = []
+        while len(batch) < self._batch_size and (self._high or self._low):
+            batch.append(self._pop_oldest())
+        return batch
+
+    def _run(self) -> None:
+        """Writer thread loop: wait for a batch or the flush interval, then write what is queued."""
+        while True:
+            with self._lock:
+                if not (self._high or self._low or self._closed):
+                    self._not_empty.wait(self._flush_interval)
+
+                batch = self._take_batch()
+                if not batch:
+                    self._idle.notify_all()
+                    if self._closed:
+                        return
+                    continue
+
+                self._in_flight = len(batch)
+                self._not_full.notify_all()
+
+            self._write(batch)
+
+            with self._lock:
+                self._in_flight = 0
+                if not (self._high or self._low):
+                    self._idle.notify_all()
+
+    def _write(self, batch: list[str]) -> None:
+        """Write a batch to the stream, reporting failures to stderr instead of killing the writer thread."""
+        try:
+            if self._render is not None:
+                render = self._render
+                batch = [
+                    render(record) if (record := getattr(message, "record", None)) else message for message in batch
+                ]
+            text = "".join(batch)
+            self._stream.write(text)
+            self._stream.flush()
+            self._written += len(text.encode("utf-8", "surrogatepass"))
+        except Exception:  # noqa: BLE001
+            sys.stderr.write("--- YapLogger background sink failed to write a batch ---\n")
+            traceback.print_exc(file=sys.stderr)
+
+
+def _reset_sinks_after_fork() -> None:
+    """Reset every live background sink in a forked child."""
+    for sink in list(_LIVE_SINKS):
+        sink._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(after_in_child=_reset_sinks_after_fork)
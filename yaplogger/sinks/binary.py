@@ -0,0 +1,327 @@
+# whoami::./yaplogger/sinks/binary.py
+"""Compact binary log format: a buffered file sink writing it and a memory-mapped reader decoding it."""
+
+import mmap
+import os
+import struct
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from yaplogger.constants import Constants
+from yaplogger.extras import encode_extras
+
+MAGIC: bytes = b"YAPB"
+VERSION: int = 2
+INLINE: int = 0xFFFFFFFF
+
+FRAME_HEADER: bytes = b"H"
+FRAME_STRING: bytes = b"S"
+FRAME_RECORD: bytes = b"R"
+
+_LENGTH = struct.Struct("<I")
+_HEADER = struct.Struct("<4sB")
+_SEGMENT = struct.Struct("<Q")
+_STRING = struct.Struct("<I")
+_RECORD_HEAD = struct.Struct("<qB")
+_FIELD_COUNT = struct.Struct("<H")
+_REFERENCE = struct.Struct("<I")
+
+_SKIPPED_FIELDS: frozenset[str] = frozenset(
+    {Constants.PROCESS_UID_KEY, Constants.PROCESS_NAME_KEY, Constants.PROCESS_EXTRAS_KEY, "generated_timestamp"},
+)
+_LIVE_SINKS: "weakref.WeakSet[BinaryFileSink]" = weakref.WeakSet()
+
+
+class BinaryRecord(NamedTuple):
+    """A record decoded from a binary log file."""
+
+    time_us: int
+    level: int
+    process_uid: str
+    process_name: str
+    message: str
+    fields: dict[str, str]
+
+
+class BinaryFileSink:
+    """Writes records to a file in YapLogger's compact binary format.
+
+    The file is a sequence of frames, each prefixed with its length as a little-endian ``uint32`` and starting with
+    a one-byte frame type:
+
+    - ``H``: segment header, the ``YAPB`` magic, the format version and a random ``uint64`` segment id. Each
+      segment has its own string table, which the frames following the header refer to.
+    - ``S``: string definition, a ``uint32`` id followed by the UTF-8 text.
+    - ``R``: record: the record time in microseconds since the epoch and the ``SeverityLevel`` value, packed as
+      ``<qB``, then the string references of the process UID, process name and message, then the number of
+      fields as a ``uint16``. Each field follows as the string reference of its key, then of its value.
+
+    Strings are interned: the first time a string is written it gets a ``S`` frame, and its reference is then its
+    id as a ``uint32``. Messages and field values longer than ``intern_limit`` characters, and every string once
+    the table holds ``max_strings`` entries, are written inline instead: the ``INLINE`` id, a ``uint32`` length and
+    the UTF-8 text. Field values that are not strings are written as their ``str``, and decoded as strings.
+    Empty fields are not written, and ``generated_timestamp`` is only written for records replayed from the flight
+    recorder, since it is otherwise the record time. The process extras are written as their JSON encoding, which
+    is always interned, so it is stored once per segment whatever its length.
+
+    Every sink writes its own segment, so a file can be appended to and decoded without the writer's state. The
+    buffer is written with a single append that starts with the segment header and ends on a frame boundary, so
+    processes sharing the file, such as a parent and its forked children, can interleave their writes. The buffer is
+    flushed before the process forks, and the child starts a segment of its own, with an empty string table.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        buffer_size: int = 1 << 20,
+        intern_limit: int = 64,
+        max_strings: int = 1 << 16,
+    ) -> None:
+        """Binary file sink init method.
+
+        Args:
+            path (str | Path): The file records are appended to.
+            buffer_size (int): Size, in bytes, of the write buffer.
+            intern_limit (int): Longest message or field value, in characters, that is interned.
+            max_strings (int): Number of interned strings above which strings are written inline.
+        """
+        self._path = Path(path)
+        self._buffer_size = buffer_size
+        self._intern_limit = intern_limit
+        self._max_strings = max_strings
+        self._strings: dict[str, bytes] = {}
+        self._header = b""
+        self._buffer = bytearray()
+        self._written = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("ab", buffering=0)
+        self._start_segment()
+        _LIVE_SINKS.add(self)
+
+    @property
+    def path(self) -> Path:
+        """The file written to."""
+        return self._path
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes written to the file by this sink."""
+        return self._written
+
+    def write(self, message: str) -> None:
+        """Encode the record carried by a loguru message and append it to the file."""
+        record: Any = getattr(message, "record", None)
+        if record is None:
+            return
+
+        extra: dict[str, Any] = record["extra"]
+        message_text: str = record["message"]
+        fields: list[bytes] = []
+        for key, value in extra.items():
+            if key in _SKIPPED_FIELDS or value is None or value == "":
+                continue
+            fields.append(self._reference(key, intern=True))
+            text = value if isinstance(value, str) else str(value)
+            fields.append(self._reference(text, intern=len(text) <= self._intern_limit))
+        extras = extra.get(Constants.PROCESS_EXTRAS_KEY)
+        if extras:
+            fields.append(self._reference(Constants.PROCESS_EXTRAS_KEY, intern=True))
+            fields.append(self._reference(encode_extras(extras), intern=True))
+        if "recorded" in extra:
+            fields.append(self._reference("generated_timestamp", intern=True))
+            fields.append(self._reference(extra["generated_timestamp"], intern=False))
+
+        self._write_frame(
+            b"".join(
+                (
+                    FRAME_RECORD,
+                    _RECORD_HEAD.pack(int(record["time"].timestamp() * 1_000_000), record["level"].no),
+                    self._reference(str(extra.get(Constants.PROCESS_UID_KEY, "")), intern=True),
+                    self._reference(str(extra.get(Constants.PROCESS_NAME_KEY, "")), intern=True),
+                    self._reference(message_text, intern=len(message_text) <= self._intern_limit),
+                    _FIELD_COUNT.pack(len(fields) // 2),
+                    *fields,
+                ),
+            ),
+        )
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def drain(self) -> None:
+        """Flush the write buffer to the file."""
+        self._flush()
+
+    def stop(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self._flush()
+            self._file.close()
+
+    def _reference(self, text: str, *, intern: bool) -> bytes:
+        """Encoded reference to a string, defining it first when it is interned for the first time."""
+        reference = self._strings.get(text)
+        if reference is not None:
+            return reference
+
+        if not intern or len(self._strings) >= self._max_strings:
+            encoded = text.encode()
+            return _REFERENCE.pack(INLINE) + _LENGTH.pack(len(encoded)) + encoded
+
+        string_id = len(self._strings)
+        reference = self._strings[text] = _REFERENCE.pack(string_id)
+        self._write_frame(FRAME_STRING + _STRING.pack(string_id) + text.encode())
+        return reference
+
+    def _write_frame(self, frame: bytes) -> None:
+        """Append a frame to the buffer, prefixed with its length."""
+        self._buffer += _LENGTH.pack(len(frame))
+        self._buffer += frame
+
+    def _flush(self) -> None:
+        """Append the buffered frames to the file, behind the segment header, in a single write."""
+        if len(self._buffer) == len(self._header) or self._file.closed:
+            return
+        chunk = memoryview(self._buffer)
+        while chunk:
+            chunk = chunk[self._file.write(chunk) :]
+        self._written += len(self._buffer)
+        self._buffer = bytearray(self._header)
+
+    def _start_segment(self) -> None:
+        """Start a new segment, with a fresh segment id and an empty string table."""
+        header = FRAME_HEADER + _HEADER.pack(MAGIC, VERSION) + os.urandom(_SEGMENT.size)
+        self._header = _LENGTH.pack(len(header)) + header
+        self._buffer = bytearray(self._header)
+        self._strings = {}
+
+    def _flush_before_fork(self) -> None:
+        """Flush the buffer, so the forked child does not inherit pending frames."""
+        self._flush()
+
+    def _reset_after_fork(self) -> None:
+        """Start a segment of the child's own, so its string ids do not collide with the parent's."""
+        self._start_segment()
+
+
+class BinaryLogReader:
+    """Decodes a binary log file through a memory map, to be used as ``with BinaryLogReader(path) as reader:``.
+
+    Frames are decoded in place with ``struct.unpack_from``, so scanning a file never copies it nor reads more
+    than the frames being decoded. Strings are only decoded once per segment, and each segment keeps its own string
+    table, since the segments of several processes may be interleaved.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Binary log reader init method.
+
+        Args:
+            path (str | Path): The binary log file.
+        """
+        self._file = Path(path).open("rb")  # noqa: SIM115
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+    def __enter__(self) -> Self:
+        """Return the reader."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the memory map and the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the memory map and the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __iter__(self) -> Iterator[BinaryRecord]:
+        """Decode the records of the file, in order.
+
+        Raises:
+            ValueError: If the file is not a binary log file of a supported version, or is truncated.
+        """
+        data = self._map
+        if data is None:
+            return
+
+        tables: dict[int, list[str]] = {}
+        strings: list[str] = []
+        offset = 0
+        end = len(data)
+        while offset + _LENGTH.size <= end:
+            (length,) = _LENGTH.unpack_from(data, offset)
+            start = offset + _LENGTH.size
+            offset = start + length
+            if offset > end:
+                msg = "Truncated binary log frame."
+                raise ValueError(msg)
+
+            frame_type = data[start : start + 1]
+            if frame_type == FRAME_RECORD:
+                yield self._decode_record(data, start + 1, strings)
+            elif frame_type == FRAME_STRING:
+                strings.append(data[start + 1 + _STRING.size : offset].decode())
+            elif frame_type == FRAME_HEADER:
+                magic, version = _HEADER.unpack_from(data, start + 1)
+                if magic != MAGIC or version != VERSION:
+                    msg = f"Unsupported binary log segment: {magic!r} version {version}."
+                    raise ValueError(msg)
+                (segment,) = _SEGMENT.unpack_from(data, start + 1 + _HEADER.size)
+                strings = tables.setdefault(segment, [])
+            else:
+                msg = f"Unknown binary log frame type: {frame_type!r}."
+                raise ValueError(msg)
+
+    @staticmethod
+    def _decode_record(data: mmap.mmap, offset: int, strings: list[str]) -> BinaryRecord:
+        """Decode a record frame whose payload starts at the given offset."""
+
+        def string() -> str:
+            nonlocal offset
+            reference: int = _REFERENCE.unpack_from(data, offset)[0]
+            offset += _REFERENCE.size
+            if reference != INLINE:
+                return strings[reference]
+            length: int = _LENGTH.unpack_from(data, offset)[0]
+            offset += _LENGTH.size + length
+            return data[offset - length : offset].decode()
+
+        time_us, level = _RECORD_HEAD.unpack_from(data, offset)
+        offset += _RECORD_HEAD.size
+        process_uid = string()
+        process_name = string()
+        message = string()
+        (field_count,) = _FIELD_COUNT.unpack_from(data, offset)
+        offset += _FIELD_COUNT.size
+        fields: dict[str, str] = {}
+        for _ in range(field_count):
+            key = string()
+            fields[key] = string()
+        return BinaryRecord(time_us, level, process_uid, process_name, message, fields)
+
+
+def _flush_sinks_before_fork() -> None:
+    """Flush every live binary sink before the process forks."""
+    for sink in list(_LIVE_SINKS):
+        sink._flush_before_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def _reset_sinks_after_fork() -> None:
+    """Start a new segment in every live binary sink of a forked child."""
+    for sink in list(_LIVE_SINKS):
+        sink._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(before=_flush_sinks_before_fork, after_in_child=_reset_sinks_after_fork)
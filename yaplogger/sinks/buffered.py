@@ -0,0 +1,185 @@
+# whoami::./yaplogger/sinks/buffered.py
+"""Sink rendering records in their emitting thread and writing them in per-thread batches."""
+
+import atexit
+import os
+import sys
+import threading
+import traceback
+import weakref
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from loguru import logger
+
+from yaplogger.utils import SeverityLevel
+
+_LIVE_SINKS: "weakref.WeakSet[ThreadBufferedSink]" = weakref.WeakSet()
+
+
+class _ThreadBuffer:
+    """Records rendered by one thread and not written yet."""
+
+    __slots__ = ("lines", "lock", "thread")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.lock = threading.Lock()
+        self.lines: list[str] = []
+        self.thread = thread
+
+
+class ThreadBufferedSink:
+    """Writes records to a stream in batches accumulated separately by every emitting thread.
+
+    Unlike the other sinks, it is not a loguru handler: the logger hands records to ``emit`` directly, so they
+    neither go through loguru's formatting nor wait on its handler lock. Each record is rendered by the calling
+    thread and appended to that thread's buffer, guarded by a lock only ever contended by the flusher. A buffer is
+    written with a single ``write``/``flush`` pair once it holds ``buffer_size`` records, as soon as it receives a
+    record at ``flush_level`` or above, and at the latest after ``flush_interval`` seconds, by a flusher thread.
+
+    Records of a thread are written in emission order, and a buffer is written while its lock is held, so two
+    batches of the same thread can never be swapped. Batches of different threads are interleaved as they are
+    flushed, which is why records are not globally sorted by timestamp.
+
+    Buffers are written when the sink is stopped, and at the latest on interpreter exit. In a forked child, the
+    locks are recreated, the records buffered by the parent are discarded, since the parent writes them, and a new
+    flusher thread is started.
+
+    Attributes:
+    ----------
+    level : SeverityLevel
+        Minimum severity level written by the sink.
+    queue_depth : int
+        Number of records buffered and not written yet.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        render: Callable[[Any], str],
+        level: SeverityLevel = SeverityLevel.INFO,
+        *,
+        buffer_size: int = 256,
+        flush_interval: float = 0.2,
+        flush_level: SeverityLevel = SeverityLevel.ERROR,
+    ) -> None:
+        """Thread buffered sink init method.
+
+        Args:
+            stream (TextIO): The stream the batches are written to.
+            render (Callable[[Any], str]): Renders a loguru-like record, see ``CompiledFormatter.format``.
+            level (SeverityLevel): Minimum severity level written by the sink.
+            buffer_size (int): Number of records of a thread that triggers the write of its buffer.
+            flush_interval (float): Maximum time, in seconds, a record waits in its thread's buffer.
+            flush_level (SeverityLevel): Severity level from which a record is written at once, with the records
+                buffered before it by the same thread.
+        """
+        if buffer_size < 1 or flush_interval <= 0:
+            msg = "buffer_size and flush_interval must be positive."
+            raise ValueError(msg)
+
+        self.level = level
+        self._stream = stream
+        self._render = render
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._flush_level = flush_level
+        self._levels: dict[SeverityLevel, Any] = {severity: logger.level(severity.name) for severity in SeverityLevel}
+        self._closed = False
+
+        self._start_flusher()
+        atexit.register(self.stop)
+        _LIVE_SINKS.add(self)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records buffered and not written yet."""
+        return sum(len(buffer.lines) for buffer in list(self._buffers))
+
+    def emit(self, level: SeverityLevel, message: str, extra: dict[str, Any]) -> None:
+        """Render a record in the calling thread and append it to that thread's buffer.
+
+        Args:
+            level (SeverityLevel): The record severity level.
+            message (str): The formatted message.
+            extra (dict[str, Any]): The record fields, as loguru would have bound them.
+        """
+        text = self._render({"extra": extra, "level": self._levels[level], "message": message, "exception": None})
+        try:
+            buffer: _ThreadBuffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+
+        with buffer.lock:
+            lines = buffer.lines
+            lines.append(text)
+            if self._closed or len(lines) >= self._buffer_size or level >= self._flush_level:
+                self._write(buffer)
+
+    def drain(self) -> None:
+        """Write the records buffered by every thread."""
+        for buffer in list(self._buffers):
+            with buffer.lock:
+                if buffer.lines:
+                    self._write(buffer)
+
+    def stop(self) -> None:
+        """Stop the flusher thread after writing every buffered record. Calling it again is a no-op."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stopping.set()
+        self._thread.join()
+        self.drain()
+        atexit.unregister(self.stop)
+
+    def _start_flusher(self) -> None:
+        """Create the synchronization primitives and the buffers registry, and start the flusher thread."""
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+        self._stream_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="yaplogger-thread-buffered-sink", daemon=True)
+        self._thread.start()
+
+    def _reset_after_fork(self) -> None:
+        """Make the sink usable in a forked child, where the locks may be held and the flusher thread is gone."""
+        if not self._closed:
+            self._start_flusher()
+
+    def _register(self) -> _ThreadBuffer:
+        """Create the buffer of the calling thread."""
+        buffer = _ThreadBuffer(threading.current_thread())
+        self._local.buffer = buffer
+        with self._buffers_lock:
+            self._buffers.append(buffer)
+        return buffer
+
+    def _run(self) -> None:
+        """Flusher thread loop: write every buffer once per interval, and forget those of finished threads."""
+        while not self._stopping.wait(self._flush_interval):
+            self.drain()
+            with self._buffers_lock:
+                self._buffers = [buffer for buffer in self._buffers if buffer.lines or buffer.thread.is_alive()]
+
+    def _write(self, buffer: _ThreadBuffer) -> None:
+        """Write a buffer with its lock held, reporting failures to stderr instead of raising in the caller."""
+        text = "".join(buffer.lines)
+        buffer.lines.clear()
+        try:
+            with self._stream_lock:
+                self._stream.write(text)
+                self._stream.flush()
+        except Exception:  # noqa: BLE001
+            sys.stderr.write("--- YapLogger thread buffered sink failed to write a batch ---\n")
+            traceback.print_exc(file=sys.stderr)
+
+
+def _reset_sinks_after_fork() -> None:
+    """Reset every live thread buffered sink in a forked child."""
+    for sink in list(_LIVE_SINKS):
+        sink._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(after_in_child=_reset_sinks_after_fork)
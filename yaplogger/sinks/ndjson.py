@@ -0,0 +1,296 @@
+# whoami::./yaplogger/sinks/ndjson.py
+"""Buffered NDJSON file sink with size/time rotation and background compression."""
+
+import gzip
+import json
+import os
+import shutil
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import Any
+
+from yaplogger.constants import Constants
+from yaplogger.extras import encode_extras
+from yaplogger.index import IndexWriter, index_path
+from yaplogger.utils import SeverityLevel
+
+_encode = encode_basestring_ascii
+_LIVE_SINKS: "weakref.WeakSet[NDJSONFileSink]" = weakref.WeakSet()
+
+
+def encode_json_value(value: Any) -> str:  # noqa: ANN401
+    """Encode a value as JSON, taking the C string encoder fast path for strings."""
+    if isinstance(value, str):
+        return _encode(value)
+    return json.dumps(value, default=str)
+
+
+class NDJSONSerializer:
+    """Renders loguru records as JSON lines.
+
+    Each line carries the ``process_uid``, ``process_name``, ``level``, ``timestamp``, ``message``, ``extra_value``,
+    ``exception_message`` and ``process_extras`` fields, plus ``worker_id`` for records of worker processes. Lines
+    are assembled from pre-encoded fragments instead of calling ``json.dumps`` on a fresh dict: the process fields
+    are encoded once per process, the level names once per level and the extras once per configuration, while the
+    per-record strings go through the C string encoder. The output is pure ASCII, so the character count of each
+    line is also its size in bytes.
+
+    The process fragment is cached together with the fields it was encoded from, as a single tuple, so threads
+    sharing the serializer never read the fragment of another process.
+    """
+
+    def __init__(self, process_extras: Any = None) -> None:  # noqa: ANN401
+        """NDJSON serializer init method.
+
+        Args:
+            process_extras (Any): Extras written with every record that does not carry its own ``process_extras``.
+        """
+        self._encoded_extras = encode_extras(process_extras)
+        self._level_fragments: dict[str, str] = {}
+        self._process: tuple[tuple[Any, Any], str] | None = None
+
+    def serialize(self, record: Any) -> str:  # noqa: ANN401
+        """Render a loguru record as a JSON line, newline included."""
+        extra = record["extra"]
+        process_key = (extra.get(Constants.PROCESS_UID_KEY), extra.get(Constants.PROCESS_NAME_KEY))
+        process = self._process
+        if process is None or process[0] != process_key:
+            process = self._process = (
+                process_key,
+                f'{{"{Constants.PROCESS_UID_KEY}":{encode_json_value(process_key[0])},'
+                f'"{Constants.PROCESS_NAME_KEY}":{encode_json_value(process_key[1])},"level":',
+            )
+
+        level_name = record["level"].name
+        level_fragment = self._level_fragments.get(level_name)
+        if level_fragment is None:
+            level_fragment = self._level_fragments[level_name] = _encode(level_name)
+
+        extras = extra.get(Constants.PROCESS_EXTRAS_KEY)
+        encoded_extras = self._encoded_extras if extras is None else encode_extras(extras)
+        worker_id = extra.get(Constants.WORKER_ID_KEY)
+        worker_fragment = "" if worker_id is None else f',"{Constants.WORKER_ID_KEY}":{encode_json_value(worker_id)}'
+
+        return (
+            f"{process[1]}{level_fragment}"
+            f',"timestamp":{encode_json_value(extra.get("generated_timestamp", ""))}'
+            f',"message":{_encode(record["message"])}'
+            f',"extra_value":{encode_json_value(extra.get("extra_value", ""))}'
+            f',"exception_message":{encode_json_value(extra.get("exception_message", ""))}'
+            f',"{Constants.PROCESS_EXTRAS_KEY}":{encoded_extras}{worker_fragment}}}\n'
+        )
+
+
+class NDJSONFileSink:
+    """Writes one JSON object per record to a file, rotating and compressing the file as it grows.
+
+    Lines are rendered by ``NDJSONSerializer``. Writes go through a large buffer that is flushed when it fills up,
+    on rotation, on ``drain`` and when the sink is stopped, and right after any record at ``flush_level`` or above,
+    so that errors reach the file even if the process crashes afterwards. Rotated segments are renamed with a UTC
+    timestamp and, when compression is on, gzipped by a background thread so the logging thread never pays for it.
+
+    With ``index`` set, a sidecar index mapping the process UID, level and time of every line to its offset is
+    written next to the file, see ``yaplogger.index``. A rotated segment keeps its index, unless it is compressed,
+    since offsets in the compressed file would be meaningless.
+
+    The buffer is appended to the file in a single write, and the offsets of its lines are taken from the position
+    of the file after that write, so they stay right when other processes append to the same file. The buffer is
+    flushed before the process forks, so a child never writes the parent's pending lines again, and the child
+    reopens the file and its index, so the two processes do not share a file position.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        process_extras: Any = None,  # noqa: ANN401
+        buffer_size: int = 1 << 20,
+        rotation_size: int | None = 128 << 20,
+        rotation_interval: float | None = None,
+        compress: bool = True,
+        index: bool = False,
+        flush_level: SeverityLevel = SeverityLevel.ERROR,
+    ) -> None:
+        """NDJSON file sink init method.
+
+        Args:
+            path (str | Path): The file records are appended to.
+            process_extras (Any): Extras written with every record that does not carry its own ``process_extras``.
+            buffer_size (int): Size, in bytes, of the write buffer.
+            rotation_size (int | None): Rotate once the file would grow past this size in bytes. Never when None.
+            rotation_interval (float | None): Rotate once the file is older than this many seconds. Never when None.
+            compress (bool): Whether rotated segments are gzipped.
+            index (bool): Whether a sidecar index of the file is written along with it.
+            flush_level (SeverityLevel): Severity level from which a record is flushed to the file at once, with
+                the records buffered before it.
+        """
+        self._path = Path(path)
+        self._buffer_size = buffer_size
+        self._rotation_size = rotation_size
+        self._rotation_interval = rotation_interval
+        self._compress = compress
+        self._flush_level = flush_level
+
+        self._serializer = NDJSONSerializer(process_extras)
+
+        self._compressor: ThreadPoolExecutor | None = None
+        self._pending: list[Future[None]] = []
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("ab", buffering=0)
+        self._size = self._file.tell()
+        self._written = 0
+        self._lines: list[str] = []
+        self._buffered = 0
+        self._entries: list[tuple[str, int, str, int]] = []
+        self._index = IndexWriter(index_path(self._path)) if index else None
+        self._rotate_at = time.monotonic() + rotation_interval if rotation_interval else None
+        _LIVE_SINKS.add(self)
+
+    @property
+    def path(self) -> Path:
+        """The file currently written to."""
+        return self._path
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes written by this sink, across rotations."""
+        return self._written
+
+    def write(self, message: str) -> None:
+        """Serialize the record carried by a loguru message and append it to the file."""
+        record: Any = getattr(message, "record", None)
+        if record is None:
+            return
+
+        line = self.serialize(record)
+        if (self._rotation_size is not None and self._size + len(line) > self._rotation_size and self._size) or (
+            self._rotate_at is not None and time.monotonic() >= self._rotate_at
+        ):
+            self.rotate()
+
+        if self._index is not None:
+            extra = record["extra"]
+            self._entries.append(
+                (
+                    str(extra.get(Constants.PROCESS_UID_KEY, "")),
+                    self._buffered,
+                    str(extra.get("generated_timestamp", "")),
+                    record["level"].no,
+                ),
+            )
+        self._lines.append(line)
+        self._buffered += len(line)
+        self._size += len(line)
+        if self._buffered >= self._buffer_size or record["level"].no >= self._flush_level:
+            self._flush()
+
+    def serialize(self, record: Any) -> str:  # noqa: ANN401
+        """Render a loguru record as a JSON line, newline included."""
+        return self._serializer.serialize(record)
+
+    def rotate(self) -> None:
+        """Close the current file, rename it with a UTC timestamp and start a new one."""
+        self._flush()
+        self._file.close()
+        if self._index is not None:
+            self._index.close()
+        if self._size:
+            stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S-%f")
+            rotated = self._path.with_name(f"{self._path.stem}.{stamp}{self._path.suffix}")
+            self._path.rename(rotated)
+            if self._index is not None:
+                index_path(self._path).rename(index_path(rotated))
+            if self._compress:
+                if self._compressor is None:
+                    self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yaplogger-compress")
+                self._pending = [future for future in self._pending if not future.done()]
+                self._pending.append(self._compressor.submit(self._gzip, rotated))
+
+        self._file = self._path.open("ab", buffering=0)
+        self._size = 0
+        if self._index is not None:
+            self._index = IndexWriter(index_path(self._path))
+        if self._rotation_interval:
+            self._rotate_at = time.monotonic() + self._rotation_interval
+
+    def drain(self) -> None:
+        """Flush the write buffer to the file and wait for pending compressions."""
+        self._flush()
+        for future in self._pending:
+            future.result()
+        self._pending.clear()
+
+    def stop(self) -> None:
+        """Flush and close the file, then wait for the compression thread to finish."""
+        if self._file.closed:
+            return
+        self._flush()
+        self._file.close()
+        if self._index is not None:
+            self._index.close()
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+        self._pending.clear()
+
+    def _flush(self) -> None:
+        """Append the buffered lines to the file in a single write, then their entries to the index."""
+        if not self._lines or self._file.closed:
+            return
+        chunk = "".join(self._lines).encode("ascii")
+        written = self._file.write(chunk)
+        start = self._file.tell() - written
+        while written < len(chunk):
+            written += self._file.write(chunk[written:])
+        self._size = start + len(chunk)
+        self._written += len(chunk)
+        self._lines.clear()
+        self._buffered = 0
+
+        if self._index is not None:
+            for process_uid, offset, timestamp, level in self._entries:
+                self._index.add(process_uid, start + offset, timestamp, level)
+            self._entries.clear()
+            self._index.flush()
+
+    def _flush_before_fork(self) -> None:
+        """Flush the buffer, so the forked child does not inherit pending lines."""
+        self._flush()
+
+    def _reset_after_fork(self) -> None:
+        """Reopen the file and its index, and forget the compression thread, which does not exist in the child."""
+        if not self._file.closed:
+            self._file.close()
+            self._file = self._path.open("ab", buffering=0)
+            if self._index is not None:
+                self._index.reopen()
+        self._compressor = None
+        self._pending = []
+
+    @staticmethod
+    def _gzip(path: Path) -> None:
+        """Compress a rotated segment next to itself and remove the original."""
+        with path.open("rb") as source, gzip.open(path.with_name(path.name + ".gz"), "wb") as target:
+            shutil.copyfileobj(source, target)
+        path.unlink()
+        index_path(path).unlink(missing_ok=True)
+
+
+def _flush_sinks_before_fork() -> None:
+    """Flush every live NDJSON sink before the process forks."""
+    for sink in list(_LIVE_SINKS):
+        sink._flush_before_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def _reset_sinks_after_fork() -> None:
+    """Reset every live NDJSON sink in a forked child."""
+    for sink in list(_LIVE_SINKS):
+        sink._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(before=_flush_sinks_before_fork, after_in_child=_reset_sinks_after_fork)
@@ -0,0 +1,534 @@
+# whoami::./yaplogger/sinks/network.py
+"""Batched sink shipping records to a remote collector over pooled connections, with an on-disk spool."""
+
+import atexit
+import http.client
+import os
+import random
+import socket
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import UTC
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from yaplogger.constants import Constants
+from yaplogger.sinks.ndjson import NDJSONSerializer
+from yaplogger.utils import NetworkProtocol, SeverityLevel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SPOOL_SUFFIX: str = ".batch"
+
+_SYSLOG_FACILITY: int = 1  # user-level messages
+_SYSLOG_SEVERITIES: dict[int, int] = {
+    SeverityLevel.TRACE: 7,
+    SeverityLevel.DEBUG: 7,
+    SeverityLevel.INFO: 6,
+    SeverityLevel.SUCCESS: 5,
+    SeverityLevel.WARNING: 4,
+    SeverityLevel.ERROR: 3,
+    SeverityLevel.CRITICAL: 2,
+}
+_LIVE_SINKS: "weakref.WeakSet[NetworkSink]" = weakref.WeakSet()
+
+
+def _syslog_token(value: Any, max_length: int) -> str:  # noqa: ANN401
+    """A syslog header field: printable ASCII without spaces, truncated, or the ``-`` nil value when empty."""
+    text = "".join(character for character in str(value or "") if "!" <= character <= "~")
+    return text[:max_length] or "-"
+
+
+class SyslogSerializer:
+    """Renders loguru records as RFC 5424 syslog messages.
+
+    The priority combines the user-level facility with the severity matching the record level, the app-name is
+    the process name and the procid is the process UID. The message is the record message followed by its extra
+    value and exception message, when set. Structured data is not used.
+
+    The fragment rendered from the process fields is cached together with the fields it was rendered from, as a
+    single tuple, so sender threads sharing the serializer never read the fragment of another process.
+    """
+
+    def __init__(self, hostname: str | None = None) -> None:
+        """Syslog serializer init method.
+
+        Args:
+            hostname (str | None): The hostname written in every message. Defaults to this machine's name.
+        """
+        self._hostname = _syslog_token(hostname or socket.gethostname(), 255)
+        self._process: tuple[tuple[Any, Any], str] | None = None
+
+    def serialize(self, record: Any) -> bytes:  # noqa: ANN401
+        """Render a loguru record as a syslog message, without framing."""
+        extra = record["extra"]
+        process_key = (extra.get(Constants.PROCESS_NAME_KEY), extra.get(Constants.PROCESS_UID_KEY))
+        process = self._process
+        if process is None or process[0] != process_key:
+            process = self._process = (
+                process_key,
+                f"{_syslog_token(process_key[0], 48)} {_syslog_token(process_key[1], 128)} - -",
+            )
+
+        severity = _SYSLOG_SEVERITIES.get(record["level"].no, 6)
+        text = " ".join(
+            part
+            for part in (record["message"], str(extra.get("extra_value", "")), str(extra.get("exception_message", "")))
+            if part
+        )
+        timestamp = record["time"].astimezone(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+        header = f"<{_SYSLOG_FACILITY * 8 + severity}>1 {timestamp} {self._hostname} {process[1]}"
+        return f"{header} {text}".encode() if text else header.encode()
+
+
+class DiskSpool:
+    """Bounded directory of batches that could not be delivered, replayed oldest first.
+
+    Each batch is stored as its own file, named after a sequence number, so a batch is removed only once it has
+    been delivered, and the files left behind by a previous process are picked up and replayed. Batches that would
+    grow the spool beyond its size are refused.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 64 << 20) -> None:
+        """Disk spool init method.
+
+        Args:
+            directory (str | Path): The directory batches are stored in, created when missing.
+            max_bytes (int): Maximum total size, in bytes, of the stored batches.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        files = sorted(self._directory.glob(f"*{SPOOL_SUFFIX}"), key=lambda path: int(path.stem))
+        self._files: deque[Path] = deque(files)
+        self._size = sum(path.stat().st_size for path in files)
+        self._sequence = int(files[-1].stem) + 1 if files else 0
+
+    def __len__(self) -> int:
+        """Number of stored batches."""
+        return len(self._files)
+
+    @property
+    def size(self) -> int:
+        """Total size, in bytes, of the stored batches."""
+        return self._size
+
+    def append(self, payload: bytes) -> bool:
+        """Store a batch, returning False when it does not fit in the spool."""
+        with self._lock:
+            if self._size + len(payload) > self._max_bytes:
+                return False
+            path = self._directory / f"{self._sequence:012d}{SPOOL_SUFFIX}"
+            self._sequence += 1
+            self._size += len(payload)
+
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(payload)
+        temporary.replace(path)
+        with self._lock:
+            self._files.append(path)
+        return True
+
+    def take(self) -> tuple[Path, bytes] | None:
+        """Remove the oldest batch from the replay queue, None when the spool is empty.
+
+        The batch file stays on disk until ``release`` is called with ``delivered`` set.
+        """
+        with self._lock:
+            if not self._files:
+                return None
+            path = self._files.popleft()
+        return path, path.read_bytes()
+
+    def release(self, path: Path, *, delivered: bool) -> None:
+        """Remove a delivered batch, or put an undelivered one back at the head of the replay queue."""
+        with self._lock:
+            if not delivered:
+                self._files.appendleft(path)
+                return
+            self._size -= path.stat().st_size
+        path.unlink()
+
+
+class _TCPTransport:
+    """A persistent TCP connection, opened on first use and reopened after a failure.
+
+    TCP has no acknowledgements, so a batch written to a connection the collector has just closed may be lost.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self._address = (host, port)
+        self._timeout = timeout
+        self._socket: socket.socket | None = None
+
+    def send(self, payload: bytes) -> None:
+        if self._socket is None:
+            self._socket = socket.create_connection(self._address, timeout=self._timeout)
+        self._socket.sendall(payload)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+class _HTTPTransport:
+    """A persistent HTTP connection posting each batch, which is delivered once the collector answers 2xx."""
+
+    def __init__(self, url: str, timeout: float, content_type: str) -> None:
+        parts = urlsplit(url)
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._timeout = timeout
+        self._headers = {"Content-Type": content_type}
+        self._connection: http.client.HTTPConnection | None = None
+
+    def send(self, payload: bytes) -> None:
+        if self._connection is None:
+            self._connection = self._connection_class(self._host, self._port, timeout=self._timeout)
+        self._connection.request("POST", self._path, body=payload, headers=self._headers)
+        response = self._connection.getresponse()
+        response.read()
+        if not 200 <= response.status < 300:  # noqa: PLR2004
+            msg = f"Collector answered {response.status} {response.reason}."
+            raise OSError(msg)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class NetworkSink:
+    """Ships records to a remote collector in batches, from a pool of sender threads.
+
+    Loguru hands every record to ``write``, which only appends it to a bounded queue; when the queue is full, the
+    oldest record is dropped. Each sender thread owns one persistent connection. It wakes up when ``batch_size``
+    records are queued or ``flush_interval`` has elapsed, encodes the queued records and sends them in payloads of
+    at most about ``batch_bytes`` bytes, so encoding is not paid by the logging thread either.
+
+    The URL selects the transport: ``tcp://host:port`` streams the payloads over a socket, while
+    ``http://host:port/path`` and ``https://...`` POST each payload and wait for a 2xx answer. Records are encoded
+    as NDJSON lines, or as RFC 5424 syslog messages, octet-counted over TCP and one per line over HTTP.
+
+    A failed payload is retried with an exponential backoff with jitter. Once ``max_retries`` retries have failed,
+    the collector is considered down: the payload is stored in the disk spool, or dropped when there is none or it
+    is full, and the following payloads go to the spool without being sent. The oldest spooled payload is then
+    sent again after each backoff delay, and once the collector accepts it, the spool is replayed, oldest first.
+
+    With a single connection, payloads reach the collector in the order their records were written. With more, the
+    sender threads send their batches concurrently, so batches may arrive out of order, and replayed payloads may
+    interleave with newer ones; the records of a payload always keep their order.
+
+    The queue is sent when the sink is stopped, which loguru does when the handler is removed, and at the latest on
+    interpreter exit; payloads that cannot be delivered by then stay in the spool. In a forked child, the records
+    queued by the parent are discarded, and new sender threads are started with their own connections.
+
+    Attributes:
+    ----------
+    dropped : int
+        Number of records discarded because the queue was full, or because they could not be delivered nor spooled.
+    queue_depth : int
+        Number of records waiting to be sent.
+    bytes_written : int
+        Number of bytes delivered to the collector.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        *,
+        protocol: NetworkProtocol = NetworkProtocol.JSON_LINES,
+        capacity: int = 100_000,
+        batch_size: int = 500,
+        batch_bytes: int = 1 << 20,
+        flush_interval: float = 0.5,
+        connections: int = 1,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 30.0,
+        timeout: float = 5.0,
+        spool_path: str | Path | None = None,
+        spool_size: int = 64 << 20,
+        process_extras: Any = None,  # noqa: ANN401
+        hostname: str | None = None,
+    ) -> None:
+        """Network sink init method.
+
+        Args:
+            url (str): The collector, as ``tcp://host:port``, ``http://host:port/path`` or ``https://...``.
+            protocol (NetworkProtocol): How records are encoded.
+            capacity (int): Maximum number of records waiting in the queue.
+            batch_size (int): Number of queued records that wakes a sender thread up, and most records per payload.
+            batch_bytes (int): Size, in bytes, above which a payload is sent without adding more records.
+            flush_interval (float): Maximum time, in seconds, a record waits in the queue while the collector is up.
+            connections (int): Number of sender threads, each with its own connection. Batches may arrive out of
+                order when above 1.
+            max_retries (int): Number of retries of a failed payload before the collector is considered down.
+            backoff_base (float): Delay, in seconds, before the first retry, doubled on every retry.
+            backoff_max (float): Longest delay, in seconds, between two attempts.
+            timeout (float): Connection and send timeout, in seconds.
+            spool_path (str | Path | None): Directory undeliverable payloads are stored in. Dropped when None.
+            spool_size (int): Maximum size, in bytes, of the spool.
+            process_extras (Any): Extras written with every JSON line that does not carry its own.
+            hostname (str | None): Hostname of the syslog messages. Defaults to this machine's name.
+
+        Raises:
+            ValueError: If the URL scheme is not supported, or a size or count is not positive.
+        """
+        if capacity < 1 or batch_size < 1 or batch_bytes < 1 or connections < 1:
+            msg = "capacity, batch_size, batch_bytes and connections must be positive."
+            raise ValueError(msg)
+
+        parts = urlsplit(url)
+        if parts.scheme == "tcp":
+            if parts.hostname is None or parts.port is None:
+                msg = f"A TCP collector URL needs a host and a port: {url}."
+                raise ValueError(msg)
+            host, port = parts.hostname, parts.port
+            self._new_transport: Callable[[], _TCPTransport | _HTTPTransport] = lambda: _TCPTransport(
+                host,
+                port,
+                timeout,
+            )
+        elif parts.scheme in {"http", "https"}:
+            content_type = "application/x-ndjson" if protocol is NetworkProtocol.JSON_LINES else "text/plain"
+            self._new_transport = lambda: _HTTPTransport(url, timeout, content_type)
+        else:
+            msg = f"Unsupported collector URL scheme: {parts.scheme!r}."
+            raise ValueError(msg)
+
+        if protocol is NetworkProtocol.JSON_LINES:
+            serializer = NDJSONSerializer(process_extras)
+            self._encode: Callable[[Any], bytes] = lambda record: serializer.serialize(record).encode("ascii")
+        elif parts.scheme == "tcp":
+            syslog = SyslogSerializer(hostname)
+            self._encode = lambda record: b"%d %b" % (len(message := syslog.serialize(record)), message)
+        else:
+            syslog = SyslogSerializer(hostname)
+            self._encode = lambda record: syslog.serialize(record) + b"\n"
+
+        self._url = url
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._flush_interval = flush_interval
+        self._connections = connections
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._spool = DiskSpool(spool_path, spool_size) if spool_path is not None else None
+
+        self._queue: deque[Any] = deque()
+        self._dropped = 0
+        self._sent = 0
+        self._in_flight = 0
+        self._failures = 0
+        self._next_attempt = 0.0
+        self._closed = False
+
+        self._start_senders()
+        _LIVE_SINKS.add(self)
+        atexit.register(self.stop)
+
+    @property
+    def dropped(self) -> int:
+        """Number of records discarded because the queue was full, or because they could not be delivered."""
+        return self._dropped
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of records waiting to be sent."""
+        return len(self._queue)
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes delivered to the collector."""
+        return self._sent
+
+    @property
+    def spool(self) -> DiskSpool | None:
+        """The disk spool, None when undeliverable payloads are dropped."""
+        return self._spool
+
+    def write(self, message: str) -> None:
+        """Queue the record carried by a loguru message."""
+        record: Any = getattr(message, "record", None)
+        if record is None:
+            return
+
+        with self._lock:
+            if self._closed:
+                self._dropped += 1
+                return
+            if len(self._queue) >= self._capacity:
+                self._queue.popleft()
+                self._dropped += 1
+            self._queue.append(record)
+            if len(self._queue) >= self._batch_size:
+                self._not_empty.notify()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued record has been sent or spooled.
+
+        Args:
+            timeout (float | None): Maximum time to wait, in seconds. Waits indefinitely when None.
+
+        Returns:
+            bool: True when the queue was drained, False when the timeout expired first.
+        """
+        with self._lock:
+            self._not_empty.notify_all()
+            return self._idle.wait_for(lambda: not (self._queue or self._in_flight), timeout)
+
+    def stop(self) -> None:
+        """Stop the sender threads after sending every queued record. Calling it again is a no-op."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        atexit.unregister(self.stop)
+
+    def _start_senders(self) -> None:
+        """Create the synchronization primitives and start the sender threads."""
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._stopping = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"yaplogger-network-sink-{number}", daemon=True)
+            for number in range(self._connections)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _reset_after_fork(self) -> None:
+        """Make the sink usable in a forked child, where the locks may be held and the sender threads are gone."""
+        self._queue.clear()
+        self._in_flight = 0
+        if not self._closed:
+            self._start_senders()
+
+    def _take_batch(self) -> list[Any]:
+        """Remove up to one batch of records from the queue."""
+        queue = self._queue
+        return [queue.popleft() for _ in range(min(self._batch_size, len(queue)))]
+
+    def _run(self) -> None:
+        """Sender thread loop: wait for a batch or the flush interval, then send what is queued."""
+        transport = self._new_transport()
+        try:
+            while True:
+                with self._lock:
+                    if len(self._queue) < self._batch_size and not self._closed:
+                        self._not_empty.wait(self._flush_interval)
+
+                    batch = self._take_batch()
+                    if not batch:
+                        self._idle.notify_all()
+                        if self._closed:
+                            return
+                        if not self._replay_due():
+                            continue
+                    self._in_flight += 1
+
+                try:
+                    for payload, count in self._payloads(batch):
+                        self._deliver(transport, payload, count)
+                    if self._replay_due():
+                        self._replay(transport)
+                finally:
+                    with self._lock:
+                        self._in_flight -= 1
+                        if not (self._queue or self._in_flight):
+                            self._idle.notify_all()
+        finally:
+            transport.close()
+
+    def _payloads(self, batch: list[Any]) -> list[tuple[bytes, int]]:
+        """Encode a batch into payloads of about ``batch_bytes`` bytes, each with its number of records."""
+        payloads: list[tuple[bytes, int]] = []
+        chunks: list[bytes] = []
+        size = 0
+        for record in batch:
+            chunk = self._encode(record)
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self._batch_bytes:
+                payloads.append((b"".join(chunks), len(chunks)))
+                chunks, size = [], 0
+        if chunks:
+            payloads.append((b"".join(chunks), len(chunks)))
+        return payloads
+
+    def _deliver(self, transport: "_TCPTransport | _HTTPTransport", payload: bytes, count: int) -> None:
+        """Send a payload with retries, spooling or dropping it once the collector is considered down."""
+        if not self._failures or self._spool is None:
+            for attempt in range(self._max_retries + 1):
+                if attempt and self._stopping.wait(self._backoff(attempt - 1)):
+                    break
+                if self._send(transport, payload):
+                    return
+
+        if self._spool is None or not self._spool.append(payload):
+            with self._lock:
+                self._dropped += count
+
+    def _replay_due(self) -> bool:
+        """Whether spooled payloads are waiting and the backoff since the last failure has elapsed."""
+        return bool(self._spool) and time.monotonic() >= self._next_attempt
+
+    def _replay(self, transport: "_TCPTransport | _HTTPTransport") -> None:
+        """Send the spooled payloads, oldest first, until the spool is empty or a payload fails."""
+        spool = self._spool
+        while spool is not None and not self._stopping.is_set():
+            entry = spool.take()
+            if entry is None:
+                return
+            path, payload = entry
+            delivered = self._send(transport, payload)
+            spool.release(path, delivered=delivered)
+            if not delivered:
+                return
+
+    def _send(self, transport: "_TCPTransport | _HTTPTransport", payload: bytes) -> bool:
+        """Attempt to send a payload once, tracking consecutive failures and reopening the connection on error."""
+        try:
+            transport.send(payload)
+        except (OSError, http.client.HTTPException):
+            transport.close()
+            with self._lock:
+                self._failures += 1
+                self._next_attempt = time.monotonic() + self._backoff(self._failures - 1)
+            return False
+
+        with self._lock:
+            self._failures = 0
+            self._sent += len(payload)
+        return True
+
+    def _backoff(self, retry: int) -> float:
+        """Delay before a retry: exponential in the retry number, capped, with full jitter."""
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** min(retry, 32)))  # noqa: S311
+
+
+def _reset_sinks_after_fork() -> None:
+    """Reset every live network sink in a forked child."""
+    for sink in list(_LIVE_SINKS):
+        sink._reset_after_fork()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+os.register_at_fork(after_in_child=_reset_sinks_after_fork)
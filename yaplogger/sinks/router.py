@@ -0,0 +1,168 @@
+# whoami::./yaplogger/sinks/router.py
+"""Routing of records to several sinks, each with its own level, format and filter, through a dispatch table."""
+
+import sys
+import threading
+import traceback
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, NamedTuple
+
+from yaplogger.formatter import CompiledFormatter
+from yaplogger.utils import SeverityLevel
+
+type _Target = tuple[str, Callable[[Any], None], Callable[[Any], bool] | None]
+
+
+class SinkRoute(NamedTuple):
+    """Declares a destination of the records and which records it receives.
+
+    Attributes:
+    ----------
+    sink : Any
+        An object with a ``write`` method, such as a text stream or one of YapLogger's sinks.
+    level : SeverityLevel
+        Minimum severity level routed to the sink.
+    fmt : str | None
+        A loguru format, markup included, rendered by ``CompiledFormatter`` and written as text. When None, the
+        sink receives the loguru message itself, which carries the record, as sinks added by ``add_sink`` do.
+    colorize : bool
+        Whether the markup of ``fmt`` is translated into ANSI codes or stripped.
+    match : Mapping[str, Any] | None
+        Record fields, such as ``process_name`` or any key bound to the record, and the values they must equal.
+    predicate : Callable[[Any], bool] | None
+        Receives the loguru record, which is routed to the sink only when it returns True.
+    name : str | None
+        Name of the route in error reports. Defaults to the sink's class name.
+    """
+
+    sink: Any
+    level: SeverityLevel = SeverityLevel.INFO
+    fmt: str | None = None
+    colorize: bool = False
+    match: Mapping[str, Any] | None = None
+    predicate: Callable[[Any], bool] | None = None
+    name: str | None = None
+
+
+def _writer(route: SinkRoute) -> Callable[[Any], None]:
+    """Build the function handing a loguru message over to the sink of a route."""
+    write: Callable[[str], Any] = route.sink.write
+    if route.fmt is None:
+        return write
+
+    render = CompiledFormatter(route.fmt, colorize=route.colorize).format
+    flush: Callable[[], Any] | None = getattr(route.sink, "flush", None)
+    if flush is None:
+        return lambda message: write(render(message.record))
+
+    def write_and_flush(message: Any) -> None:  # noqa: ANN401
+        write(render(message.record))
+        flush()
+
+    return write_and_flush
+
+
+def _filter(route: SinkRoute) -> Callable[[Any], bool] | None:
+    """Combine the field match and the predicate of a route, None when every record is accepted."""
+    fields = tuple((route.match or {}).items())
+    predicate = route.predicate
+    if not fields:
+        return predicate
+
+    def accepts(record: Any) -> bool:  # noqa: ANN401
+        extra = record["extra"]
+        return all(extra.get(key) == value for key, value in fields) and (predicate is None or predicate(record))
+
+    return accepts
+
+
+class SinkRouter:
+    """Dispatches each record to the routes that want it, through a table precomputed per level.
+
+    The router is added to loguru as a single handler. For each level, the table holds the routes whose minimum
+    level it reaches, with their writer and filter already built, so dispatching a record is a single lookup
+    followed by a loop over the sinks that accept its level; the filter of a route, if any, is only evaluated for
+    those. Levels that are not ``SeverityLevel`` members are resolved on their first record and cached.
+
+    ``update`` builds the table of the new routes, then swaps it in while no record is being dispatched, so a
+    record is always dispatched by one table or the other. The sinks of the previous routes that are not part of
+    the new ones are stopped once the swap is done, so every record they accepted has been written to them.
+
+    An exception raised by a sink is reported to stderr, and does not prevent the following sinks from receiving
+    the record.
+    """
+
+    def __init__(self, routes: Iterable[SinkRoute]) -> None:
+        """Sink router init method.
+
+        Args:
+            routes (Iterable[SinkRoute]): The destinations of the records.
+        """
+        self._lock = threading.Lock()
+        self._routes: tuple[SinkRoute, ...] = ()
+        self._targets: tuple[tuple[int, _Target], ...] = ()
+        self._table: dict[int, tuple[_Target, ...]] = {}
+        self.update(routes)
+
+    @property
+    def routes(self) -> tuple[SinkRoute, ...]:
+        """The current routes."""
+        return self._routes
+
+    @property
+    def min_level(self) -> int:
+        """The lowest level routed to at least one sink, above CRITICAL when there is no route."""
+        return min((route.level for route in self._routes), default=SeverityLevel.CRITICAL + 1)
+
+    def update(self, routes: Iterable[SinkRoute]) -> None:
+        """Replace the routes, stopping the sinks that are no longer routed to."""
+        routes = tuple(routes)
+        targets = tuple(
+            (int(route.level), (route.name or type(route.sink).__name__, _writer(route), _filter(route)))
+            for route in routes
+        )
+        table = {level.value: self._select(targets, level.value) for level in SeverityLevel}
+        with self._lock:
+            previous = self._routes
+            self._routes, self._targets, self._table = routes, targets, table
+
+        kept = {id(route.sink) for route in routes}
+        self._stop(route.sink for route in previous if id(route.sink) not in kept)
+
+    def write(self, message: Any) -> None:  # noqa: ANN401
+        """Dispatch the record carried by a loguru message to the routes accepting it."""
+        record = message.record
+        level = record["level"].no
+        with self._lock:
+            targets = self._table.get(level)
+            if targets is None:
+                targets = self._table[level] = self._select(self._targets, level)
+            for name, write, accepts in targets:
+                if accepts is not None and not accepts(record):
+                    continue
+                try:
+                    write(message)
+                except Exception:  # noqa: BLE001
+                    sys.stderr.write(f"--- YapLogger route to {name} failed to write a record ---\n")
+                    traceback.print_exc(file=sys.stderr)
+
+    def stop(self) -> None:
+        """Stop the sinks of every route."""
+        with self._lock:
+            routes, self._routes, self._targets, self._table = self._routes, (), (), {}
+        self._stop(route.sink for route in routes)
+
+    @staticmethod
+    def _select(targets: tuple[tuple[int, _Target], ...], level: int) -> tuple[_Target, ...]:
+        """The targets of the routes accepting a level."""
+        return tuple(target for min_level, target in targets if level >= min_level)
+
+    @staticmethod
+    def _stop(sinks: Iterable[Any]) -> None:
+        """Stop the sinks that can be stopped, once each."""
+        stopped: set[int] = set()
+        for sink in sinks:
+            stop = getattr(sink, "stop", None)
+            if callable(stop) and id(sink) not in stopped:
+                stopped.add(id(sink))
+                stop()
@@ -0,0 +1,35 @@
+# whoami::./yaplogger/sinks/stream.py
+"""Synchronous sink rendering records with a compiled formatter."""
+
+from collections.abc import Callable
+from typing import Any, TextIO
+
+
+class TextStreamSink:
+    """Writes each record to a stream, rendered from the loguru record by the given render function.
+
+    Loguru is expected to format the record with a bare ``{message}`` format only; the line written to the
+    stream is produced by ``render``, usually ``CompiledFormatter.format``. The size of the rendered lines is not
+    counted, to keep the write path short, so ``bytes_written`` is always None.
+    """
+
+    bytes_written: int | None = None
+
+    def __init__(self, stream: TextIO, render: Callable[[Any], str]) -> None:
+        """Text stream sink init method.
+
+        Args:
+            stream (TextIO): The stream records are written to.
+            render (Callable[[Any], str]): Renders a loguru record as a line of text.
+        """
+        self._stream = stream
+        self._render = render
+
+    def write(self, message: str) -> None:
+        """Render the record carried by a loguru message and write it to the stream."""
+        record: Any = getattr(message, "record", None)
+        self._stream.write(self._render(record) if record is not None else message)
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self._stream.flush()
@@ -0,0 +1,164 @@
+# whoami::./yaplogger/steps.py
+"""Timing of workflow steps: nested step ids, start/end records and per-step aggregate statistics."""
+
+import random
+import threading
+import time
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import TYPE_CHECKING, NamedTuple, Self
+
+from yaplogger.utils import SeverityLevel
+
+if TYPE_CHECKING:
+    from yaplogger.emitter import LogEmitter
+
+STEP_SEPARATOR: str = "/"
+
+_STEP_PATH: ContextVar[str] = ContextVar("yaplogger_step_path", default="")
+
+
+def current_step() -> str:
+    """Id of the innermost step running in the current thread or task, empty outside of any step."""
+    return _STEP_PATH.get()
+
+
+class StepSummary(NamedTuple):
+    """Aggregate durations of a step, in milliseconds."""
+
+    calls: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+class _StepEntry:
+    """Running aggregates of one step."""
+
+    __slots__ = ("count", "maximum", "samples", "total")
+
+    def __init__(self, duration_ns: int) -> None:
+        self.count = 1
+        self.total = duration_ns
+        self.maximum = duration_ns
+        self.samples = [duration_ns]
+
+
+class StepStatistics:
+    """Collects the durations of every step, keyed by step id.
+
+    Count, total and maximum are exact. Percentiles are computed from a uniform reservoir sample of bounded size
+    per step, so memory does not grow with the number of executions of a step.
+    """
+
+    def __init__(self, reservoir_size: int = 1024) -> None:
+        """Step statistics init method.
+
+        Args:
+            reservoir_size (int): Maximum number of durations kept per step to compute the percentiles.
+        """
+        self._reservoir_size = reservoir_size
+        self._lock = threading.Lock()
+        self._steps: dict[str, _StepEntry] = {}
+
+    def record(self, step_id: str, duration_ns: int) -> None:
+        """Add a step duration."""
+        with self._lock:
+            entry = self._steps.get(step_id)
+            if entry is None:
+                self._steps[step_id] = _StepEntry(duration_ns)
+                return
+
+            entry.count += 1
+            entry.total += duration_ns
+            entry.maximum = max(entry.maximum, duration_ns)
+            if len(entry.samples) < self._reservoir_size:
+                entry.samples.append(duration_ns)
+            elif (slot := random.randrange(entry.count)) < self._reservoir_size:  # noqa: S311
+                entry.samples[slot] = duration_ns
+
+    def summary(self) -> dict[str, StepSummary]:
+        """Aggregate durations of every step recorded so far, in order of first execution."""
+        with self._lock:
+            snapshot = [
+                (step_id, entry.count, entry.total, entry.maximum, list(entry.samples))
+                for step_id, entry in self._steps.items()
+            ]
+
+        summaries: dict[str, StepSummary] = {}
+        for step_id, count, total, maximum, samples in snapshot:
+            samples.sort()
+            summaries[step_id] = StepSummary(
+                calls=count,
+                total_ms=total / 1e6,
+                p50_ms=samples[(len(samples) - 1) // 2] / 1e6,
+                p95_ms=samples[round(0.95 * (len(samples) - 1))] / 1e6,
+                max_ms=maximum / 1e6,
+            )
+        return summaries
+
+    def clear(self) -> None:
+        """Forget every recorded duration."""
+        with self._lock:
+            self._steps.clear()
+
+
+class StepTimer:
+    """Context manager timing one execution of a step with ``perf_counter_ns``.
+
+    Entering the step logs a start record and makes it the parent of the steps entered within it, whose ids are
+    prefixed with this step id. Leaving it logs an end record with the duration, and adds the duration to the
+    statistics. The duration is recorded whether or not the records are filtered out by the level. The step path
+    is kept in a context variable, so threads and asyncio tasks each see their own.
+    """
+
+    __slots__ = ("_emitter", "_level", "_name", "_start", "_statistics", "_step_id", "_token")
+
+    def __init__(self, emitter: "LogEmitter", statistics: StepStatistics, name: str, level: SeverityLevel) -> None:
+        """Step timer init method.
+
+        Args:
+            emitter (LogEmitter): The logger writing the start and end records.
+            statistics (StepStatistics): Where the step duration is recorded.
+            name (str): The step name, unique among its sibling steps.
+            level (SeverityLevel): The severity level of the start and end records.
+        """
+        self._emitter = emitter
+        self._statistics = statistics
+        self._name = name
+        self._level = level
+        self._step_id = ""
+        self._start = 0
+        self._token: Token[str] | None = None
+
+    def __enter__(self) -> Self:
+        """Log the step start and start the clock."""
+        parent = _STEP_PATH.get()
+        self._step_id = f"{parent}{STEP_SEPARATOR}{self._name}" if parent else self._name
+        self._token = _STEP_PATH.set(self._step_id)
+        self._emitter.log(self._level, "Step started", extra_value=self._step_id, step=self._step_id)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the clock, record the duration and log the step end."""
+        duration_ns = time.perf_counter_ns() - self._start
+        if self._token is not None:
+            _STEP_PATH.reset(self._token)
+        self._statistics.record(self._step_id, duration_ns)
+
+        if not self._emitter.is_enabled(self._level):
+            return
+        outcome = "Step failed" if exc_type is not None else "Step finished"
+        self._emitter.log(
+            self._level,
+            outcome,
+            extra_value=f"{self._step_id} in {duration_ns / 1e6:.3f} ms",
+            step=self._step_id,
+        )
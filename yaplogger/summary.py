@@ -0,0 +1,171 @@
+# whoami::./yaplogger/summary.py
+"""End-of-execution summary: records per level, noisiest message templates and wall time."""
+
+import heapq
+import sys
+import threading
+import time
+from typing import Any, NamedTuple
+
+from yaplogger.utils import SeverityLevel
+
+
+class TemplateCount(NamedTuple):
+    """Number of records emitted with a message template at a level.
+
+    ``records`` may overestimate the exact number by at most ``error``, the count of the template it evicted.
+    """
+
+    level: str
+    template: str
+    records: int
+    error: int
+
+
+class ExecutionSummary(NamedTuple):
+    """Aggregates of the records emitted by a logger since it started."""
+
+    process_uid: str
+    wall_time_s: float
+    records: int
+    levels: dict[str, int]
+    templates: list[TemplateCount]
+    evicted: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """The summary as plain values, JSON-encoded in the ``extra_value`` of the summary record."""
+        return {
+            "process_uid": self.process_uid,
+            "wall_time_s": round(self.wall_time_s, 6),
+            "records": self.records,
+            "levels": self.levels,
+            "templates": [template._asdict() for template in self.templates],
+            "evicted": self.evicted,
+        }
+
+
+class _StatisticsShard:
+    """Level counts and Space-Saving template counters of the records emitted by a single thread."""
+
+    __slots__ = ("evicted", "heap", "levels", "templates")
+
+    def __init__(self) -> None:
+        """Statistics shard init method."""
+        self.levels: dict[SeverityLevel, int] = {}
+        self.templates: dict[tuple[SeverityLevel, str], list[int]] = {}  # Key -> [count, error]
+        self.heap: list[tuple[int, tuple[SeverityLevel, str]]] = []  # One (count, key) per key, count possibly stale
+        self.evicted = 0
+
+    def floor(self, top_k: int) -> int:
+        """Most records a template untracked by this shard may have, the lowest tracked count once it is full."""
+        if len(self.templates) < top_k:
+            return 0
+        return min(counter[0] for counter in list(self.templates.values()))
+
+
+class RecordStatistics:
+    """Counts the emitted records per level, and per message template and level.
+
+    Level counts are exact. Templates are counted with the Space-Saving algorithm, so memory stays bounded whatever
+    the number of distinct messages: at most ``top_k`` templates are tracked, and a new one replaces the least
+    frequent, inheriting its count as a possible overestimation. Every template that occurs more than once in
+    ``top_k`` records of a thread is guaranteed to be tracked. The least frequent template is found through a
+    min-heap whose entries are only brought up to date when an eviction reaches them, so counting a tracked template
+    does not touch the heap. Keys are interned, so the tracked templates share the strings of the calling code
+    instead of holding copies.
+
+    Every thread counts in its own shard, found through a thread local, so recording takes no lock; the lock is
+    only taken when a thread records its first record and when a summary is taken. The summary merges the shards:
+    a template a shard does not track may have occurred up to that shard's lowest tracked count there, which is
+    added to both its count and its error, so ``records`` remains an overestimate by at most ``error``. Summaries
+    read the shards while they may be updated, so a summary may miss the records emitted while it is taken.
+    """
+
+    def __init__(self, process_uid: str, top_k: int = 32, started_ns: int | None = None) -> None:
+        """Record statistics init method.
+
+        Args:
+            process_uid (str): The process UID of the logger the records are counted for.
+            top_k (int): Maximum number of message templates tracked.
+            started_ns (int | None): ``perf_counter_ns`` value the wall time is measured from. Defaults to now.
+        """
+        if top_k < 1:
+            msg = "top_k must be positive."
+            raise ValueError(msg)
+
+        self._process_uid = process_uid
+        self._top_k = top_k
+        self._lock = threading.Lock()
+        self._started_ns = started_ns if started_ns is not None else time.perf_counter_ns()
+        self._local = threading.local()
+        self._shards: list[_StatisticsShard] = []
+
+    def record(self, level: SeverityLevel, template: str) -> None:
+        """Count a record emitted with the given message template."""
+        shard: _StatisticsShard | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _StatisticsShard()
+            with self._lock:
+                self._shards.append(shard)
+
+        levels = shard.levels
+        levels[level] = levels.get(level, 0) + 1
+        templates = shard.templates
+        counter = templates.get((level, template))
+        if counter is not None:
+            counter[0] += 1
+            return
+
+        key = (level, sys.intern(template) if type(template) is str else template)
+        heap = shard.heap
+        if len(templates) < self._top_k:
+            templates[key] = [1, 0]
+            heapq.heappush(heap, (1, key))
+            return
+
+        # Stale entries hold a lower count than their template: refresh them until the top one is current.
+        while (current := templates[heap[0][1]][0]) != heap[0][0]:
+            heapq.heapreplace(heap, (current, heap[0][1]))
+        floor = templates.pop(heap[0][1])[0]
+        templates[key] = [floor + 1, floor]
+        heapq.heapreplace(heap, (floor + 1, key))
+        shard.evicted += 1
+
+    def summary(self) -> ExecutionSummary:
+        """Snapshot of the aggregates, merged across threads, templates sorted by decreasing count."""
+        with self._lock:
+            shards = list(self._shards)
+            wall_time_ns = time.perf_counter_ns() - self._started_ns
+
+        levels: dict[SeverityLevel, int] = {}
+        tracked: list[tuple[dict[tuple[SeverityLevel, str], tuple[int, int]], int]] = []
+        evicted = 0
+        for shard in shards:
+            for level, count in list(shard.levels.items()):
+                levels[level] = levels.get(level, 0) + count
+            counters = {key: (counter[0], counter[1]) for key, counter in list(shard.templates.items())}
+            tracked.append((counters, shard.floor(self._top_k)))
+            evicted += shard.evicted
+
+        merged: list[tuple[tuple[SeverityLevel, str], int, int]] = []
+        for key in {key for counters, _ in tracked for key in counters}:
+            count = error = 0
+            for counters, floor in tracked:
+                shard_count, shard_error = counters.get(key, (floor, floor))
+                count += shard_count
+                error += shard_error
+            merged.append((key, count, error))
+        merged.sort(key=lambda item: item[1], reverse=True)
+        evicted += max(0, len(merged) - self._top_k)
+
+        return ExecutionSummary(
+            process_uid=self._process_uid,
+            wall_time_s=wall_time_ns / 1e9,
+            records=sum(levels.values()),
+            levels={level.name: count for level, count in sorted(levels.items())},
+            templates=[
+                TemplateCount(level.name, template, count, error)
+                for (level, template), count, error in merged[: self._top_k]
+            ],
+            evicted=evicted,
+        )
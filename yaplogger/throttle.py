@@ -0,0 +1,194 @@
+# whoami::./yaplogger/throttle.py
+"""Rate limiting, sampling and collapsing of repeated records, applied before a record is rendered."""
+
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable
+from types import CodeType
+from typing import Any
+
+from yaplogger.utils import SeverityLevel, SuppressionReason
+
+type RepeatCallback = Callable[[SeverityLevel, int, Any], None]
+type CallSite = tuple[CodeType, int]
+
+
+def caller_site(depth: int) -> CallSite:
+    """Code and line running ``depth`` frames above the function calling this one."""
+    frame = sys._getframe(depth + 1)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    return frame.f_code, frame.f_lineno
+
+
+def _repeat_key(message: object) -> object:
+    """What a message is compared by when collapsing.
+
+    A deferred message is a new callable on every call, so it is compared by its code, the default values of its
+    parameters and the values it closes over.
+    """
+    code = getattr(message, "__code__", None)
+    if code is None:
+        return message
+    try:
+        closure = tuple(cell.cell_contents for cell in getattr(message, "__closure__", None) or ())
+        return code, getattr(message, "__defaults__", None), closure
+    except ValueError:  # A closure cell that is not filled yet.
+        return message
+
+
+class Throttle:
+    """Decides whether a record is emitted, before its message is rendered.
+
+    Three independent checks run in this order, each one optional:
+
+    - Sampling keeps each record of a level with the configured probability.
+    - Rate limiting gives every key a token bucket refilled at ``rate`` tokens per second, up to ``burst`` tokens;
+      a record is dropped when its bucket is empty. The key is the message template, the code of a deferred
+      message, or the calling line when ``call_site`` is set.
+    - Collapsing drops records identical to the previous one (same level, template, arguments and extra value).
+      A deferred message is identical when it has the same code, defaults and closed over values. Once a different
+      record arrives, or on ``flush``, ``on_repeat`` is called with the level, the number of
+      dropped repetitions and the template, so a single "repeated N times" record can be emitted.
+
+    The token buckets are updated without locking, so under heavy contention a few extra records may get through;
+    the collapsing state is guarded by a lock, since it is only taken when collapsing is enabled. Every suppressed
+    record is counted by reason and level.
+    """
+
+    def __init__(
+        self,
+        on_repeat: RepeatCallback,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        sampling: dict[SeverityLevel, float] | None = None,
+        collapse: bool = False,
+        call_site: bool = False,
+        max_keys: int = 10_000,
+    ) -> None:
+        """Throttle init method.
+
+        Args:
+            on_repeat (RepeatCallback): Called with the level, repetition count and template of a collapsed record.
+            rate (float | None): Records per second allowed per key. No rate limiting when None.
+            burst (float | None): Maximum tokens per bucket, i.e. records allowed at once. Defaults to ``rate``.
+            sampling (dict[SeverityLevel, float] | None): Probability, per level, that a record is kept.
+            collapse (bool): Whether consecutive identical records are collapsed.
+            call_site (bool): Key the token buckets by calling line instead of message template.
+            max_keys (int): Number of token buckets above which they are all reset, to bound memory.
+        """
+        self._on_repeat = on_repeat
+        self._rate = rate
+        self._burst = max(burst if burst is not None else rate or 1.0, 1.0)
+        self._sampling = {level: probability for level, probability in (sampling or {}).items() if probability < 1}
+        self._collapse = collapse
+        self.call_site = call_site
+        self._max_keys = max_keys
+
+        self._buckets: dict[Any, list[float]] = {}
+        self._suppressed: dict[SuppressionReason, dict[SeverityLevel, int]] = {
+            reason: dict.fromkeys(SeverityLevel, 0) for reason in SuppressionReason
+        }
+        self._collapse_lock = threading.Lock()
+        self._last: tuple[SeverityLevel, object, tuple[Any, ...], object] | None = None
+        self._last_message: object = None
+        self._repeats = 0
+
+    def admit(
+        self,
+        level: SeverityLevel,
+        message: object,
+        args: tuple[Any, ...],
+        extra_value: object,
+        call_site: CallSite | None = None,
+    ) -> bool:
+        """Tell whether a record is emitted, counting it as suppressed otherwise.
+
+        Args:
+            level (SeverityLevel): The record severity level.
+            message (object): The message template, or the callable producing the message.
+            args (tuple[Any, ...]): The template arguments.
+            extra_value (object): The record extra value.
+            call_site (CallSite | None): The line that logged the record, see ``caller_site``. Records are rate
+                limited per call site when ``call_site`` is set on the throttle.
+
+        Returns:
+            bool: Whether the record is emitted.
+        """
+        if self._sampling:
+            probability = self._sampling.get(level)
+            if probability is not None and random.random() >= probability:  # noqa: S311
+                self._suppressed[SuppressionReason.SAMPLED][level] += 1
+                return False
+
+        if self._rate is not None and not self._take_token(level, message, call_site):
+            self._suppressed[SuppressionReason.RATE_LIMITED][level] += 1
+            return False
+
+        if self._collapse:
+            return self._check_repeat((level, _repeat_key(message), args, extra_value), message)
+        return True
+
+    def flush(self) -> None:
+        """Report the repetitions of the last record, if any were collapsed."""
+        if not self._collapse:
+            return
+        with self._collapse_lock:
+            pending = self._pop_repeats()
+        if pending is not None:
+            self._on_repeat(*pending)
+
+    def suppressed_counts(self) -> dict[str, dict[str, int]]:
+        """Number of suppressed records, by reason and level name, leaving out the zero counts."""
+        return {
+            str(reason): {level.name: count for level, count in counts.items() if count}
+            for reason, counts in self._suppressed.items()
+        }
+
+    def _take_token(self, level: SeverityLevel, message: object, call_site: CallSite | None) -> bool:
+        """Take a token from the bucket of the record key, refilling it for the time elapsed."""
+        if self.call_site and call_site is not None:
+            key: Any = call_site
+        else:
+            # A deferred message is a new callable on every call, so it is keyed by its code.
+            key = (level, getattr(message, "__code__", message) if callable(message) else message)
+
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._max_keys:
+                self._buckets.clear()
+            self._buckets[key] = [self._burst - 1, now]
+            return True
+
+        tokens = min(self._burst, bucket[0] + (now - bucket[1]) * (self._rate or 0.0))
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    def _check_repeat(self, record: tuple[SeverityLevel, object, tuple[Any, ...], object], message: object) -> bool:
+        """Collapse the record if it repeats the previous one, reporting the previous repetitions otherwise."""
+        with self._collapse_lock:
+            if record == self._last:
+                self._repeats += 1
+                self._suppressed[SuppressionReason.COLLAPSED][record[0]] += 1
+                return False
+            pending = self._pop_repeats()
+            self._last = record
+            self._last_message = message
+
+        if pending is not None:
+            self._on_repeat(*pending)
+        return True
+
+    def _pop_repeats(self) -> tuple[SeverityLevel, int, Any] | None:
+        """Take the pending repetitions of the last record, with the collapse lock held."""
+        if not self._repeats or self._last is None:
+            return None
+        pending = (self._last[0], self._repeats, self._last_message)
+        self._repeats = 0
+        return pending
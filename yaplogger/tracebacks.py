@@ -0,0 +1,84 @@
+# whoami::./yaplogger/tracebacks.py
+"""Rendering of logged exceptions, cached by fingerprint so that repeated failures are rendered once."""
+
+import hashlib
+import threading
+import traceback
+from collections import OrderedDict
+
+from yaplogger.utils import ExceptionRenderMode
+
+
+class _RenderedException:
+    """Rendered text of an exception fingerprint and the number of times it was seen."""
+
+    __slots__ = ("count", "reference", "type_name")
+
+    def __init__(self, reference: str, type_name: str) -> None:
+        self.reference = reference
+        self.type_name = type_name
+        self.count = 1
+
+
+class ExceptionRenderer:
+    """Renders exceptions in full or compact mode, once per fingerprint.
+
+    The fingerprint of an exception is its type plus the location, file, line and function, of every frame of its
+    traceback, so the same failure raised again from the same place shares a fingerprint whatever its message. An
+    exception that was never raised has no traceback to tell failures apart, so its message is part of its fingerprint.
+    The first occurrence of a fingerprint is rendered and tagged with a short reference; later occurrences only produce
+    the exception type, that reference and the number of occurrences so far, which lets the full text be found in the
+    earlier record. Fingerprints are kept in an LRU cache of bounded size; an evicted fingerprint is rendered again on
+    its next occurrence.
+    """
+
+    def __init__(self, mode: ExceptionRenderMode, cache_size: int = 256) -> None:
+        """Exception renderer init method.
+
+        Args:
+            mode (ExceptionRenderMode): ``FULL`` or ``COMPACT``.
+            cache_size (int): Number of fingerprints remembered.
+        """
+        if mode is ExceptionRenderMode.MESSAGE:
+            msg = "The message mode does not render exceptions."
+            raise ValueError(msg)
+
+        self._mode = mode
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[object, ...], _RenderedException] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, exception: BaseException) -> str:
+        """Render an exception, or a reference to its first rendering when its fingerprint was already seen."""
+        fingerprint = self.fingerprint(exception)
+        with self._lock:
+            entry = self._cache.get(fingerprint)
+            if entry is not None:
+                self._cache.move_to_end(fingerprint)
+                entry.count += 1
+                return f"{entry.type_name} [{entry.reference}] seen {entry.count} times"
+
+            type_name = type(exception).__qualname__
+            reference = hashlib.blake2b(repr(fingerprint).encode(), digest_size=4).hexdigest()
+            self._cache[fingerprint] = _RenderedException(reference, type_name)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        if self._mode is ExceptionRenderMode.FULL:
+            text = "".join(traceback.format_exception(exception)).rstrip()
+            return f"[{reference}]\n{text}"
+
+        summary = traceback.extract_tb(exception.__traceback__)
+        location = f" at {summary[-1].filename}:{summary[-1].lineno} in {summary[-1].name}" if summary else ""
+        return f"{type_name}: {exception}{location} [{reference}]"
+
+    @staticmethod
+    def fingerprint(exception: BaseException) -> tuple[object, ...]:
+        """Type of the exception plus the code location of every frame of its traceback, or its message if none."""
+        if exception.__traceback__ is None:
+            return type(exception), str(exception)
+        frames = traceback.walk_tb(exception.__traceback__)
+        return (
+            type(exception),
+            *((frame.f_code.co_filename, lineno, frame.f_code.co_name) for frame, lineno in frames),
+        )
@@ -1,7 +1,27 @@
 # whoami::./yaplogger/utils/__init__.py
 """Yaplogger Utils."""
 
-from yaplogger.utils.decorators import singleton
-from yaplogger.utils.enums import LogLevel, SeverityLevel
+from yaplogger.utils.decorators import singleton, timed_step
+from yaplogger.utils.enums import (
+    ExceptionRenderMode,
+    FormatterEngine,
+    LogLevel,
+    MetricsFormat,
+    NetworkProtocol,
+    OverflowPolicy,
+    SeverityLevel,
+    SuppressionReason,
+)
 
-__all__ = ["LogLevel", "SeverityLevel", "singleton"]
+__all__ = [
+    "ExceptionRenderMode",
+    "FormatterEngine",
+    "LogLevel",
+    "MetricsFormat",
+    "NetworkProtocol",
+    "OverflowPolicy",
+    "SeverityLevel",
+    "SuppressionReason",
+    "singleton",
+    "timed_step",
+]
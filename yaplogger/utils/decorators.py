@@ -1,16 +1,30 @@
 #whoami::./yaplogger/utils/decorators.py
 """YapLogger Decorators."""
 
+import inspect
+import os
 import threading
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
+
+from yaplogger.utils.enums import SeverityLevel
 
 T = TypeVar("T")  # Type variable to maintain type hints
 P = ParamSpec("P")
 
 _lock = threading.RLock()  # lock to ensure thread safety
 
+
+def _reset_lock_after_fork() -> None:
+    """Replace the lock in a forked child, where it may have been held by a thread that no longer exists."""
+    global _lock
+    _lock = threading.RLock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
+
+
 def singleton(cls: type[T]) -> Callable[..., T]:
     """Create and maintain a single instance of an object.
 
@@ -24,9 +38,59 @@ def singleton(cls: type[T]) -> Callable[..., T]:
 
     @wraps(cls)
     def get_instance(*args: P.args, **kwargs: P.kwargs) -> T:
+        instance = instances.get(cls)  # lock-free fast path once the instance exists
+        if instance is not None:
+            return instance
         with _lock:  # acquire lock to ensure thread safety
             if cls not in instances:
                 instances[cls] = cls(*args, **kwargs)
             return instances[cls]  # pyright: ignore[reportUnknownVariableType]
 
     return get_instance
+
+
+def timed_step(
+    name: str | None = None,
+    *,
+    level: SeverityLevel = SeverityLevel.DEBUG,
+    log: Any = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Time every call of the decorated function as a workflow step.
+
+    Args:
+        name: The step name. Defaults to the function qualified name.
+        level: The severity level of the step start and end records.
+        log: The logger timing the step. Defaults to the process Log instance.
+
+    Returns:
+        A decorator running the function within ``log.step(name, level)``; coroutine functions are awaited
+        within the step.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        step_name = name or func.__qualname__
+
+        def resolve_log() -> Any:
+            if log is not None:
+                return log
+            from yaplogger.log import Log  # imported here, since yaplogger.log depends on this module
+
+            return Log(parameters=None)
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with resolve_log().step(step_name, level):
+                    return await func(*args, **kwargs)  # type: ignore[misc]
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with resolve_log().step(step_name, level):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,7 +1,7 @@
 # whoami:: ./yaplogger/utils/enums.py
 """Collection of Enum classes to be used for YapLogger."""
 
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 from typing import NamedTuple
 
 
@@ -30,3 +30,49 @@ class SeverityLevel(IntEnum):
     def as_tuple(self) -> LogLevel:
         """Retrieves the log level name and value as a NamedTuple."""
         return LogLevel(self.name, self.value)
+
+
+class OverflowPolicy(StrEnum):
+    """Policies applied by the background sink when its queue is full."""
+
+    BLOCK = "block"  # Wait for the writer thread to free space
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued record
+    DROP_DEBUG_FIRST = "drop_debug_first"  # Discard queued TRACE/DEBUG records before anything else
+    SAMPLE = "sample"  # Keep one out of every N overflowing records
+
+
+class FormatterEngine(StrEnum):
+    """Engines available to render the text sink records."""
+
+    LOGURU = "loguru"  # Loguru's own format and colorize machinery
+    COMPILED = "compiled"  # Format compiled once by YapLogger, colors only for TTY targets
+
+
+class SuppressionReason(StrEnum):
+    """Reasons a record may be suppressed by the throttle before being emitted."""
+
+    SAMPLED = "sampled"  # Dropped by the per-level sampling
+    RATE_LIMITED = "rate_limited"  # Dropped by the per-key token bucket
+    COLLAPSED = "collapsed"  # Identical to the previous record, counted in its "repeated N times" record
+
+
+class MetricsFormat(StrEnum):
+    """Formats the logging metrics can be exported in."""
+
+    PROMETHEUS = "prometheus"  # Prometheus text exposition format, for the node exporter textfile collector
+    JSON = "json"  # One JSON document with the whole snapshot
+
+
+class ExceptionRenderMode(StrEnum):
+    """How the exceptions given to ``critical`` are rendered in the ``exception_message`` field."""
+
+    FULL = "full"  # Complete traceback, chained exceptions included
+    COMPACT = "compact"  # One line: type, message and the location where it was raised
+    MESSAGE = "message"  # The exception text only, as it has always been written
+
+
+class NetworkProtocol(StrEnum):
+    """Protocols the network sink can ship records with."""
+
+    JSON_LINES = "json_lines"  # One NDJSON document per record
+    SYSLOG = "syslog"  # RFC 5424 messages, octet-counted over TCP (RFC 6587), one per line over HTTP